@@ -0,0 +1,73 @@
+"""Micro-benchmark: cost of ``import jamfpy`` and of building API clients / Tenants.
+
+Import time is measured in fresh interpreters (median of several runs) next to a bare
+``import requests``, so jamfpy's own share is visible. Construction is timed in-process with
+the token fetch stubbed out; no network is touched.
+
+Usage (from the repo root): python -m benchmarks.construct_time [constructions]
+"""
+# pylint: disable=protected-access
+import logging
+import statistics
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+FQDN = "https://bench.jamfcloud.com"
+IMPORT_RUNS = 7
+
+
+def _import_secs(module: str) -> float:
+    """Median wall time to import module in a fresh interpreter."""
+    snippet = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    runs = [
+        float(subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True, check=True).stdout)
+        for _ in range(IMPORT_RUNS)
+    ]
+    return statistics.median(runs)
+
+
+def _per_call(func, calls: int) -> float:
+    """Mean seconds per call of func after a short warm-up."""
+    for _ in range(min(calls, 50)):
+        func()
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+
+def main(calls: int = 2_000) -> None:
+    """Prints import times and per-construction costs."""
+    requests_secs = _import_secs("requests")
+    jamfpy_secs = _import_secs("jamfpy")
+    print(f"import requests   {requests_secs * 1e3:7.1f} ms")
+    print(f"import jamfpy     {jamfpy_secs * 1e3:7.1f} ms  ({(jamfpy_secs - requests_secs) * 1e3:.1f} ms own)")
+
+    import jamfpy  # pylint: disable=import-outside-toplevel
+
+    logger = logging.getLogger("jamfpy-bench")
+    logger.addHandler(logging.NullHandler())
+    auth = jamfpy.OAuth(fqdn=FQDN, client_id="id", client_secret="secret", logger=logger)
+    session = jamfpy.ClassicAPI(fqdn=FQDN, auth=auth, logger=logger)._session
+
+    def build_apis():
+        jamfpy.ClassicAPI(fqdn=FQDN, auth=auth, session=session, logger=logger)
+        jamfpy.ProAPI(fqdn=FQDN, auth=auth, session=session, logger=logger)
+
+    def build_tenant():
+        jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="id", client_secret="secret",
+                      log_level=logging.CRITICAL)
+
+    def first_endpoint_use():
+        jamfpy.ClassicAPI(fqdn=FQDN, auth=auth, session=session, logger=logger).computers.name()
+
+    print(f"Classic+Pro API   {_per_call(build_apis, calls) * 1e6:7.1f} us/construct")
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None):
+        print(f"Tenant            {_per_call(build_tenant, calls) * 1e6:7.1f} us/construct")
+    print(f"API + 1 endpoint  {_per_call(first_endpoint_use, calls) * 1e6:7.1f} us/construct")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,76 @@
+"""Micro-benchmark: per-call overhead of API.do with the network stubbed out.
+
+A real OAuth object holds a long-lived token and the session's transport adapter
+returns a canned Response, so the timing covers only what jamfpy does per request
+(auth check, header handling, prepare, logging) plus requests' own send path.
+
+Usage (from the repo root): python -m benchmarks.do_overhead [calls]
+"""
+# pylint: disable=protected-access,no-member
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+
+from requests import Request, Response, Session
+from requests.adapters import BaseAdapter
+
+from jamfpy import OAuth, ClassicAPI
+
+FQDN = "https://bench.jamfcloud.com"
+
+
+class StubAdapter(BaseAdapter):
+    """Transport adapter that answers every request with an empty 200."""
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ,unused-argument
+        response = Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = b"{}"
+        return response
+
+    def close(self):
+        pass
+
+
+def main(calls: int = 20_000) -> None:
+    """Times ``calls`` sequential API.do round trips and prints the mean overhead."""
+    logger = logging.getLogger("jamfpy-bench")
+    logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.INFO)
+
+    auth = OAuth(fqdn=FQDN, client_id="id", client_secret="secret", logger=logger)
+    auth._token_str = "bench-token"
+    auth.token_expiry = datetime.now(timezone.utc).timestamp() + 3600
+
+    session = Session()
+    # Proxy discovery scans os.environ on every send; keep it out of the measurement.
+    session.trust_env = False
+    session.mount("https://", StubAdapter())
+    api = ClassicAPI(fqdn=FQDN, auth=auth, session=session, logger=logger)
+    request = Request("GET", url=f"{FQDN}/JSSResource/computers", headers={"accept": "application/json"})
+
+    for _ in range(500):
+        api.do(request)
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        api.do(request)
+    elapsed = time.perf_counter() - start
+
+    print(f"API.do      {calls} calls: {elapsed:.3f}s total, {elapsed / calls * 1e6:.1f} us/call")
+
+    # The per-request auth step on its own (named _refresh_session_headers in earlier releases).
+    auth_step = getattr(api, "_refresh_auth_header", None) or api._refresh_session_headers
+    start = time.perf_counter()
+    for _ in range(calls):
+        auth_step()
+    elapsed = time.perf_counter() - start
+
+    print(f"auth header {calls} calls: {elapsed:.3f}s total, {elapsed / calls * 1e6:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,59 @@
+"""Micro-benchmark: memory held by a computer inventory as plain dicts vs ProComputerInventory records.
+
+Builds synthetic computers-inventory records shaped like a GENERAL + HARDWARE + APPLICATIONS
+listing, then measures the retained size of each representation with tracemalloc. No network
+is touched.
+
+Usage (from the repo root): python -m benchmarks.records_memory [records]
+"""
+import json
+import sys
+import tracemalloc
+
+from jamfpy.client.generated_records import ProComputerInventory
+
+
+def _inventory(count: int) -> str:
+    """JSON text of count fake inventory records, so each representation decodes its own copy."""
+    records = [
+        {
+            "id": str(i), "udid": f"UDID-{i:08d}",
+            "general": {"name": f"mac-{i}", "managementId": f"m-{i:08d}", "platform": "Mac",
+                        "lastContactTime": "2024-05-01T10:00:00Z", "reportDate": "2024-05-01T10:00:00Z",
+                        "remoteManagement": {"managed": True, "managementUsername": "jamf"}},
+            "hardware": {"serialNumber": f"C02X{i:08d}", "model": "MacBook Pro", "processorType": "Apple M2",
+                         "totalRamMegabytes": 16384, "macAddress": "aa:bb:cc:dd:ee:ff"},
+            "applications": [{"name": f"App {n}.app", "version": f"{(i + n) % 17}.{i % 9}.{n}",
+                              "path": f"/Applications/App {n}.app", "bundleId": f"com.vendor{n}.app{i % 5}"}
+                             for n in range(20)],
+        }
+        for i in range(count)
+    ]
+    return json.dumps(records)
+
+
+def _retained(build) -> int:
+    """Bytes still allocated once build() has returned."""
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    """Prints the retained size of each representation"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    text = _inventory(count)
+
+    as_dicts = _retained(lambda: json.loads(text))
+    as_records = _retained(lambda: ProComputerInventory.from_records(json.loads(text)))
+
+    print(f"{count} computers")
+    print(f"dicts    {as_dicts / 2**20:8.1f} MiB")
+    print(f"records  {as_records / 2**20:8.1f} MiB  ({as_dicts / as_records:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,43 @@
 """Master init for jamfpy Library"""
 
+import importlib
+
 from .client.auth import OAuth, BasicAuth
 from .client.client import API, ProAPI, ClassicAPI
-from .client.tenant import Tenant
+from .client.tenant import Tenant, warm_tenants
+from .client.rate_limit import RateLimiter
+from .client.cache import ResponseCache
 from .client.logger import new_logger
+
+# Imported on first use, so plain sync callers never load asyncio, sqlite3 or the record classes.
+_LAZY_EXPORTS = {
+    "AsyncAPI": ".client.async_api",
+    "AsyncProAPI": ".client.async_api",
+    "AsyncClassicAPI": ".client.async_api",
+    "TenantPool": ".client.pool",
+    "DiskStore": ".client.store",
+    "ManagementIdIndex": ".client.management_index",
+    "Record": ".client.records",
+    "ClassicComputer": ".client.generated_records",
+    "ClassicMobileDevice": ".client.generated_records",
+    "ClassicPolicy": ".client.generated_records",
+    "ProScript": ".client.generated_records",
+    "ProComputerInventory": ".client.generated_records",
+    "ProMobileDevice": ".client.generated_records",
+    "RequestEvent": ".client.hooks",
+    "RequestHook": ".client.hooks",
+    "MetricsCollector": ".client.hooks",
+    "TokenStore": ".client.token_store",
+    "MemoryTokenStore": ".client.token_store",
+    "FileTokenStore": ".client.token_store",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -1,19 +1,33 @@
 """api model"""
 
+import random
+import time
+from email.utils import parsedate_to_datetime
 from logging import Logger
-from requests import Session, Request, Response
+from typing import TYPE_CHECKING
+from requests import Session, Request, Response, PreparedRequest
 
 from .auth import Auth
 from .http_config import HTTPConfig
 from .logger import new_logger
+from .rate_limit import RateLimiter
+from .cache import ResponseCache, resource_of
 from .utility import extract_cloud_tenant_name_from_url
 from .exceptions import JamfpyConfigError
+from .constants import RETRY_STATUS_CODES
 
+# Only for annotations; sqlite3 and the hooks module load when a caller uses them.
+if TYPE_CHECKING:
+    from .store import DiskStore
+    from .hooks import RequestEvent, RequestHook
 
-class API:
+
+class API:  # pylint: disable=too-many-instance-attributes
     """Base class providing core functionality for interacting with Jamf Pro APIs."""
 
     _headers_dict = {}
+    _auth_header = {}
+    _token = None
     _is_closed = False
     _short_name = None
     _version: str
@@ -32,6 +46,10 @@ class API:
             logger: Logger,
             cert_path: str = None,
             verify_path: str = None,
+            rate_limiter: RateLimiter = None,
+            cache: ResponseCache = None,
+            store: "DiskStore" = None,
+            hooks: list["RequestHook"] = None,
 
     ) -> None:
 
@@ -41,8 +59,13 @@ class API:
         self.cert_path = cert_path
         self.verify_path = verify_path
 
-        self._session = session or Session()
+        self._session = session or http_config.new_session()
         self._safe_mode = safe_mode
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.store = store
+        # Kept by reference, so hooks appended to a Tenant's list reach both of its APIs.
+        self.hooks = hooks if hooks is not None else []
 
         self._logger = self._init_logging(logger, log_level)
 
@@ -93,17 +116,145 @@ class API:
 
 
     # @_check_closed
-    def _refresh_session_headers(self) -> None:
-        """Clears all session headers and replaces with new Auth header"""
+    def _refresh_auth_header(self) -> None:
+        """
+        Ensures the token is valid and re-renders the Authorization header only when
+        auth has issued a new token since the last request.
+        """
+        # Compare what token() returned: it may itself refresh, or a keep-alive may have swapped it.
+        token = self.auth.token()
 
-        self._logger.debug("Refreshing session headers (Clear + Re-set)")
+        if token != self._token:
+            self._logger.debug("Token changed, re-rendering Authorization header")
+            self._auth_header = {"Authorization": f"Bearer {token}"}
+            self._token = token
 
-        self._session.headers.clear()
 
-        token = self.auth.token()
-        self._session.headers.update({"Authorization": f"Bearer {token}"})
+    def _authenticate(self, event: "RequestEvent", started: float) -> None:
+        """Refreshes the Authorization header, timing it on event; a failed token fetch goes to on_error"""
+        auth_started = time.perf_counter() if event is not None else 0.0
+        try:
+            self._refresh_auth_header()
+        except Exception as e:
+            if event is not None:
+                event.auth_secs = time.perf_counter() - auth_started
+                self._fail_event(event, e, started)
+            raise
+
+        if event is not None:
+            event.auth_secs = time.perf_counter() - auth_started
+
+
+    def _send(self, prepped: PreparedRequest, timeout: int, event: "RequestEvent" = None, stream: bool = False) -> Response:
+        """
+        Sends a prepared request through the rate limiter, resending on 429/503
+        after the server's Retry-After or a jittered exponential backoff.
+        """
+        attempt = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                if event is not None:
+                    event.rate_limit_secs += waited
+
+            if event is not None:
+                event.attempts += 1
+
+            response = self._session.send(
+                prepped, timeout=timeout, cert=self.cert_path, verify=self.verify_path, stream=stream
+            )
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_success()
+                return response
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_throttled()
+
+            delay = self._retry_delay(response, attempt)
+            if attempt >= self._http_config.throttle_retries or delay is None:
+                self._logger.warning("Throttled (%s) on %s %s, giving up", response.status_code, prepped.method, prepped.url)
+                return response
+
+            self._logger.warning(
+                "Throttled (%s) on %s %s, retry %s/%s in %.2fs",
+                response.status_code, prepped.method, prepped.url, attempt + 1, self._http_config.throttle_retries, delay
+            )
+            # Release the throttled response's connection to the pool; a streamed one holds it until closed.
+            response.close()
+            time.sleep(delay)
+            attempt += 1
 
-        self._logger.debug("Session headers refreshed successfully")
+            # A long backoff can carry the token into its buffer window.
+            self._refresh_auth_header()
+            prepped.headers.update(self._auth_header)
+
+
+    def _retry_delay(self, response: Response, attempt: int) -> float | None:
+        """
+        Seconds to wait before resending: the server's Retry-After when given, else
+        full-jitter exponential backoff. None when Retry-After exceeds backoff_max_secs.
+        """
+        backoff_max = self._http_config.backoff_max_secs
+        retry_after = response.headers.get("Retry-After")
+
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+
+            if delay is not None:
+                delay = max(delay, 0.0)
+                return delay if delay <= backoff_max else None
+
+        return random.uniform(0, min(backoff_max, self._http_config.backoff_base_secs * 2 ** attempt))
+
+
+    def _update_caches(self, prepped: PreparedRequest, response: Response, revalidated: Response = None) -> Response:
+        """Stores or revalidates GETs in the response cache; writes invalidate it and expire the store"""
+        if self.cache is not None:
+            if prepped.method == "GET":
+                response = self.cache.store(prepped, response, revalidated)
+            else:
+                self.cache.invalidate_url(prepped.url)
+
+        if self.store is not None and prepped.method != "GET":
+            resource = resource_of(prepped.url)
+            if resource is not None:
+                self.store.expire(resource)
+
+        return response
+
+
+    def _emit(self, callback: str, event: "RequestEvent") -> None:
+        """Runs one callback of every hook; a failing hook is logged, never raised into the request"""
+        for hook in self.hooks:
+            try:
+                getattr(hook, callback)(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._logger.exception("Request hook %r failed in %s", hook, callback)
+
+
+    def _finish_event(self, event: "RequestEvent", response: Response, started: float, stream: bool = False) -> None:
+        """Fills in the response side of event and hands it to after_receive"""
+        event.status = response.status_code
+        # A streamed body is still unread; its size is whatever the server announced.
+        event.bytes_in = int(response.headers.get("Content-Length") or 0) if stream else len(response.content or b"")
+        event.total_secs = time.perf_counter() - started
+        self._emit("after_receive", event)
+
+
+    def _fail_event(self, event: "RequestEvent", error: Exception, started: float) -> None:
+        """Records error on event and hands it to on_error"""
+        event.error = error
+        event.total_secs = time.perf_counter() - started
+        self._emit("on_error", event)
 
 
     # Public Methods
@@ -146,9 +297,18 @@ class API:
 
 
     # @_check_closed
-    def do(self, request: Request, timeout: int = 10) -> Response:
-        """Takes request, preps and sends"""
-        self._refresh_session_headers()
+    def do(self, request: Request, timeout: int = 10, stream: bool = False) -> Response:
+        """Takes request, preps and sends.
+
+        With ``stream`` the body is left unread for the caller to consume incrementally (see
+        ``xml_stream``); streamed requests bypass the ResponseCache.
+        """
+        # Timing is only taken when someone listens, keeping the hook-less path as it was.
+        event = None
+        if self.hooks:
+            from .hooks import RequestEvent  # pylint: disable=import-outside-toplevel
+            event = RequestEvent(self._short_name, request.method.upper(), request.url)
+        started = time.perf_counter() if event is not None else 0.0
 
         do_debug_string = "%s: Method: %s at: %s with headers: %s"
 
@@ -160,14 +320,56 @@ class API:
 
         prepped = self._session.prepare_request(request)
 
+        if event is not None:
+            event.prepare_secs = time.perf_counter() - started
+
+        # A cache hit never touches auth, so lazy_auth tenants serving cached reads fetch no token.
+        revalidated = None
+        if self.cache is not None and prepped.method == "GET" and not stream:
+            cached = self.cache.get(prepped)
+            if cached is not None:
+                self._logger.debug("Cache hit: %s %s", prepped.method, prepped.url)
+                if event is not None:
+                    event.cache = "hit"
+                    self._finish_event(event, cached, started)
+                return cached
+            conditional, revalidated = self.cache.revalidation(prepped)
+            prepped.headers.update(conditional)
+
+        self._authenticate(event, started)
+        prepped.headers.update(self._auth_header)
+
+        if event is not None:
+            event.bytes_out = len(prepped.body or b"")
+            self._emit("before_send", event)
+
         prepped_header_log = "no headers supplied"
         if prepped.headers:
             prepped_header_log = prepped.headers if not self._safe_mode else "[redacted]"
 
         self._logger.debug(do_debug_string, "sending", prepped.method, prepped.url, prepped_header_log)
 
-        response = self._session.send(prepped, timeout=timeout, cert=self.cert_path, verify=self.verify_path)
+        send_started = time.perf_counter() if event is not None else 0.0
+        try:
+            response = self._send(prepped, timeout, event, stream)
+        except Exception as e:
+            if event is not None:
+                event.send_secs = time.perf_counter() - send_started
+                self._fail_event(event, e, started)
+            raise
+
+        if event is not None:
+            event.send_secs = time.perf_counter() - send_started
+            if self.cache is not None and not stream and response.status_code == 304:
+                event.cache = "revalidated"
+
+        # Caching a streamed GET would read the body the caller is about to stream.
+        if not (stream and prepped.method == "GET"):
+            response = self._update_caches(prepped, response, revalidated)
 
         self._logger.debug("Success: Code: %s Req: %s %s", response.status_code, prepped.method, response.url)
 
+        if event is not None:
+            self._finish_event(event, response, started, stream)
+
         return response
@@ -0,0 +1,156 @@
+"""Thread-offloaded asyncio clients for the Classic and Pro APIs, one bounded thread pool per client."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+
+from requests import Session, Request, Response
+
+from .api import API
+from .auth import Auth
+from .client import ClassicAPI, ProAPI
+from .http_config import HTTPConfig
+from .rate_limit import RateLimiter
+from .cache import ResponseCache
+from .store import DiskStore
+from .hooks import RequestHook
+from .constants import DEFAULT_LOG_LEVEL, DEFAULT_ASYNC_THREADS
+from ..endpoints.models import Endpoint, AsyncEndpoint
+
+
+class AsyncAPI:
+    """Thread-offloaded, awaitable twin of API.
+
+    Wraps a synchronous API client and offloads its (blocking, ``requests``-based) request path to
+    a dedicated pool of ``max_threads`` threads, so the endpoint surface, auth handling and raw
+    ``requests.Response`` return values stay identical. This is not a native asyncio transport:
+    any number of calls can be awaited from one event loop, but at most ``max_threads`` are on
+    the wire at once and the rest queue. Thousands of concurrent requests therefore need
+    thousands of threads; in practice Jamf Pro's rate limits make a few dozen the useful ceiling.
+
+    The wrapped client's session is used as is. AsyncClassicAPI and AsyncProAPI size the session
+    they build to ``max_threads`` connections; a session passed in (e.g. a Tenant's, shared with
+    sync clients) keeps its own adapter, so widen its ``HTTPConfig.pool_maxsize`` to match.
+    """
+
+    def __init__(self, api: API, *, max_threads: int = DEFAULT_ASYNC_THREADS) -> None:
+        self._api = api
+        self._max_threads = max_threads
+        self._semaphore = asyncio.Semaphore(max_threads)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_threads,
+            thread_name_prefix=f"jamfpy-{api._short_name}"  # pylint: disable=protected-access
+        )
+
+
+
+    def __getattr__(self, name):
+        attr = getattr(self._api, name)
+        if isinstance(attr, Endpoint):
+            return AsyncEndpoint(attr, self)
+        return attr
+
+
+    def __str__(self) -> str:
+        return f"Async {self._api}"
+
+
+    async def run(self, func, *args, **kwargs):
+        """Runs a blocking callable on the executor once a thread is free"""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+
+    async def do(self, request: Request, timeout: int = 10, stream: bool = False) -> Response:
+        """Awaitable API.do; a streamed body is still read with blocking calls"""
+        return await self.run(self._api.do, request, timeout, stream)
+
+
+    async def close(self) -> None:
+        """Invalidates tokens via the wrapped client and shuts down the executor"""
+        await self.run(self._api.close)
+        self._executor.shutdown(wait=False)
+
+
+class AsyncClassicAPI(AsyncAPI):
+    """Asyncio client for the Classic Jamf Pro API (JSS); thread-offloaded, see AsyncAPI."""
+
+    def __init__(
+            self,
+            *,
+            fqdn: str,
+            auth: Auth,
+            log_level = DEFAULT_LOG_LEVEL,
+            http_config: HTTPConfig = HTTPConfig(),
+            safe_mode: bool = True,
+            session: Session = None,
+            logger: Logger = None,
+            cert_path: str = None,
+            verify_path: str = None,
+            rate_limiter: RateLimiter = None,
+            cache: ResponseCache = None,
+            store: DiskStore = None,
+            hooks: list[RequestHook] = None,
+            max_threads: int = DEFAULT_ASYNC_THREADS,
+    ):
+        super().__init__(
+            ClassicAPI(
+                fqdn=fqdn,
+                auth=auth,
+                log_level=log_level,
+                http_config=http_config,
+                safe_mode=safe_mode,
+                session=session or http_config.new_session(pool_maxsize=max_threads),
+                logger=logger,
+                cert_path=cert_path,
+                verify_path=verify_path,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                store=store,
+                hooks=hooks
+            ),
+            max_threads=max_threads
+        )
+
+
+class AsyncProAPI(AsyncAPI):
+    """Asyncio client for the modern Jamf Pro API (v1+); thread-offloaded, see AsyncAPI."""
+
+    def __init__(
+            self,
+            *,
+            fqdn: str,
+            auth: Auth,
+            log_level = DEFAULT_LOG_LEVEL,
+            http_config: HTTPConfig = HTTPConfig(),
+            safe_mode: bool = True,
+            session: Session = None,
+            logger: Logger = None,
+            cert_path: str = None,
+            verify_path: str = None,
+            rate_limiter: RateLimiter = None,
+            cache: ResponseCache = None,
+            store: DiskStore = None,
+            hooks: list[RequestHook] = None,
+            max_threads: int = DEFAULT_ASYNC_THREADS,
+    ):
+        super().__init__(
+            ProAPI(
+                fqdn=fqdn,
+                auth=auth,
+                log_level=log_level,
+                http_config=http_config,
+                safe_mode=safe_mode,
+                session=session or http_config.new_session(pool_maxsize=max_threads),
+                logger=logger,
+                cert_path=cert_path,
+                verify_path=verify_path,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                store=store,
+                hooks=hooks
+            ),
+            max_threads=max_threads
+        )
@@ -3,14 +3,17 @@
 # Libs
 from base64 import b64encode
 import datetime
+import threading
+import time
 from logging import Logger
-from typing import Optional
-from requests import request
+from typing import Optional, TYPE_CHECKING
+from requests import request, Response, Session
 
 # This module
 from .logger import new_logger
 from .http_config import HTTPConfig
 from .exceptions import JamfAuthError
+from .renewal import TokenRenewalMixin
 from .utility import fix_jamf_time_to_iso, extract_cloud_tenant_name_from_url
 
 from .constants import (
@@ -20,15 +23,19 @@ from .constants import (
     DEFAULT_TOKEN_BUFFER
 )
 
+# Only for annotations; a TokenStore is built (and its module imported) by the caller.
+if TYPE_CHECKING:
+    from .token_store import TokenStore
 
-class Auth:
+
+class Auth(TokenRenewalMixin):
     """Base authentication class providing token management and validation for Jamf Pro API."""
 
     _token_str: str
     _method: str
     _logger: Logger
 
-    token_expiry: datetime.time
+    token_expiry: float
 
     def __init__(
             self,
@@ -40,15 +47,25 @@ class Auth:
             log_level: int = DEFAULT_LOG_LEVEL,
             cert_path: str = None,
             verify_path: str = None,
+            session: Session = None,
+            token_store: "TokenStore" = None,
     ):
         self._fqdn = fqdn
         self._http_config = http_config
+        self._session = session
         self._logger = logger or self._init_logging(log_level)
         self._auth_url = self._init_urls()
         self.token_exp_thold_mins = token_exp_thold_mins
         self.cert_path = cert_path
         self.verify_path = verify_path
 
+        self._token_str = None
+        self.token_expiry = 0.0
+        self._token_lock = threading.RLock()
+        self._renewal_thread: Optional[threading.Thread] = None
+        self._renewal_stop = threading.Event()
+        self.token_store = token_store
+
 
     def set_new_token(self):
         """todo"""
@@ -56,6 +73,53 @@ class Auth:
     def _keep_alive_token(self):
         """todo"""
 
+    def _request(self, **kwargs) -> Response:
+        """Sends an auth call over the shared session if one was supplied, else a one-off connection"""
+        if self._session is None:
+            return request(**kwargs)  # pylint: disable=missing-timeout  # callers always pass timeout
+
+        return self._session.request(**kwargs)
+
+
+    def _token_key(self) -> str:
+        """Identifies this tenant + credential in a token store"""
+        return f"{self._method}:{self._fqdn}"
+
+
+    def fetch_token(self) -> None:
+        """
+        Sets a token, adopting a still-valid one from the token store before minting a
+        new one with set_new_token, and publishing whatever it mints.
+        """
+        self._fetch_token(self.set_new_token)
+
+
+    def _fetch_token(self, mint) -> None:
+        """fetch_token, minting with the given method (set_new_token or _keep_alive_token)"""
+        if self.token_store is None:
+            mint()
+            return
+
+        key = self._token_key()
+        with self.token_store.lock(key):
+            # Re-read under the lock: another process may have minted while we waited.
+            stored = self.token_store.load(key)
+            if stored is not None and stored[0] != self._token_str \
+                    and stored[1] - self.token_exp_thold_mins * 60 > time.time():
+                self._logger.debug("Adopted token from %s", self.token_store)
+                self._set_token(*stored)
+                return
+
+            mint()
+            self.token_store.save(key, self._token_str, self.token_expiry)
+
+
+    def _set_token(self, token_str: str, expiry: float) -> None:
+        """Stores a freshly issued token and its expiry"""
+        self._token_str = token_str
+        self.token_expiry = expiry
+
+
     def _init_logging(self, log_level) -> Logger:
         """Inits loggers for API Object"""
 
@@ -134,43 +198,71 @@ class Auth:
         """
         Proccess of checking and refreshing token
         Occurs before every request to ensure no usage of old tokens
+
+        Single-flight: the first caller to find the token stale refreshes it while
+        holding the lock; concurrent callers block on the lock, then re-check and
+        find the fresh token, so only one refresh request is ever sent.
         """
         self._logger.debug("FUNCTION: check_token")
 
-        if self.check_token_is_expired():
-            self.set_new_token()
+        with self._token_lock:
+            if self.check_token_is_expired():
+                self.fetch_token()
 
-            if self.check_token_in_buffer():
-                raise JamfAuthError("Buffer longer than token lifetime")
+                if self.check_token_in_buffer():
+                    raise JamfAuthError("Buffer longer than token lifetime")
 
-        elif self.check_token_in_buffer():
-            if self. _method == "bearer":
-                self._keep_alive_token()
+            elif self.check_token_in_buffer():
+                if self. _method == "bearer":
+                    self._fetch_token(self._keep_alive_token)
 
-            elif self._method == "oauth":
-                self.set_new_token()
+                elif self._method == "oauth":
+                    self.fetch_token()
 
-            if self.check_token_in_buffer():
-                raise JamfAuthError("Buffer longer than token lifetime")
+                if self.check_token_in_buffer():
+                    raise JamfAuthError("Buffer longer than token lifetime")
 
 
     def token(self) -> str:
         """Checks token validity and returns token string if valid"""
+        # Fast path: comfortably outside the buffer, so skip the full (logged) check.
+        if time.time() < self.token_expiry - self.token_exp_thold_mins * 60:
+            return self._token_str
+
         self._logger.debug("FUNCTION: token")
         self.check_token()
         return self._token_str
 
 
-    def invalidate(self) -> bool:
+    def invalidate(self, revoke: bool = None) -> bool:
         """
         invalidates token
+
+        With a token_store the token may be in use by other processes, so by default it is
+        left to expire: nothing is revoked and False is returned. Pass ``revoke=True`` to
+        drop it from the store and revoke it server-side anyway.
         """
-        url = self._http_config.urls["auth"]["invalidate-token"]
+        self.stop_background_renewal()
+
+        if revoke is None:
+            revoke = self.token_store is None
+
+        if not revoke:
+            self._logger.debug("Token is shared via %s, leaving it to expire", self.token_store)
+            return False
+
+        if self.token_store is not None:
+            key = self._token_key()
+            stored = self.token_store.load(key)
+            if stored is not None and stored[0] == self._token_str:
+                self.token_store.delete(key)
+
+        url = self._fqdn + self._http_config.urls["auth"]["invalidate-token"]
         headers = {
             "accept": "application/json",
             "Authorization": f"Bearer {self._token_str}"
         }
-        call = request(
+        call = self._request(
             method="POST",
             url=url,
             headers=headers,
@@ -202,6 +294,8 @@ class OAuth(Auth):
             logger = None,
             cert_path: str = None,
             verify_path: str = None,
+            session: Session = None,
+            token_store: "TokenStore" = None,
 
     ) -> None:
 
@@ -212,7 +306,9 @@ class OAuth(Auth):
             token_exp_thold_mins=token_exp_thold_mins,
             log_level=log_level,
             cert_path=cert_path,
-            verify_path=verify_path
+            verify_path=verify_path,
+            session=session,
+            token_store=token_store
         )
 
         self._oauth_cid = client_id
@@ -224,6 +320,9 @@ class OAuth(Auth):
         """Returns a string representation of the OAuth object."""
         return f"OAuth Object for {self._fqdn}"
 
+    def _token_key(self) -> str:
+        return f"{super()._token_key()}:{self._oauth_cid}"
+
     # methods
 
     def set_new_token(self) -> None:
@@ -237,7 +336,7 @@ class OAuth(Auth):
             "grant_type": "client_credentials"
         }
 
-        call = request(
+        call = self._request(
             method="POST",
             url=self._auth_url,
             headers=headers,
@@ -251,10 +350,9 @@ class OAuth(Auth):
             raise JamfAuthError("Error getting token.", call, call.text)
 
         call_json = call.json()
-        self._token_str = call_json["access_token"]
         now = datetime.datetime.now(datetime.timezone.utc)
-        self.token_expiry = (now + datetime.timedelta(seconds=call_json["expires_in"])).timestamp()
-        self.token_expiry = round(self.token_expiry, TIME_ROUNDING_DECIMAL_COUNT)
+        expiry = (now + datetime.timedelta(seconds=call_json["expires_in"])).timestamp()
+        self._set_token(call_json["access_token"], round(expiry, TIME_ROUNDING_DECIMAL_COUNT))
 
         self._logger.debug("Token set successfully")
 
@@ -283,6 +381,8 @@ class BasicAuth(Auth):
             logger: Logger = None,
             cert_path: str = None,
             verify_path: str = None,
+            session: Session = None,
+            token_store: "TokenStore" = None,
     ) -> None:
 
         super().__init__(
@@ -292,7 +392,9 @@ class BasicAuth(Auth):
             logger=logger,
             log_level=log_level,
             cert_path=cert_path,
-            verify_path=verify_path
+            verify_path=verify_path,
+            session=session,
+            token_store=token_store
         )
 
         self.username = username
@@ -308,6 +410,10 @@ class BasicAuth(Auth):
         return f"Bearer Token Object for {self._fqdn}"
 
 
+    def _token_key(self) -> str:
+        return f"{super()._token_key()}:{self.username}"
+
+
     # Methods
 
     # Private
@@ -330,7 +436,7 @@ class BasicAuth(Auth):
             "Authorization": f"Bearer {self._token_str}"
         }
 
-        call = request(
+        call = self._request(
             method="POST",
             url=url,
             headers=headers,
@@ -343,9 +449,9 @@ class BasicAuth(Auth):
             raise JamfAuthError("Error keeping token alive")
 
         call_json = call.json()
-        self._token_str = call_json["token"]
         expiry_str = call_json["expires"]
-        self.token_expiry = datetime.datetime.fromisoformat(expiry_str.replace('Z', '+00:00')).timestamp()
+        expiry = datetime.datetime.fromisoformat(expiry_str.replace('Z', '+00:00')).timestamp()
+        self._set_token(call_json["token"], expiry)
         self._logger.debug("_keep_alive_token complete")
 
 
@@ -361,7 +467,7 @@ class BasicAuth(Auth):
             "Authorization": f"Basic {self.basic_auth_token}"  
         }
 
-        call = request(
+        call = self._request(
             method="POST",
             url=url,
             headers=headers,
@@ -375,7 +481,6 @@ class BasicAuth(Auth):
 
 
         call_json = call.json()
-        self._token_str = call_json["token"]
         expiry_str = call_json["expires"]
         fixed_expiry_str = fix_jamf_time_to_iso(expiry_str)
-        self.token_expiry = datetime.datetime.fromisoformat(fixed_expiry_str).timestamp()
+        self._set_token(call_json["token"], datetime.datetime.fromisoformat(fixed_expiry_str).timestamp())
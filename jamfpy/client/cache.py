@@ -0,0 +1,219 @@
+"""In-memory read and revalidation cache for Jamf Pro API responses."""
+
+import copy
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from requests import PreparedRequest, Response
+
+from .constants import DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_TTL_SECS, DEFAULT_CACHE_TTLS
+
+# Validator response header -> conditional request header that echoes it back.
+_VALIDATORS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+# Headers a 304 may carry that update the stored response.
+_REFRESHED_HEADERS = ("ETag", "Last-Modified", "Date", "Expires", "Cache-Control")
+
+# First path segment after the API root, e.g. "categories" in
+# /JSSResource/categories/id/1 or "scripts" in /api/v1/scripts/1.
+_RESOURCE_PATTERN = re.compile(r"/(?:JSSResource|api/v\d+)/([^/?]+)")
+
+
+def resource_of(url: str) -> str | None:
+    """Returns the resource name a request url targets, or None if it is not an API url"""
+    match = _RESOURCE_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+class ResponseCache:
+    """Thread-safe, size-bounded LRU cache of successful GET responses.
+
+    Entries are keyed by method, url and Accept header and expire after a per-resource TTL
+    (``ttls``, keyed by resource name such as ``"categories"``), falling back to ``default_ttl``.
+    By default only the reference lists in ``DEFAULT_CACHE_TTLS`` (categories, sites, buildings,
+    departments, computer groups) are served from memory; ``default_ttl`` is 0 so that inventory
+    reads and ``/mdm/commands`` polls are never answered stale. A TTL of 0 disables caching for
+    that resource (but see ``conditional``). Any non-GET request
+    against a resource drops every cached entry for it, so a ``create``/``update_by_id``/
+    ``delete_by_id`` is never followed by a stale read.
+
+    With ``conditional`` on (the default), an expired entry whose response carried an ``ETag`` or
+    ``Last-Modified`` is kept rather than dropped. The next read of it is sent with
+    ``If-None-Match``/``If-Modified-Since``, and a ``304 Not Modified`` is answered from the stored
+    body, so repeat polling costs headers rather than payloads. Here a TTL of 0 means "always
+    revalidate" instead of "never cache".
+    """
+
+    def __init__(
+            self,
+            *,
+            max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+            default_ttl: float = DEFAULT_CACHE_TTL_SECS,
+            ttls: dict[str, float] = None,
+            conditional: bool = True,
+    ) -> None:
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.conditional = conditional
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        # key -> (expires_at, resource, response), least recently used first.
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def __str__(self) -> str:
+        return (
+            f"ResponseCache {len(self)}/{self.max_entries} entries, {self.hits} hits, "
+            f"{self.revalidations} revalidated, {self.misses} misses"
+        )
+
+
+    @staticmethod
+    def key(prepped: PreparedRequest) -> tuple:
+        """Cache key for a prepared request"""
+        return (prepped.method, prepped.url, prepped.headers.get("accept"))
+
+
+    def ttl_for(self, resource: str | None) -> float:
+        """Seconds a response for resource stays fresh"""
+        return self.ttls.get(resource, self.default_ttl)
+
+
+    @staticmethod
+    def _copy(response: Response) -> Response:
+        """Copy of a stored response that callers can mutate without touching the entry"""
+        clone = copy.copy(response)
+        clone.headers = response.headers.copy()
+        return clone
+
+
+    def _revalidatable(self, response: Response) -> bool:
+        return self.conditional and any(header in response.headers for header in _VALIDATORS)
+
+
+    def get(self, prepped: PreparedRequest) -> Response | None:
+        """Returns a copy of the fresh cached response for prepped, or None"""
+        key = self.key(prepped)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.monotonic():
+                # Stale entries with validators stay around to be revalidated.
+                if entry is not None and not self._revalidatable(entry[2]):
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return self._copy(entry[2])
+
+
+    def conditional_headers(self, prepped: PreparedRequest) -> dict:
+        """If-None-Match / If-Modified-Since headers for a stored (usually stale) entry, if any"""
+        return self.revalidation(prepped)[0]
+
+
+    def revalidation(self, prepped: PreparedRequest) -> tuple[dict, Response | None]:
+        """Conditional headers for a stored entry and the stored response they validate, to be
+        handed back to ``store`` with the server's answer. ``({}, None)`` when there is none.
+        """
+        if not self.conditional:
+            return {}, None
+
+        with self._lock:
+            entry = self._entries.get(self.key(prepped))
+
+        if entry is None:
+            return {}, None
+
+        headers = entry[2].headers
+        conditional = {cond: headers[validator] for validator, cond in _VALIDATORS.items() if validator in headers}
+        return conditional, entry[2] if conditional else None
+
+
+    def store(self, prepped: PreparedRequest, response: Response, revalidated: Response = None) -> Response:
+        """Records the server's answer to a GET and returns the response to hand the caller.
+
+        A 304 refreshes the stored entry and is answered with a copy of its body; anything else
+        is passed to ``put`` and returned unchanged. ``revalidated`` is the stored response the
+        request's validators came from (see ``revalidation``): if its entry was evicted or
+        invalidated while the request was in flight, the 304 is answered from it, without
+        storing it again.
+        """
+        if response.status_code != 304:
+            self.put(prepped, response)
+            return response
+
+        key = self.key(prepped)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if revalidated is None:
+                    # Nothing to serve it from; only reachable when no validators were sent by us.
+                    return response
+                self.revalidations += 1
+                return self._copy(revalidated)
+
+            stored = entry[2]
+            for header in _REFRESHED_HEADERS:
+                if header in response.headers:
+                    stored.headers[header] = response.headers[header]
+
+            self._entries[key] = (time.monotonic() + self.ttl_for(entry[1]), entry[1], stored)
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+
+        return self._copy(stored)
+
+
+    def put(self, prepped: PreparedRequest, response: Response) -> None:
+        """Stores a successful GET response, evicting the least recently used past max_entries"""
+        if prepped.method != "GET" or not response.ok:
+            return
+
+        resource = resource_of(prepped.url)
+        ttl = self.ttl_for(resource)
+        if self.max_entries <= 0 or (ttl <= 0 and not self._revalidatable(response)):
+            return
+
+        # Read the body now so the cached copy never touches the connection again.
+        _ = response.content
+
+        key = self.key(prepped)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, resource, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+    def invalidate(self, resource: str | None = None) -> None:
+        """Drops every entry for resource, or the whole cache when resource is None"""
+        with self._lock:
+            if resource is None:
+                self._entries.clear()
+                return
+
+            for key in [k for k, entry in self._entries.items() if entry[1] == resource]:
+                del self._entries[key]
+
+
+    def invalidate_url(self, url: str) -> None:
+        """Drops every entry for the resource url targets"""
+        resource = resource_of(url)
+        if resource is not None:
+            self.invalidate(resource)
@@ -1,6 +1,8 @@
 """Core client module for Jamf Pro API interactions, providing base API client functionality and specific implementations for Pro and Classic APIs."""
 
+import importlib
 from logging import Logger
+from typing import TYPE_CHECKING
 from requests import Session
 
 
@@ -8,31 +10,39 @@ from .auth import Auth
 from .http_config import HTTPConfig
 from .constants import DEFAULT_LOG_LEVEL
 from .api import API
+from .rate_limit import RateLimiter
+from .cache import ResponseCache
+
+# Only for annotations, so constructing a client never imports sqlite3.
+if TYPE_CHECKING:
+    from .store import DiskStore
+    from .hooks import RequestHook
+
+
+class _LazyEndpoint:
+    """Builds an endpoint on first access and caches it on the API instance.
+
+    The endpoint module is only imported then, so neither ``import jamfpy`` nor client
+    construction pays for endpoints a caller never touches. As a non-data descriptor it is
+    bypassed by the cached instance attribute on every later access.
+    """
+
+    def __init__(self, module: str, class_name: str) -> None:
+        self._module = module
+        self._class_name = class_name
+        self._attr = None
+
+    def __set_name__(self, owner, name) -> None:
+        self._attr = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        module = importlib.import_module(f"..endpoints.{self._module}", __package__)
+        endpoint = getattr(module, self._class_name)(instance)
+        instance.__dict__[self._attr] = endpoint
+        return endpoint
 
-from ..endpoints.clc_endpoints import (
-    ComputerGroups,
-    MobileDeviceGroups,
-    Policies,
-    ConfigurationProfiles,
-    ExtensionAttributes,
-    Categories,
-    AdvancedComputerSearches,
-    Scripts,
-    Buildings,
-    Packages,
-    Computers,
-    MobileDevices,
-    Sites,
-    Departments,
-    RestrictedSoftware
-)
-
-from ..endpoints.clc_endpoints_accounts import Accounts
-
-from ..endpoints.pro_scripts import Scripts as ProScripts
-from ..endpoints.pro_mdm_commands import MDMCommands as ProMDMCommands
-from ..endpoints.pro_app_installers import AppInstallers
-from ..endpoints.pro_dock_items import DockItems as ProDockItems
 
 class ClassicAPI(API):
     """Implementation of the Classic Jamf Pro API (JSS) endpoints and functionality."""
@@ -40,6 +50,24 @@ class ClassicAPI(API):
     _version = "classic"
     _short_name = "clc"
 
+    # Endpoints
+    computer_groups = _LazyEndpoint("clc_endpoints", "ComputerGroups")
+    mobile_device_groups = _LazyEndpoint("clc_endpoints", "MobileDeviceGroups")
+    policies = _LazyEndpoint("clc_endpoints", "Policies")
+    configuration_profiles = _LazyEndpoint("clc_endpoints", "ConfigurationProfiles")
+    computer_extension_attributes = _LazyEndpoint("clc_endpoints", "ExtensionAttributes")
+    categories = _LazyEndpoint("clc_endpoints", "Categories")
+    computer_searches = _LazyEndpoint("clc_endpoints", "AdvancedComputerSearches")
+    scripts = _LazyEndpoint("clc_endpoints", "Scripts")
+    buildings = _LazyEndpoint("clc_endpoints", "Buildings")
+    packages = _LazyEndpoint("clc_endpoints", "Packages")
+    computers = _LazyEndpoint("clc_endpoints", "Computers")
+    mobile_devices = _LazyEndpoint("clc_endpoints", "MobileDevices")
+    sites = _LazyEndpoint("clc_endpoints", "Sites")
+    departments = _LazyEndpoint("clc_endpoints", "Departments")
+    accounts = _LazyEndpoint("clc_endpoints_accounts", "Accounts")
+    restricted_software = _LazyEndpoint("clc_endpoints", "RestrictedSoftware")
+
     def __init__(
             self,
             *,
@@ -52,6 +80,10 @@ class ClassicAPI(API):
             logger: Logger = None,
             cert_path: str = None,
             verify_path: str = None,
+            rate_limiter: RateLimiter = None,
+            cache: ResponseCache = None,
+            store: "DiskStore" = None,
+            hooks: list["RequestHook"] = None,
     ):
 
         # no dynamic args here to preserve the hints.
@@ -64,29 +96,13 @@ class ClassicAPI(API):
             session=session,
             logger=logger,
             cert_path=cert_path,
-            verify_path=verify_path
+            verify_path=verify_path,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            store=store,
+            hooks=hooks
         )
 
-        # Endpoints
-        self.computer_groups = ComputerGroups(self)
-        self.mobile_device_groups = MobileDeviceGroups(self)
-        self.policies = Policies(self)
-        self.configuration_profiles = ConfigurationProfiles(self)
-        self.computer_extension_attributes = ExtensionAttributes(self)
-        self.categories = Categories(self)
-        self.computer_searches = AdvancedComputerSearches(self)
-        self.scripts = Scripts(self)
-        self.buildings = Buildings(self)
-        self.packages = Packages(self)
-        self.computers = Computers(self)
-        self.mobile_devices = MobileDevices(self)
-        self.sites = Sites(self)
-        self.departments = Departments(self)
-        self.policies = Policies(self)
-        self.accounts = Accounts(self)
-        self.restricted_software = RestrictedSoftware(self)
-
-
 
 class ProAPI(API):
     """Implementation of the modern Jamf Pro API (v1+) endpoints and functionality."""
@@ -94,6 +110,17 @@ class ProAPI(API):
     _version = "pro"
     _short_name = "pro"
 
+    # Endpoints
+    scripts = _LazyEndpoint("pro_scripts", "Scripts")
+    mdm = _LazyEndpoint("pro_mdm_commands", "MDMCommands")
+    app_installers = _LazyEndpoint("pro_app_installers", "AppInstallers")
+    dock_items = _LazyEndpoint("pro_dock_items", "DockItems")
+    computers_inventory = _LazyEndpoint("pro_computers_inventory", "ComputersInventory")
+    mobile_devices = _LazyEndpoint("pro_mobile_devices", "MobileDevices")
+
+    # A ManagementIdIndex here lets the mdm wrappers take serials, names, udids and ids.
+    management_index = None
+
     def __init__(
             self,
             *,
@@ -106,6 +133,10 @@ class ProAPI(API):
             logger: Logger = None,
             cert_path: str = None,
             verify_path: str = None,
+            rate_limiter: RateLimiter = None,
+            cache: ResponseCache = None,
+            store: "DiskStore" = None,
+            hooks: list["RequestHook"] = None,
     ):
 
         super().__init__(
@@ -117,14 +148,13 @@ class ProAPI(API):
             session=session,
             logger=logger,
             cert_path=cert_path,
-            verify_path=verify_path
+            verify_path=verify_path,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            store=store,
+            hooks=hooks
         )
 
-        self.scripts = ProScripts(self)
-        self.mdm = ProMDMCommands(self)
-        self.app_installers = AppInstallers(self)
-        self.dock_items = ProDockItems(self)
-
     # Magic Methods
     def __str__(self) -> str:
         return f"Jamf {self._version} API Client for {self._fqdn}"
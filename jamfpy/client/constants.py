@@ -6,6 +6,37 @@ DEFAULT_LOG_LEVEL = INFO
 DEFAULT_TOKEN_BUFFER = 20
 
 AUTH_REQUEST_TIMEOUT = 20
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TRANSPORT_RETRIES = 0
+
+RETRY_STATUS_CODES = (429, 503)
+DEFAULT_THROTTLE_RETRIES = 3
+DEFAULT_BACKOFF_BASE_SECS = 0.5
+DEFAULT_BACKOFF_MAX_SECS = 30
+
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+RATE_LIMIT_INCREASE_FRACTION = 0.05
+
+DEFAULT_RENEWAL_LEAD_SECS = 60
+RENEWAL_RETRY_SECS = 10
+DEFAULT_ASYNC_THREADS = 10
+DEFAULT_MAX_WORKERS = 5
+DEFAULT_TENANT_POOL_WORKERS = 16
+DEFAULT_MDM_BATCH_SIZE = 250
+DEFAULT_MDM_POLL_PAGE_SIZE = 1000
+MDM_POLL_INITIAL_SECS = 5
+MDM_POLL_MAX_SECS = 120
+MDM_POLL_UUID_FILTER_MAX = 50
+MDM_CLOCK_SKEW_SECS = 300
+DEFAULT_INDEX_PAGE_SIZE = 1000
+DEFAULT_SYNC_PAGE_SIZE = 1000
+INDEX_REFRESH_OVERLAP_SECS = 300
+RECORD_COMPRESS_MIN_BYTES = 256
+DEFAULT_CACHE_MAX_ENTRIES = 256
+DEFAULT_CACHE_TTL_SECS = 0
+# Reference lists that rarely change within a run; everything else is only ever revalidated.
+DEFAULT_CACHE_TTLS = {"categories": 60, "sites": 60, "buildings": 60, "departments": 60, "computergroups": 60}
 TIME_ROUNDING_DECIMAL_COUNT = 3
 
 VALID_AUTH_METHODS = ("oauth2", "basic")
@@ -0,0 +1,247 @@
+"""Record classes generated from api_schemas by tools/generate_records.py; do not edit."""
+# pylint: disable=too-many-instance-attributes,too-many-lines
+
+from .records import Record
+
+
+class ClassicComputer(Record):
+    """``/JSSResource/computers`` record (classic.json ``Computer``, fields hand-listed in tools/generate_records.py)"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "managed",
+        "username",
+        "model",
+        "department",
+        "building",
+        "mac_address",
+        "udid",
+        "serial_number",
+        "report_date_utc",
+        "report_date_epoch",
+    )
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+        ("managed", "managed"),
+        ("username", "username"),
+        ("model", "model"),
+        ("department", "department"),
+        ("building", "building"),
+        ("mac_address", "mac_address"),
+        ("udid", "udid"),
+        ("serial_number", "serial_number"),
+        ("report_date_utc", "report_date_utc"),
+        ("report_date_epoch", "report_date_epoch"),
+    )
+    _sections = (
+        ("general", "general"),
+        ("location", "location"),
+        ("purchasing", "purchasing"),
+        ("peripherals", "peripherals"),
+        ("hardware", "hardware"),
+        ("certificates", "certificates"),
+        ("security", "security"),
+        ("software", "software"),
+        ("extension_attributes", "extension_attributes"),
+        ("groups_accounts", "groups_accounts"),
+        ("iphones", "iphones"),
+        ("configuration_profiles", "configuration_profiles"),
+    )
+    _detail_section = "general"
+
+
+class ClassicMobileDevice(Record):
+    """``/JSSResource/mobiledevices`` record (classic.json ``MobileDevice``, fields hand-listed in tools/generate_records.py)"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "device_name",
+        "udid",
+        "serial_number",
+        "phone_number",
+        "wifi_mac_address",
+        "managed",
+        "supervised",
+        "model",
+        "model_identifier",
+        "model_display",
+        "username",
+    )
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+        ("device_name", "device_name"),
+        ("udid", "udid"),
+        ("serial_number", "serial_number"),
+        ("phone_number", "phone_number"),
+        ("wifi_mac_address", "wifi_mac_address"),
+        ("managed", "managed"),
+        ("supervised", "supervised"),
+        ("model", "model"),
+        ("model_identifier", "model_identifier"),
+        ("model_display", "modelDisplay"),
+        ("username", "username"),
+    )
+    _sections = (
+        ("general", "general"),
+        ("location", "location"),
+        ("purchasing", "purchasing"),
+        ("applications", "applications"),
+        ("security_object", "security_object"),
+        ("network", "network"),
+        ("certificates", "certificates"),
+        ("configuration_profiles", "configuration_profiles"),
+        ("provisioning_profiles", "provisioning_profiles"),
+        ("mobile_device_groups", "mobile_device_groups"),
+        ("extension_attributes", "extension_attributes"),
+    )
+    _detail_section = "general"
+
+
+class ClassicPolicy(Record):
+    """``/JSSResource/policies`` record (classic.json ``Policy``, fields hand-listed in tools/generate_records.py)"""
+
+    __slots__ = (
+        "id",
+        "name",
+    )
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+    )
+    _sections = (
+        ("general", "general"),
+        ("scope", "scope"),
+        ("self_service", "self_service"),
+        ("package_configuration", "package_configuration"),
+        ("scripts", "scripts"),
+        ("printers", "printers"),
+        ("dock_items", "dock_items"),
+        ("account_maintenance", "account_maintenance"),
+        ("reboot", "reboot"),
+        ("maintenance", "maintenance"),
+        ("files_processes", "files_processes"),
+        ("user_interaction", "user_interaction"),
+        ("disk_encryption", "disk_encryption"),
+    )
+    _detail_section = "general"
+
+
+class ProScript(Record):
+    """``/api/v1/scripts`` record (pro.json ``Script``)"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "info",
+        "notes",
+        "priority",
+        "category_id",
+        "category_name",
+        "parameter4",
+        "parameter5",
+        "parameter6",
+        "parameter7",
+        "parameter8",
+        "parameter9",
+        "parameter10",
+        "parameter11",
+        "os_requirements",
+        "script_contents",
+    )
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+        ("info", "info"),
+        ("notes", "notes"),
+        ("priority", "priority"),
+        ("category_id", "categoryId"),
+        ("category_name", "categoryName"),
+        ("parameter4", "parameter4"),
+        ("parameter5", "parameter5"),
+        ("parameter6", "parameter6"),
+        ("parameter7", "parameter7"),
+        ("parameter8", "parameter8"),
+        ("parameter9", "parameter9"),
+        ("parameter10", "parameter10"),
+        ("parameter11", "parameter11"),
+        ("os_requirements", "osRequirements"),
+        ("script_contents", "scriptContents"),
+    )
+    _sections = ()
+
+
+class ProComputerInventory(Record):
+    """``/api/v1/computers-inventory`` record (pro.json ``ComputerInventory``)"""
+
+    __slots__ = (
+        "id",
+        "udid",
+    )
+    _fields = (
+        ("id", "id"),
+        ("udid", "udid"),
+    )
+    _sections = (
+        ("general", "general"),
+        ("disk_encryption", "diskEncryption"),
+        ("purchasing", "purchasing"),
+        ("applications", "applications"),
+        ("storage", "storage"),
+        ("user_and_location", "userAndLocation"),
+        ("configuration_profiles", "configurationProfiles"),
+        ("printers", "printers"),
+        ("services", "services"),
+        ("hardware", "hardware"),
+        ("local_user_accounts", "localUserAccounts"),
+        ("certificates", "certificates"),
+        ("attachments", "attachments"),
+        ("plugins", "plugins"),
+        ("package_receipts", "packageReceipts"),
+        ("fonts", "fonts"),
+        ("security", "security"),
+        ("operating_system", "operatingSystem"),
+        ("licensed_software", "licensedSoftware"),
+        ("ibeacons", "ibeacons"),
+        ("software_updates", "softwareUpdates"),
+        ("extension_attributes", "extensionAttributes"),
+        ("content_caching", "contentCaching"),
+        ("group_memberships", "groupMemberships"),
+    )
+
+
+class ProMobileDevice(Record):
+    """``/api/v2/mobile-devices`` record (pro.json ``MobileDeviceV2``)"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "serial_number",
+        "wifi_mac_address",
+        "udid",
+        "phone_number",
+        "model",
+        "model_identifier",
+        "username",
+        "type",
+        "management_id",
+        "software_update_device_id",
+    )
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+        ("serial_number", "serialNumber"),
+        ("wifi_mac_address", "wifiMacAddress"),
+        ("udid", "udid"),
+        ("phone_number", "phoneNumber"),
+        ("model", "model"),
+        ("model_identifier", "modelIdentifier"),
+        ("username", "username"),
+        ("type", "type"),
+        ("management_id", "managementId"),
+        ("software_update_device_id", "softwareUpdateDeviceId"),
+    )
+    _sections = ()
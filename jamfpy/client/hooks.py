@@ -0,0 +1,162 @@
+"""Structured request hooks and a built-in metrics collector for API.do."""
+
+import bisect
+import re
+import threading
+from urllib.parse import urlsplit
+
+from .cache import resource_of
+
+# Classic lookups whose next path segment is a value, not a resource: /computers/serialnumber/C02X...
+_KEYED_SEGMENTS = ("id", "name", "udid", "serialnumber", "macaddress", "userid", "username", "groupid", "groupname")
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$")
+
+# Upper bounds, in milliseconds, of the latency histogram buckets; the last bucket is unbounded.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def url_template(url: str) -> str:
+    """Path of url with ids and lookup values replaced, e.g. /JSSResource/computers/id/{id}"""
+    segments = urlsplit(url).path.split("/")
+    for i, segment in enumerate(segments):
+        if i and segments[i - 1] in _KEYED_SEGMENTS and segment:
+            segments[i] = f"{{{segments[i - 1]}}}"
+        elif _ID_SEGMENT.match(segment):
+            segments[i] = "{id}"
+    return "/".join(segments)
+
+
+class RequestEvent:  # pylint: disable=too-many-instance-attributes
+    """Everything known about one API.do call, handed to every hook.
+
+    Timings are in seconds: ``auth_secs`` (token check), ``prepare_secs``, ``send_secs`` (from the
+    rate limiter to the final response, throttle retries and their backoff included), the part of
+    it spent in ``rate_limit_secs`` and ``total_secs``. ``cache`` is ``"hit"`` when the response came from the
+    ResponseCache without a request, ``"revalidated"`` when a 304 was served from it, else None.
+    """
+
+    __slots__ = (
+        "api", "method", "url", "url_template", "endpoint", "status", "bytes_out", "bytes_in",
+        "attempts", "cache", "error", "auth_secs", "prepare_secs", "rate_limit_secs", "send_secs", "total_secs",
+    )
+
+    def __init__(self, api: str, method: str, url: str) -> None:
+        self.api = api
+        self.method = method
+        self.url = url
+        self.url_template = url_template(url)
+        self.endpoint = resource_of(url)
+        self.status = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.attempts = 0
+        self.cache = None
+        self.error = None
+        self.auth_secs = 0.0
+        self.prepare_secs = 0.0
+        self.rate_limit_secs = 0.0
+        self.send_secs = 0.0
+        self.total_secs = 0.0
+
+
+    def __repr__(self) -> str:
+        return f"<RequestEvent {self.method} {self.url_template} {self.status} {self.total_secs * 1000:.1f}ms>"
+
+
+class RequestHook:
+    """Base for objects passed as ``hooks=[...]``; override any of the three callbacks.
+
+    Hooks run on the calling thread, inline with the request, so keep them cheap. An exception
+    raised by a hook is logged and otherwise ignored.
+    """
+
+    def before_send(self, event: RequestEvent) -> None:
+        """Called once the request is authenticated and about to go out; a cache hit skips it"""
+
+
+    def after_receive(self, event: RequestEvent) -> None:
+        """Called with the final response's status, sizes and timings filled in"""
+
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when sending raised; ``event.error`` holds the exception, which is then re-raised"""
+
+
+class MetricsCollector(RequestHook):
+    """Aggregates requests per ``(method, url template)``: counts, statuses, bytes, time spent
+    in each phase, and a latency histogram over ``LATENCY_BUCKETS_MS``.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+
+
+    def _record(self, event: RequestEvent) -> None:
+        key = (event.method, event.url_template)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    "endpoint": event.endpoint, "count": 0, "errors": 0, "cache_hits": 0, "statuses": {},
+                    "bytes_in": 0, "bytes_out": 0, "auth_secs": 0.0, "prepare_secs": 0.0,
+                    "rate_limit_secs": 0.0, "send_secs": 0.0, "total_secs": 0.0,
+                    "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                }
+
+            stats["count"] += 1
+            stats["errors"] += event.error is not None
+            stats["cache_hits"] += event.cache is not None
+            stats["statuses"][event.status] = stats["statuses"].get(event.status, 0) + 1
+            stats["bytes_in"] += event.bytes_in
+            stats["bytes_out"] += event.bytes_out
+            for phase in ("auth_secs", "prepare_secs", "rate_limit_secs", "send_secs", "total_secs"):
+                stats[phase] += getattr(event, phase)
+            stats["histogram"][bisect.bisect_left(LATENCY_BUCKETS_MS, event.total_secs * 1000)] += 1
+
+
+    def after_receive(self, event: RequestEvent) -> None:
+        self._record(event)
+
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._record(event)
+
+
+    def snapshot(self) -> dict:
+        """Copy of the stats, keyed by ``"METHOD /url/template"``"""
+        with self._lock:
+            return {
+                f"{method} {template}": {**stats, "statuses": dict(stats["statuses"]), "histogram": list(stats["histogram"])}
+                for (method, template), stats in self._stats.items()
+            }
+
+
+    @staticmethod
+    def percentile(stats: dict, fraction: float) -> float:
+        """Upper bound in ms of the histogram bucket holding the given fraction of requests"""
+        target, seen = fraction * stats["count"], 0
+        for bound, count in zip(LATENCY_BUCKETS_MS + (float("inf"),), stats["histogram"]):
+            seen += count
+            if seen >= target and count:
+                return bound
+        return 0.0
+
+
+    def summary(self) -> str:
+        """Table of every template, slowest total time first"""
+        rows = sorted(self.snapshot().items(), key=lambda item: item[1]["total_secs"], reverse=True)
+        lines = [f"{'request':<60} {'count':>6} {'err':>4} {'total s':>8} {'send s':>7} {'wait s':>7} {'p50 ms':>7} {'p95 ms':>7}"]
+        for name, stats in rows:
+            lines.append(
+                f"{name[:60]:<60} {stats['count']:>6} {stats['errors']:>4} {stats['total_secs']:>8.2f} "
+                f"{stats['send_secs']:>7.2f} {stats['rate_limit_secs']:>7.2f} "
+                f"{self.percentile(stats, 0.5):>7} {self.percentile(stats, 0.95):>7}"
+            )
+        return "\n".join(lines)
+
+
+    def reset(self) -> None:
+        """Drops everything collected so far"""
+        with self._lock:
+            self._stats.clear()
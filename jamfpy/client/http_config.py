@@ -1,14 +1,72 @@
 """HTTP configuration module for managing API request settings and configurations."""
 
-from .constants import DEFAULT_HTTP_CONFIG_URLS, DEFAULT_HTTP_CONFIG_HEADERS
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from .constants import (
+    DEFAULT_HTTP_CONFIG_URLS,
+    DEFAULT_HTTP_CONFIG_HEADERS,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TRANSPORT_RETRIES,
+    DEFAULT_THROTTLE_RETRIES,
+    DEFAULT_BACKOFF_BASE_SECS,
+    DEFAULT_BACKOFF_MAX_SECS
+)
 
 class HTTPConfig:
-    """Configuration class for managing HTTP request settings, URLs, and headers for Jamf Pro API interactions."""
+    """Configuration class for managing HTTP request settings, URLs, and headers for Jamf Pro API interactions.
+
+    The pool settings shape the transport shared by a tenant's auth and API traffic:
+    pool_connections is the number of per-host pools kept, pool_maxsize the keep-alive
+    connections held per host, pool_block whether a request waits for a free connection
+    instead of opening a throwaway one, and max_retries urllib3's connection-level retries.
+
+    The throttle settings govern API.do's handling of 429/503 responses: up to throttle_retries
+    resends, each after the server's Retry-After or a jittered exponential backoff of
+    backoff_base_secs doubling per attempt, capped at backoff_max_secs.
+    """
 
     def __init__(
             self,
             urls: dict = None,
-            headers: dict = None
+            headers: dict = None,
+            *,
+            pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+            pool_block: bool = False,
+            max_retries: int = DEFAULT_TRANSPORT_RETRIES,
+            throttle_retries: int = DEFAULT_THROTTLE_RETRIES,
+            backoff_base_secs: float = DEFAULT_BACKOFF_BASE_SECS,
+            backoff_max_secs: float = DEFAULT_BACKOFF_MAX_SECS,
     ):
         self.urls = urls or DEFAULT_HTTP_CONFIG_URLS
         self.headers = headers or DEFAULT_HTTP_CONFIG_HEADERS
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+        self.throttle_retries = throttle_retries
+        self.backoff_base_secs = backoff_base_secs
+        self.backoff_max_secs = backoff_max_secs
+
+
+    def new_adapter(self, pool_maxsize: int = None) -> HTTPAdapter:
+        """Returns an HTTPAdapter built from the pool settings, optionally widened to pool_maxsize"""
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=max(self.pool_maxsize, pool_maxsize or 0),
+            pool_block=self.pool_block,
+            max_retries=self.max_retries
+        )
+
+
+    def new_session(self, pool_maxsize: int = None) -> Session:
+        """Returns a Session with the configured adapter mounted for http and https, optionally
+        widened to pool_maxsize
+        """
+        session = Session()
+        adapter = self.new_adapter(pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
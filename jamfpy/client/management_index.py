@@ -0,0 +1,198 @@
+"""Maps serial numbers, names, udids and Classic ids to MDM management ids."""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from .constants import DEFAULT_INDEX_PAGE_SIZE, DEFAULT_MAX_WORKERS, INDEX_REFRESH_OVERLAP_SECS
+from .store import DiskStore
+
+# Lookup kinds, in the order resolve() reports them; ids are kept per device type as they overlap.
+IDENTIFIER_KINDS = ("management_id", "serial", "udid", "name", "computer_id", "mobile_device_id")
+# Matched when no kind is given; Classic ids are left out, as computer 5 and mobile device 5 both exist.
+_DEFAULT_KINDS = ("management_id", "serial", "udid", "name")
+_COMPUTER_FIELDS = ["id", "udid", "general.name", "general.managementId", "hardware.serialNumber"]
+_NAMESPACE = "management-index"
+
+
+def _computer_entry(record: dict) -> dict:
+    general, hardware = record.get("general") or {}, record.get("hardware") or {}
+    return {"id": str(record.get("id")), "management_id": general.get("managementId"), "name": general.get("name"),
+            "serial": hardware.get("serialNumber"), "udid": record.get("udid")}
+
+
+def _mobile_device_entry(record: dict) -> dict:
+    return {"id": str(record.get("id")), "management_id": record.get("managementId"), "name": record.get("name"),
+            "serial": record.get("serialNumber"), "udid": record.get("udid")}
+
+
+class ManagementIdIndex:
+    """O(1) lookup of a device's managementId from any identifier people actually have.
+
+    ``load`` lists the whole fleet once (computers-inventory with the GENERAL and HARDWARE sections,
+    projected to five fields, and the v2 mobile-devices list), or reads it back from ``store`` when
+    a copy younger than ``max_age`` seconds is there. ``refresh`` re-reads only computers that
+    reported since the last load, plus the (cheap) mobile device list. A lookup that misses
+    triggers one refresh before giving up, so newly enrolled devices resolve without a reload.
+    """
+
+    def __init__(
+            self,
+            pro_api,
+            store: DiskStore = None,
+            *,
+            max_age: float = None,
+            page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self._api = pro_api
+        self._store = store
+        self.max_age = max_age
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.loaded_at = None
+        self._devices: dict[str, dict[str, dict]] = {"computers": {}, "mobile_devices": {}}
+        self._lookup: dict[str, dict[str, str | None]] = {kind: {} for kind in IDENTIFIER_KINDS}
+        self._lock = threading.RLock()
+
+
+    def __len__(self) -> int:
+        return len(self._devices["computers"]) + len(self._devices["mobile_devices"])
+
+
+    def _rebuild(self) -> None:
+        """Recomputes the lookups; a value shared by two devices maps to None (ambiguous)"""
+        lookup = {kind: {} for kind in IDENTIFIER_KINDS}
+        for device_type, devices in self._devices.items():
+            id_kind = "computer_id" if device_type == "computers" else "mobile_device_id"
+            for entry in devices.values():
+                management_id = entry["management_id"]
+                if not management_id:
+                    continue
+                keys = {"management_id": management_id, "serial": (entry["serial"] or "").upper(),
+                        "udid": (entry["udid"] or "").upper(), "name": entry["name"], id_kind: entry["id"]}
+                for kind, key in keys.items():
+                    if key:
+                        known = lookup[kind].get(key, management_id)
+                        lookup[kind][key] = management_id if known == management_id else None
+        self._lookup = lookup
+
+
+    def _persist(self) -> None:
+        if self._store is None:
+            return
+        for device_type, devices in self._devices.items():
+            self._store.replace_all(f"{_NAMESPACE}:{device_type}", devices)
+        self._store.put(_NAMESPACE, "meta", {"loaded_at": self.loaded_at})
+
+
+    def _from_store(self) -> bool:
+        if self._store is None:
+            return False
+        computers = self._store.get_all(f"{_NAMESPACE}:computers", self.max_age)
+        mobile_devices = self._store.get_all(f"{_NAMESPACE}:mobile_devices", self.max_age)
+        meta = self._store.get(_NAMESPACE, "meta")
+        if computers is None or mobile_devices is None or meta is None:
+            return False
+
+        self._devices = {"computers": {e["id"]: e for e in computers}, "mobile_devices": {e["id"]: e for e in mobile_devices}}
+        self.loaded_at = meta["loaded_at"]
+        return True
+
+
+    def _fetch_computers(self, since: float = None) -> dict[str, dict]:
+        filter_query = None
+        if since is not None:
+            moment = datetime.fromtimestamp(since - INDEX_REFRESH_OVERLAP_SECS, timezone.utc)
+            filter_query = f"general.reportDate=ge={moment.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+
+        resp = self._api.computers_inventory.get_all(
+            self.page_size, max_workers=self.max_workers, filter_query=filter_query,
+            sections=["GENERAL", "HARDWARE"], fields=_COMPUTER_FIELDS
+        )
+        entries = (_computer_entry(record) for record in resp.json().get("results", []))
+        return {entry["id"]: entry for entry in entries}
+
+
+    def _fetch_mobile_devices(self) -> dict[str, dict]:
+        resp = self._api.mobile_devices.get_all(self.page_size, max_workers=self.max_workers)
+        entries = (_mobile_device_entry(record) for record in resp.json().get("results", []))
+        return {entry["id"]: entry for entry in entries}
+
+
+    def load(self, force: bool = False) -> int:
+        """Bulk-loads the fleet, from the store when it holds a fresh copy. Returns the device count"""
+        with self._lock:
+            if force or not self._from_store():
+                started = time.time()
+                self._devices = {"computers": self._fetch_computers(), "mobile_devices": self._fetch_mobile_devices()}
+                self.loaded_at = started
+                self._persist()
+            self._rebuild()
+            return len(self)
+
+
+    def refresh(self) -> int:
+        """Adds or updates computers that reported since the last load and relists mobile devices.
+
+        Computers deleted from Jamf Pro stay until the next ``load(force=True)``. Returns the
+        number of computer records re-read.
+        """
+        with self._lock:
+            if self.loaded_at is None:
+                self.load()
+                return len(self._devices["computers"])
+
+            started = time.time()
+            changed = self._fetch_computers(since=self.loaded_at)
+            self._devices["computers"].update(changed)
+            self._devices["mobile_devices"] = self._fetch_mobile_devices()
+            self.loaded_at = started
+            self._persist()
+            self._rebuild()
+            return len(changed)
+
+
+    def _candidates(self, identifier, kind: str = None) -> set:
+        key = str(identifier)
+        kinds = _DEFAULT_KINDS if kind is None else (kind,)
+        found = set()
+        for each in kinds:
+            lookup_key = key.upper() if each in ("serial", "udid") else key
+            if lookup_key in self._lookup[each]:
+                found.add(self._lookup[each][lookup_key])
+        return found
+
+
+    def resolve(self, identifier, kind: str = None) -> str:
+        """Management id of the one device identifier names; see ``resolve_many``"""
+        return self.resolve_many([identifier], kind=kind)[0]
+
+
+    def resolve_many(self, identifiers, kind: str = None) -> list[str]:
+        """Management ids for identifiers, in order.
+
+        Each identifier may be a management id, serial number, udid or device name. Classic ids
+        only match with ``kind="computer_id"`` or ``"mobile_device_id"``; pass ``kind`` (one of
+        ``IDENTIFIER_KINDS``) to only match that field. Serials and udids
+        are case-insensitive. Raises KeyError naming every identifier that matches no device, or
+        more than one, after one ``refresh`` to pick up devices enrolled since the last load.
+        """
+        if kind is not None and kind not in IDENTIFIER_KINDS:
+            raise KeyError(f"Invalid identifier kind {kind!r}, expected one of {IDENTIFIER_KINDS}")
+
+        if self.loaded_at is None:
+            self.load()
+
+        identifiers = identifiers if isinstance(identifiers, list) else [identifiers]
+        matches = [self._candidates(identifier, kind) for identifier in identifiers]
+
+        if any(not found for found in matches):
+            self.refresh()
+            matches = [self._candidates(identifier, kind) for identifier in identifiers]
+
+        unresolved = [identifier for identifier, found in zip(identifiers, matches) if len(found) != 1 or None in found]
+        if unresolved:
+            raise KeyError(f"No single device matches {unresolved}")
+
+        return [found.pop() for found in matches]
@@ -0,0 +1,106 @@
+"""Fan-out of the same work across many Jamf Pro tenants."""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+
+from .tenant import Tenant, warm_tenants
+from .rate_limit import RateLimiter
+from .constants import DEFAULT_TENANT_POOL_WORKERS
+from .exceptions import JamfpyConfigError
+
+
+class TenantPool:
+    """Holds many Tenants and runs the same call against all of them concurrently.
+
+    Every tenant gets its own thread (up to ``max_workers``), so a cross-tenant audit takes about
+    as long as the slowest tenant. Results come back keyed by fqdn, in the order tenants were
+    added; a tenant whose call raised has the exception as its result, and the others are
+    unaffected. With ``rate_limit`` set, each tenant without a limiter of its own gets a separate
+    RateLimiter at that many requests per second, so one busy tenant never slows another.
+    """
+
+    def __init__(
+            self,
+            tenants: list[Tenant] = None,
+            *,
+            max_workers: int = DEFAULT_TENANT_POOL_WORKERS,
+            rate_limit: float = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self._tenants: dict[str, Tenant] = {}
+
+        for tenant in tenants or []:
+            self.add(tenant)
+
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+
+    def __iter__(self):
+        return iter(self._tenants.values())
+
+
+    def __getitem__(self, fqdn: str) -> Tenant:
+        return self._tenants[fqdn]
+
+
+    def __str__(self) -> str:
+        return f"TenantPool of {len(self)} tenants"
+
+
+    def add(self, tenant: Tenant) -> None:
+        """Adds a tenant, giving it its own rate limiter if the pool has a rate_limit"""
+        if tenant.fqdn in self._tenants:
+            raise JamfpyConfigError(f"tenant already in pool: {tenant.fqdn}")
+
+        if self.rate_limit is not None and tenant.rate_limiter is None:
+            limiter = RateLimiter(self.rate_limit)
+            tenant.rate_limiter = tenant.classic.rate_limiter = tenant.pro.rate_limiter = limiter
+
+        self._tenants[tenant.fqdn] = tenant
+
+
+    def remove(self, fqdn: str) -> Tenant:
+        """Removes and returns the tenant for fqdn"""
+        return self._tenants.pop(fqdn)
+
+
+    def run(self, func, *args, **kwargs) -> dict:
+        """Calls ``func(tenant, *args, **kwargs)`` for every tenant concurrently.
+
+        Returns ``{fqdn: result | Exception}``.
+        """
+        def call(tenant: Tenant):
+            try:
+                return func(tenant, *args, **kwargs)
+            # Isolating one tenant's failure from the rest is the point of the pool.
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return e
+
+        if not self._tenants:
+            return {}
+
+        with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(self._tenants)),
+                thread_name_prefix="jamfpy-pool"
+        ) as executor:
+            return dict(zip(self._tenants, executor.map(call, self._tenants.values())))
+
+
+    def call(self, path: str, *args, **kwargs) -> dict:
+        """Calls the same endpoint method on every tenant, named by its dotted path from the tenant.
+
+        e.g. ``pool.call("classic.computer_groups.get_all")`` or
+        ``pool.call("pro.scripts.get_by_id", 3)``. Returns ``{fqdn: Response | Exception}``.
+        """
+        def call(tenant: Tenant):
+            return reduce(getattr, path.split("."), tenant)(*args, **kwargs)
+
+        return self.run(call)
+
+
+    def warm(self) -> dict:
+        """Fetches every tenant's token in parallel; see ``warm_tenants``"""
+        return warm_tenants(list(self._tenants.values()), max_workers=self.max_workers)
@@ -0,0 +1,70 @@
+"""Client-side rate limiting for Jamf Pro API traffic."""
+
+import threading
+import time
+
+from .constants import RATE_LIMIT_DECREASE_FACTOR, RATE_LIMIT_INCREASE_FRACTION
+
+
+class RateLimiter:
+    """Thread-safe, adaptive token bucket shared by every API client of a tenant.
+
+    Requests draw one token each; tokens refill at ``rate`` per second up to ``burst``. When
+    adaptive, the refill rate halves each time the server throttles (429/503) and creeps back
+    up by a small fraction of ``rate`` on every success, so the client settles just under the
+    highest throughput the tenant will sustain.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            *,
+            burst: int = None,
+            min_rate: float = None,
+            adaptive: bool = True,
+    ) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 20
+        self.capacity = burst or max(1, int(rate))
+        self.adaptive = adaptive
+
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+
+    def __str__(self) -> str:
+        return f"RateLimiter at {self.rate:.2f}/s (max {self.max_rate}/s, burst {self.capacity})"
+
+
+    def acquire(self) -> float:
+        """Takes one token, sleeping until it is available. Returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token up front (the bucket may go negative) so waiters queue fairly
+            # without holding the lock while they sleep.
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+
+    def on_success(self) -> None:
+        """Additive increase back towards max_rate"""
+        if self.adaptive and self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * RATE_LIMIT_INCREASE_FRACTION)
+
+
+    def on_throttled(self) -> None:
+        """Multiplicative decrease after the server pushed back"""
+        if self.adaptive:
+            with self._lock:
+                self.rate = max(self.min_rate, self.rate * RATE_LIMIT_DECREASE_FACTOR)
@@ -0,0 +1,122 @@
+"""Compact, slotted record classes for holding large inventories in memory."""
+
+import json
+import zlib
+from typing import Iterable
+
+from requests import Response
+
+from .constants import RECORD_COMPRESS_MIN_BYTES
+
+# First byte of a zlib stream; JSON text never starts with "x", so packed values are told apart by it.
+_ZLIB_HEADER = 0x78
+
+
+def _pack(value) -> bytes:
+    packed = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(packed, 1) if len(packed) >= RECORD_COMPRESS_MIN_BYTES else packed
+
+
+def _unpack(value):
+    if not isinstance(value, bytes):
+        return value
+    return json.loads(zlib.decompress(value) if value[0] == _ZLIB_HEADER else value)
+
+
+class Record:
+    """Base of the generated record classes in ``generated_records.py``.
+
+    Scalar fields named in the schema live in ``__slots__`` under snake_case names; everything
+    else (nested sections such as ``general`` or ``disk_encryption``, and fields the schema doesn't
+    know, reachable by their JSON key) is kept as compact JSON bytes, zlib-compressed from
+    ``RECORD_COMPRESS_MIN_BYTES`` up, and decoded only when read. A decoded section is not
+    cached, so holding 50k records costs roughly their compressed size rather than that of the
+    nested dicts. ``to_dict`` gives back the original JSON shape.
+    """
+
+    __slots__ = ("_packed",)
+
+    # (attribute, JSON key) for every slotted field; set by each generated class.
+    _fields: tuple[tuple[str, str], ...] = ()
+    # (attribute, JSON key) for every nested section the schema documents, decoded on access.
+    _sections: tuple[tuple[str, str], ...] = ()
+    # Section a detail body nests its identifiers in (Classic ``general``); slots are read from it.
+    _detail_section: str = None
+    _keys: frozenset = frozenset()
+    _section_keys: dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._keys = frozenset(key for _, key in cls._fields)
+        cls._section_keys = dict(cls._sections)
+
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Record":
+        """Builds a record from one decoded JSON object: a list record, or a detail body"""
+        record = cls.__new__(cls)
+        detail = cls._detail_section is not None and isinstance(data.get(cls._detail_section), dict)
+        source = data[cls._detail_section] if detail else data
+        for attribute, key in cls._fields:
+            object.__setattr__(record, attribute, source.get(key))
+
+        # A detail body is kept whole; its identifiers are copies of what its section holds.
+        packed = {
+            key: _pack(value) if isinstance(value, (dict, list)) else value
+            for key, value in data.items() if detail or key not in cls._keys
+        }
+        object.__setattr__(record, "_packed", packed or None)
+        return record
+
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> list:
+        """Builds a record from each dict, e.g. from ``iter_all()`` so only one page is decoded at once"""
+        return [cls.from_dict(data) for data in records]
+
+
+    @classmethod
+    def from_response(cls, response: Response, key: str = None) -> list:
+        """Records of a Response: its ``results`` (Pro lists), or ``response.json()[key]`` (Classic,
+        e.g. ``"computers"`` for a list or ``"computer"`` for a single record)
+        """
+        body = response.json()
+        data = body[key] if key is not None else body.get("results", [])
+        return cls.from_records([data] if isinstance(data, dict) else data)
+
+
+    def __getattr__(self, name: str):
+        # Only reached when no slot matches: look in the packed sections.
+        try:
+            packed = object.__getattribute__(self, "_packed")
+        except AttributeError:
+            packed = None
+
+        key = type(self)._section_keys.get(name, name)
+        if packed and key in packed:
+            return _unpack(packed[key])
+        if name in type(self)._section_keys:
+            return None
+        raise AttributeError(f"{type(self).__name__!r} record has no field {name!r}")
+
+
+    def to_dict(self) -> dict:
+        """The record in its original JSON shape"""
+        packed = self._packed or {}
+        detail = self._detail_section is not None and self._detail_section in packed
+        data = {} if detail else {key: getattr(self, attribute) for attribute, key in self._fields}
+        for key, value in packed.items():
+            data[key] = _unpack(value)
+        return data
+
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other.to_dict() == self.to_dict()
+
+
+    __hash__ = None
+
+
+    def __repr__(self) -> str:
+        shown = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute, _ in self._fields[:3])
+        return f"{type(self).__name__}({shown})"
@@ -0,0 +1,88 @@
+"""Background token renewal for Auth objects."""
+
+import threading
+import time
+
+from requests import RequestException
+
+from .exceptions import JamfAuthError
+from .utility import extract_cloud_tenant_name_from_url
+from .constants import DEFAULT_RENEWAL_LEAD_SECS, RENEWAL_RETRY_SECS
+
+
+class TokenRenewalMixin:
+    """Renews an Auth's token on a daemon thread ahead of its buffer window.
+
+    Relies on the Auth's ``_token_lock``, ``_renewal_thread``/``_renewal_stop`` state and
+    token methods; kept apart from auth.py only to keep that module readable.
+    """
+
+    def start_background_renewal(self, lead_secs: int = DEFAULT_RENEWAL_LEAD_SECS) -> None:
+        """
+        Starts a daemon thread that renews the token lead_secs before it would
+        enter the token_exp_thold_mins buffer, so requests never pay for a refresh.
+        No-op if a renewer is already running.
+        """
+        if self._renewal_thread is not None and self._renewal_thread.is_alive():
+            return
+
+        self._renewal_stop.clear()
+        self._renewal_thread = threading.Thread(
+            target=self._renewal_loop,
+            args=(lead_secs,),
+            name=f"jamfpy-token-renewal-{extract_cloud_tenant_name_from_url(self._fqdn)}",
+            daemon=True
+        )
+        self._renewal_thread.start()
+        self._logger.debug("Background token renewal started (lead: %ss)", lead_secs)
+
+
+    def stop_background_renewal(self, timeout: float = None) -> None:
+        """Stops the background renewer, if running, and waits for it to exit"""
+        self._renewal_stop.set()
+        thread, self._renewal_thread = self._renewal_thread, None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            self._logger.debug("Background token renewal stopped")
+
+
+    def _renewal_loop(self, lead_secs: int) -> None:
+        """Sleeps until the renewal point, renews, repeats until stopped"""
+        renewed_at = None
+        while not self._renewal_stop.is_set():
+            delay = self._renewal_due_at(lead_secs, renewed_at) - time.time()
+
+            if delay > 0:
+                # Wake at the renewal point (or on stop) and re-evaluate; a request may
+                # have refreshed the token in the meantime.
+                self._renewal_stop.wait(delay)
+                continue
+
+            try:
+                with self._token_lock:
+                    if time.time() >= self._renewal_due_at(lead_secs, renewed_at):
+                        self._renew_token()
+                        renewed_at = time.time()
+
+            except (JamfAuthError, RequestException) as e:
+                self._logger.warning("Background token renewal failed, retrying in %ss: %s", RENEWAL_RETRY_SECS, e)
+                self._renewal_stop.wait(RENEWAL_RETRY_SECS)
+
+
+    def _renewal_due_at(self, lead_secs: int, renewed_at: float = None) -> float:
+        """Timestamp at which the background renewer should refresh the current token"""
+        due = self.token_expiry - self.token_exp_thold_mins * 60 - lead_secs
+        if renewed_at is not None:
+            # A token living less than the buffer plus the lead is due the moment it is issued;
+            # renew those at half their remaining life, and never sooner than RENEWAL_RETRY_SECS.
+            due = max(due, renewed_at + (self.token_expiry - renewed_at) / 2, renewed_at + RENEWAL_RETRY_SECS)
+        return due
+
+
+    def _renew_token(self) -> None:
+        """Refreshes the token the cheapest way the auth method allows"""
+        if self._method == "bearer" and self._token_str and not self.check_token_is_expired():
+            self._fetch_token(self._keep_alive_token)
+        else:
+            self.fetch_token()
@@ -0,0 +1,156 @@
+"""Persistent SQLite store of tenant objects for fast cold starts."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    namespace TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    resource TEXT,
+    body TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (namespace, record_id)
+);
+CREATE TABLE IF NOT EXISTS collections (
+    namespace TEXT PRIMARY KEY,
+    resource TEXT,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+
+class DiskStore:
+    """Thread-safe SQLite store of API records, one file per tenant.
+
+    Records are grouped by ``namespace`` (one per endpoint collection, plus one for records
+    fetched individually by id) and tagged with the API ``resource`` they came from, so a write
+    to that resource can expire them. Every read takes a ``max_age`` in seconds; ``None`` accepts
+    any age short of an expiry. Pass ``":memory:"`` for a process-local store.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = str(path) if str(path) == ":memory:" else str(Path(path).expanduser())
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                # Readers in other processes don't block the writer refreshing the store.
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+
+    def __str__(self) -> str:
+        return f"DiskStore at {self.path}"
+
+
+    @staticmethod
+    def _fresh(stored_at: float, max_age: float | None) -> bool:
+        if stored_at <= 0:
+            return False
+        return max_age is None or time.time() - stored_at <= max_age
+
+
+    def get_all(self, namespace: str, max_age: float | None = None) -> list[dict] | None:
+        """Returns every record of a collection, or None if it was never stored or is too old"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at FROM collections WHERE namespace = ?", (namespace,)
+            ).fetchone()
+
+            if row is None or not self._fresh(row[0], max_age):
+                return None
+
+            rows = self._conn.execute(
+                "SELECT body FROM records WHERE namespace = ? ORDER BY rowid", (namespace,)
+            ).fetchall()
+
+        return [json.loads(body) for (body,) in rows]
+
+
+    def replace_all(self, namespace: str, records: dict[str, dict], resource: str = None) -> int:
+        """Makes a collection hold exactly records, keyed by id.
+
+        Only records whose body changed are rewritten, and ids no longer present are deleted.
+        Returns the number of records inserted, updated or deleted.
+        """
+        now = time.time()
+        bodies = {str(record_id): json.dumps(record, sort_keys=True) for record_id, record in records.items()}
+
+        with self._lock, self._conn:
+            stored = dict(self._conn.execute(
+                "SELECT record_id, body FROM records WHERE namespace = ?", (namespace,)
+            ).fetchall())
+
+            changed = [(namespace, rid, resource, body, now) for rid, body in bodies.items() if stored.get(rid) != body]
+            removed = [(namespace, rid) for rid in stored if rid not in bodies]
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (namespace, record_id, resource, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                changed
+            )
+            self._conn.executemany("DELETE FROM records WHERE namespace = ? AND record_id = ?", removed)
+            self._conn.execute(
+                "UPDATE records SET stored_at = ? WHERE namespace = ?", (now, namespace)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO collections (namespace, resource, refreshed_at) VALUES (?, ?, ?)",
+                (namespace, resource, now)
+            )
+
+        return len(changed) + len(removed)
+
+
+    def get(self, namespace: str, record_id, max_age: float | None = None) -> dict | None:
+        """Returns one record, or None if it was never stored or is too old"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM records WHERE namespace = ? AND record_id = ?",
+                (namespace, str(record_id))
+            ).fetchone()
+
+        if row is None or not self._fresh(row[1], max_age):
+            return None
+
+        return json.loads(row[0])
+
+
+    def put(self, namespace: str, record_id, record: dict, resource: str = None) -> None:
+        """Stores or replaces one record"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO records (namespace, record_id, resource, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (namespace, str(record_id), resource, json.dumps(record, sort_keys=True), time.time())
+            )
+
+
+    def expire(self, resource: str) -> None:
+        """Marks everything fetched from resource as stale, keeping it for incremental refresh"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE records SET stored_at = 0 WHERE resource = ?", (resource,))
+            self._conn.execute("UPDATE collections SET refreshed_at = 0 WHERE resource = ?", (resource,))
+
+
+    def clear(self, namespace: str = None) -> None:
+        """Deletes a namespace, or everything when namespace is None"""
+        with self._lock, self._conn:
+            if namespace is None:
+                self._conn.execute("DELETE FROM records")
+                self._conn.execute("DELETE FROM collections")
+                return
+
+            self._conn.execute("DELETE FROM records WHERE namespace = ?", (namespace,))
+            self._conn.execute("DELETE FROM collections WHERE namespace = ?", (namespace,))
+
+
+    def close(self) -> None:
+        """Closes the underlying connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,183 @@
+"""Incremental inventory sync for Computers and MobileDevices."""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import NamedTuple
+
+from requests import Response
+
+from .constants import DEFAULT_MAX_WORKERS, DEFAULT_SYNC_PAGE_SIZE
+from .exceptions import JamfAPIError
+from .store import DiskStore
+
+# Fields of a list record that change whenever the device reports in, most specific first.
+_MARKER_FIELDS = ("report_date_epoch", "last_inventory_update_epoch", "report_date_utc", "last_inventory_update_utc")
+_REPORT_EPOCH_FIELDS = ("report_date_epoch", "last_inventory_update_epoch")
+
+
+class SyncEvent(NamedTuple):
+    """One change found by a sync.
+
+    ``action`` is ``"upsert"`` (``record`` is the decoded get_by_id body), ``"delete"`` (``record`` is
+    None) or ``"error"`` (``record`` is the failed Response or exception; the record is retried on
+    the next sync).
+    """
+    action: str
+    record_id: int
+    record: object = None
+
+
+def _digest(body) -> str:
+    return hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()
+
+
+def _marker(record: dict) -> str:
+    """Cheapest available change marker for a list record: a report date, else a hash of the record."""
+    for field in _MARKER_FIELDS:
+        if record.get(field):
+            return f"{field}:{record[field]}"
+    return f"sha256:{_digest(record)}"
+
+
+def _epoch_ms(since: datetime | float) -> float:
+    return since.timestamp() * 1000 if isinstance(since, datetime) else since * 1000
+
+
+def _iso_epoch_ms(value: str) -> float | None:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000
+    except (AttributeError, ValueError):
+        return None
+
+
+def _pro_mobile_device_record(record: dict) -> dict:
+    """A Pro mobile device detail record, reduced to the id and report date a Classic list record would carry"""
+    updated = (record.get("general") or {}).get("lastInventoryUpdateDate")
+    return {"id": int(record["mobileDeviceId"]), "last_inventory_update_utc": updated,
+            "last_inventory_update_epoch": _iso_epoch_ms(updated) if updated else None}
+
+
+class InventorySync:
+    """Finds what changed in a tenant's device inventory since the last sync.
+
+    Each sync lists the collection once (``/computers/subset/basic`` carries report dates), compares
+    every device's marker with the one stored by the previous sync, and fetches full records only
+    for new or changed devices. A device whose full record hashes the same as last time is not
+    reported. State lives in ``store`` (the tenant's DiskStore, or a process-local one) and is only
+    written once a sync has been consumed to the end, so an interrupted run is simply repeated.
+
+    The Classic ``/mobiledevices`` list has no report date, so mobile devices are listed through
+    the Pro API's ``/v2/mobile-devices/detail`` (``lastInventoryUpdateDate``) when ``pro_api`` is
+    given. Without it their marker is a hash of the list record, which only changes with the list
+    fields (name, udid, serial, model...), not with OS, app, location or EA changes.
+    """
+
+    def __init__(self, classic_api, store: DiskStore = None, pro_api=None) -> None:
+        self._api = classic_api
+        self._store = store
+        self._pro = pro_api
+
+
+    @property
+    def store(self) -> DiskStore:
+        """The backing store, opened on first use when the tenant has none"""
+        if self._store is None:
+            self._store = DiskStore()
+        return self._store
+
+
+    def computers(self, since: datetime | float = None, **kwargs):
+        """Yields SyncEvents for computers; see ``changes``"""
+        return self.changes(self._api.computers, subset="basic", since=since, **kwargs)
+
+
+    def mobile_devices(self, since: datetime | float = None, **kwargs):
+        """Yields SyncEvents for mobile devices; see ``changes`` and the class notes on markers"""
+        if self._pro is None:
+            return self.changes(self._api.mobile_devices, since=since, **kwargs)
+
+        details = self._pro.mobile_devices.details.iter_all(
+            DEFAULT_SYNC_PAGE_SIZE, sections=["GENERAL"], fields=["mobileDeviceId", "general.lastInventoryUpdateDate"]
+        )
+        listing = (_pro_mobile_device_record(record) for record in details)
+        return self.changes(self._api.mobile_devices, since=since, listing=listing, **kwargs)
+
+
+    def changes(
+            self,
+            endpoint,
+            *,
+            subset: str = None,
+            since: datetime | float = None,
+            sections: list[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            listing=None,
+    ):
+        """Yields a SyncEvent for every record of a Classic endpoint that changed since the last sync.
+
+        ``since`` (a datetime or epoch seconds) additionally treats devices whose report date is
+        not after it as unchanged, which keeps a first sync from fetching the whole fleet.
+        ``sections`` limits the fetched records to those subsets. ``listing`` replaces the
+        endpoint's own list with other ``{"id", <marker fields>}`` records.
+        """
+        namespace = f"sync:{endpoint.name()}"
+        previous = {str(state["id"]): state for state in self.store.get_all(namespace) or []}
+
+        if listing is None:
+            resp = endpoint.get_all(subset=subset) if subset else endpoint.get_all()
+            if not resp.ok:
+                raise JamfAPIError(f"sync of {endpoint.name()} failed to list: {resp.status_code}")
+            listing = resp.json().get(endpoint.name(), [])
+
+        current, changed = {}, []
+        cutoff = _epoch_ms(since) if since is not None else None
+
+        for record in listing:
+            record_id, marker = str(record["id"]), _marker(record)
+            state = previous.get(record_id)
+
+            if state is not None and state["marker"] == marker:
+                current[record_id] = state
+                continue
+
+            current[record_id] = {"id": record["id"], "marker": marker, "hash": state["hash"] if state else None}
+            report_date = next((record[field] for field in _REPORT_EPOCH_FIELDS if record.get(field)), None)
+            if cutoff is None or not report_date or report_date > cutoff:
+                changed.append(record["id"])
+
+        details = endpoint.get_by_ids(changed, max_workers=max_workers, sections=sections) if changed else {}
+
+        for record_id, result in details.items():
+            state = current[str(record_id)]
+
+            if not isinstance(result, Response) or not result.ok:
+                # Forget the new marker so the record is fetched again next time.
+                if str(record_id) in previous:
+                    current[str(record_id)] = previous[str(record_id)]
+                else:
+                    del current[str(record_id)]
+                yield SyncEvent("error", record_id, result)
+                continue
+
+            body = result.json()
+            digest = _digest(body)
+            if digest != state["hash"]:
+                state["hash"] = digest
+                yield SyncEvent("upsert", record_id, body)
+
+        for record_id, state in previous.items():
+            if record_id not in current:
+                yield SyncEvent("delete", state["id"])
+
+        self.store.replace_all(namespace, current)
+
+
+    def reset(self, endpoint=None) -> None:
+        """Forgets sync state for one endpoint, or for all of them, so the next sync starts afresh"""
+        if endpoint is None:
+            for name in (self._api.computers.name(), self._api.mobile_devices.name()):
+                self.store.clear(f"sync:{name}")
+            return
+
+        self.store.clear(f"sync:{endpoint.name()}")
@@ -1,16 +1,30 @@
 """Tenant management module for handling Jamf Pro tenant configurations and operations."""
 
-# pylint: disable=broad-exception-raised, unused-argument
+# pylint: disable=broad-exception-raised, unused-argument, import-outside-toplevel
 
 # External
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from requests import RequestException
 
 # This Lib
 from .client import ProAPI, ClassicAPI
 from .auth import OAuth, BasicAuth
 from .http_config import HTTPConfig
-from .constants import DEFAULT_LOG_LEVEL, DEFAULT_TOKEN_BUFFER, VALID_AUTH_METHODS
-from .exceptions import JamfpyConfigError
+from .rate_limit import RateLimiter
+from .cache import ResponseCache
+from .constants import DEFAULT_LOG_LEVEL, DEFAULT_TOKEN_BUFFER, DEFAULT_MAX_WORKERS, VALID_AUTH_METHODS
+from .exceptions import JamfpyConfigError, JamfAuthError
+
+# Only for annotations; sqlite3 and friends load when a store, sync or index is first used.
+if TYPE_CHECKING:
+    from .store import DiskStore
+    from .hooks import RequestHook
+    from .sync import InventorySync
+    from .management_index import ManagementIdIndex
+    from .token_store import TokenStore
 
 
 
@@ -32,11 +46,27 @@ class Tenant:
       safe_mode: bool = True,
       cert_path: str = None,
       verify_path: str = None,
+      background_token_renewal: bool = False,
+      rate_limiter: RateLimiter = None,
+      cache: ResponseCache = None,
+      store: "DiskStore" = None,
+      hooks: list["RequestHook"] = None,
+      lazy_auth: bool = False,
+      token_store: "TokenStore" = None,
+      resolve_device_ids: bool = False,
     ):
         self.fqdn = fqdn
         self.token_exp_threshold_mins = token_exp_threshold_mins
         self.cert_path = cert_path
         self.verify_path = verify_path
+        # Shared by both APIs so the whole tenant draws from one budget.
+        self.rate_limiter = rate_limiter
+        # Shared too, so both APIs read from and invalidate one cache.
+        self.cache = cache
+        # Persists across processes; see DiskStore.
+        self.store = store
+        # One list for both APIs; hooks added to it later see every request too.
+        self.hooks = hooks if hooks is not None else []
 
 
         self._validate_path(
@@ -50,6 +80,9 @@ class Tenant:
             verify_path=verify_path
         )
 
+        # One warm connection pool for auth and both APIs.
+        self.session = http_config.new_session()
+
         auth = self._init_validate_auth(
             auth_method=auth_method,
             client_id=client_id,
@@ -57,10 +90,18 @@ class Tenant:
             username=username,
             password=password,
             log_level=log_level,
-            http_config=http_config
+            http_config=http_config,
+            token_store=token_store
         )
 
-        auth.set_new_token()
+        self.auth = auth
+
+        # Lazy tenants fetch their first token on first request (or warm()).
+        if not lazy_auth:
+            auth.fetch_token()
+
+        if background_token_renewal:
+            auth.start_background_renewal()
 
         self._init_apis(
             fqdn=fqdn,
@@ -70,6 +111,33 @@ class Tenant:
             safe_mode=safe_mode
         )
 
+        self._sync = None
+        self._management_index = None
+
+        # Loads on first use; with resolve_device_ids the mdm wrappers resolve through it.
+        if resolve_device_ids:
+            self.pro.management_index = self.management_index
+
+    @property
+    def sync(self) -> "InventorySync":
+        """InventorySync over both APIs and the store, built on first use"""
+        if self._sync is None:
+            from .sync import InventorySync
+            self._sync = InventorySync(self.classic, store=self.store, pro_api=self.pro)
+        return self._sync
+
+    @property
+    def management_index(self) -> "ManagementIdIndex":
+        """ManagementIdIndex over the Pro API and the store, built on first use"""
+        if self._management_index is None:
+            from .management_index import ManagementIdIndex
+            self._management_index = ManagementIdIndex(self.pro, store=self.store)
+        return self._management_index
+
+    def warm(self) -> None:
+        """Fetches the first token now if it has not been, so the first request doesn't pay for it"""
+        self.auth.token()
+
     def _validate_path(
             self,
             *,
@@ -108,6 +176,7 @@ class Tenant:
             password: str,
             log_level: int,
             http_config: HTTPConfig,
+            token_store: "TokenStore",
     ):
         """
         Method to validate the supplied configuration of auth credentials
@@ -133,7 +202,9 @@ class Tenant:
                     log_level=log_level,
                     http_config=http_config,
                     cert_path=self.cert_path,
-                    verify_path=self.verify_path
+                    verify_path=self.verify_path,
+                    session=self.session,
+                    token_store=token_store
                 )
 
             case "basic":
@@ -149,7 +220,9 @@ class Tenant:
                     log_level=log_level,
                     http_config=http_config,
                     cert_path=self.cert_path,
-                    verify_path=self.verify_path
+                    verify_path=self.verify_path,
+                    session=self.session,
+                    token_store=token_store
                 )
 
             case _:
@@ -171,8 +244,13 @@ class Tenant:
             log_level=log_level,
             http_config=http_config,
             safe_mode=safe_mode,
+            session=self.session,
             cert_path=self.cert_path,
-            verify_path=self.verify_path
+            verify_path=self.verify_path,
+            rate_limiter=self.rate_limiter,
+            cache=self.cache,
+            store=self.store,
+            hooks=self.hooks
         )
 
         self.classic = ClassicAPI(
@@ -181,6 +259,28 @@ class Tenant:
             log_level=log_level,
             http_config=http_config,
             safe_mode=safe_mode,
+            session=self.session,
             cert_path=self.cert_path,
-            verify_path=self.verify_path
+            verify_path=self.verify_path,
+            rate_limiter=self.rate_limiter,
+            cache=self.cache,
+            store=self.store,
+            hooks=self.hooks
         )
+
+
+def warm_tenants(tenants: list[Tenant], max_workers: int = DEFAULT_MAX_WORKERS) -> dict:
+    """Warms many (lazy_auth) tenants in parallel, with at most max_workers token requests in flight.
+
+    Returns ``{tenant.fqdn: None | Exception}``; a tenant that failed to authenticate is reported
+    against its fqdn without stopping the others.
+    """
+    def warm(tenant: Tenant):
+        try:
+            tenant.warm()
+        except (RequestException, JamfAuthError) as e:
+            return e
+        return None
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jamfpy-warm") as executor:
+        return dict(zip((tenant.fqdn for tenant in tenants), executor.map(warm, tenants)))
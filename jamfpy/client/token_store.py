@@ -0,0 +1,143 @@
+"""Token stores that let short-lived processes share one valid Jamf Pro token."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking falls back to this process only.
+    fcntl = None
+
+
+class TokenStore(ABC):
+    """Where Auth looks for a still-valid token before minting one, and publishes the ones it mints.
+
+    Subclasses implement the abstract ``load``/``save``/``delete``, so an incomplete store fails
+    when it is built; ``lock`` serialises minting for one key so that of many concurrent callers
+    only the first hits the token endpoint. Keys identify the tenant and credential (never the
+    secret), e.g. ``"oauth:https://x.jamfcloud.com:<client id>"``.
+    Tokens from a store are shared, so ``Auth.invalidate`` (and ``close``) leave them to expire
+    unless called with ``revoke=True``.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+
+    @abstractmethod
+    def load(self, key: str) -> tuple[str, float] | None:
+        """Returns the stored ``(token, expiry epoch)`` for key, or None"""
+
+
+    @abstractmethod
+    def save(self, key: str, token: str, expiry: float) -> None:
+        """Stores token for key until expiry"""
+
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Forgets the token for key"""
+
+
+    def _thread_lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+    @contextlib.contextmanager
+    def lock(self, key: str):
+        """Holds the minting lock for key within this process"""
+        with self._thread_lock(key):
+            yield
+
+
+class MemoryTokenStore(TokenStore):
+    """Process-local store, for sharing one token between Tenants built with the same credentials"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tokens: dict[str, tuple[str, float]] = {}
+
+
+    def load(self, key: str) -> tuple[str, float] | None:
+        return self._tokens.get(key)
+
+
+    def save(self, key: str, token: str, expiry: float) -> None:
+        self._tokens[key] = (token, expiry)
+
+
+    def delete(self, key: str) -> None:
+        self._tokens.pop(key, None)
+
+
+class FileTokenStore(TokenStore):
+    """One owner-only (0600) JSON file per key in ``directory``, shared by every process of the user.
+
+    Writes are atomic (write to a temp file, then rename), and ``lock`` also takes an exclusive
+    ``flock`` on a per-key lock file, so a burst of processes starting together mints one token.
+    """
+
+    def __init__(self, directory: str | Path = "~/.cache/jamfpy/tokens") -> None:
+        super().__init__()
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+
+    def __str__(self) -> str:
+        return f"FileTokenStore at {self.directory}"
+
+
+    def _path(self, key: str, suffix: str = ".json") -> Path:
+        # Hashed so fqdns and client ids never have to be valid file names.
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest()[:32] + suffix)
+
+
+    def load(self, key: str) -> tuple[str, float] | None:
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return data["token"], float(data["expiry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+    def save(self, key: str, token: str, expiry: float) -> None:
+        # mkstemp creates the file 0600, so the token is never readable by others, even briefly.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tok-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"token": token, "expiry": expiry}, f)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+
+    def delete(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            self._path(key).unlink()
+
+
+    @contextlib.contextmanager
+    def lock(self, key: str):
+        """Holds the minting lock for key across threads and, where flock exists, processes"""
+        with super().lock(key):
+            if fcntl is None:
+                yield
+                return
+
+            fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
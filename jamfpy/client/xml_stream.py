@@ -0,0 +1,72 @@
+"""Incremental iterparse reader for Classic XML payloads."""
+
+import io
+import xml.etree.ElementTree as ET
+from typing import Iterator
+
+from requests import Response
+
+# Classic list payloads lead with a <size> element next to the records.
+_SIZE_TAG = "size"
+
+
+def _element_value(elem: ET.Element):
+    """Converts an element the way the Classic API renders JSON: text leaves become strings, list
+    containers (a ``<size>`` sibling, or one tag repeated) become lists, anything else a dict.
+    Attributes are ignored and every value stays a string.
+    """
+    children = list(elem)
+    if not children:
+        return (elem.text or "").strip()
+
+    tags = [child.tag for child in children if child.tag != _SIZE_TAG]
+    has_size = len(tags) != len(children)
+    if (has_size and len(set(tags)) <= 1) or (len(tags) > 1 and len(set(tags)) == 1):
+        return [_element_value(child) for child in children if child.tag != _SIZE_TAG]
+
+    grouped = {}
+    for child in children:
+        grouped.setdefault(child.tag, []).append(_element_value(child))
+    return {tag: values[0] if len(values) == 1 else values for tag, values in grouped.items()}
+
+
+def _readable(source):
+    """A binary file-like object over source: a Response (streamed or not), bytes, str or a file"""
+    if isinstance(source, Response):
+        if source.raw is not None and not source._content_consumed:  # pylint: disable=protected-access
+            source.raw.decode_content = True
+            return source.raw
+        return io.BytesIO(source.content or b"")
+    if isinstance(source, str):
+        return io.BytesIO(source.encode("utf-8"))
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return source
+
+
+def iter_xml(source) -> Iterator[tuple[str, object]]:
+    """Yields ``(tag, value)`` for each child of the document root as soon as its end tag is read.
+
+    Only the element being yielded is ever held in memory: each one is dropped from the tree once
+    converted, so a multi-megabyte document parses in the space of its largest single child.
+    Raises ``xml.etree.ElementTree.ParseError`` on malformed input.
+    """
+    root, depth = None, 0
+    for event, elem in ET.iterparse(_readable(source), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1:
+            yield elem.tag, _element_value(elem)
+            root.clear()
+
+
+def iter_records(source) -> Iterator[dict]:
+    """Yields each record of a Classic list payload (``<computers><size/><computer/>...``) as a dict"""
+    for tag, value in iter_xml(source):
+        if tag != _SIZE_TAG:
+            yield value
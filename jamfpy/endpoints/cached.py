@@ -0,0 +1,58 @@
+"""Read-through access from collection endpoints to the API's DiskStore."""
+from urllib.parse import urlsplit
+
+from ..client.cache import resource_of
+from ..client.exceptions import JamfAPIError
+
+
+class CachedCollectionMixin:
+    """Adds ``cached_all``/``refresh_cache``/``cached_by_id`` to an endpoint.
+
+    The endpoint supplies ``get_all``, ``get_by_id``, ``_collection_url()`` and ``_records(response)``;
+    records are kept in ``self._api.store`` when the API has one, and fetched live otherwise.
+    """
+
+    def _store_namespace(self) -> str:
+        """Key this endpoint's collection is kept under in the DiskStore."""
+        return f"{urlsplit(self._collection_url()).path}:{self._name}"
+
+    def cached_all(self, max_age: float | None = None) -> list[dict]:
+        """Records of this collection from the DiskStore, no older than ``max_age`` seconds.
+
+        Falls back to ``refresh_cache`` when nothing usable is stored, or when the API has no store.
+        """
+        store = self._api.store
+        records = store.get_all(self._store_namespace(), max_age) if store is not None else None
+        return records if records is not None else self.refresh_cache()
+
+    def refresh_cache(self) -> list[dict]:
+        """Re-reads the collection via get_all and rewrites only the records that changed in the store."""
+        resp = self.get_all()
+        if not resp.ok:
+            raise JamfAPIError(f"refresh_cache failed: {resp.status_code}")
+
+        records = self._records(resp)
+        if self._api.store is not None:
+            self._api.store.replace_all(
+                self._store_namespace(),
+                {record.get("id", index): record for index, record in enumerate(records)},
+                resource=resource_of(self._collection_url())
+            )
+        return records
+
+    def cached_by_id(self, target_id, max_age: float | None = None) -> dict:
+        """The decoded get_by_id body for target_id, served from the DiskStore when fresh enough."""
+        store = self._api.store
+        namespace = f"{self._store_namespace()}/id"
+        record = store.get(namespace, target_id, max_age) if store is not None else None
+        if record is not None:
+            return record
+
+        resp = self.get_by_id(target_id)
+        if not resp.ok:
+            raise JamfAPIError(f"cached_by_id failed for {target_id}: {resp.status_code}")
+
+        record = resp.json()
+        if store is not None:
+            store.put(namespace, target_id, record, resource=resource_of(self._collection_url()))
+        return record
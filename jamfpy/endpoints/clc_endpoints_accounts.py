@@ -1,8 +1,21 @@
 
 import json
+from typing import Iterator
 
 from requests import Response, Request
-from .models import ClassicEndpoint, Endpoint
+from .models import ClassicEndpoint, Endpoint, _subset_suffix
+from ..client.exceptions import JamfAPIError
+from ..client.xml_stream import iter_xml
+
+
+def _entries(value) -> list:
+    """Records of a parsed <users>/<groups> element: a list, one ``{"user": {...}}``, or empty text"""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        entries = next(iter(value.values()), [])
+        return entries if isinstance(entries, list) else [entries]
+    return []
 
 
 class AccountChild(ClassicEndpoint):
@@ -32,19 +45,55 @@ class AccountChild(ClassicEndpoint):
         return new_response
 
 
-    def get_by_id(self, target_id: int) -> Response:
-        """Get a single record by ID."""
+    def get_by_id(
+            self,
+            target_id: int,
+            xml_response: bool = False,
+            sections: list[str] | str | None = None,
+            *,
+            stream: bool = False
+    ) -> Response:
+        """Get a single record by ID; takes the same options as ``ClassicEndpoint.get_by_id``."""
 
         suffix = self._by_id_uri + f"/{target_id}"
+        if sections:
+            suffix += _subset_suffix(sections)
+        read_header = "json" if not xml_response else "xml"
         return self._api.do(
             Request(
                 method="GET",
                 url=self._api.url() + suffix,
-                headers=self._api.header("read")["json"]
-            )
+                headers=self._api.header("read")[read_header]
+            ),
+            stream=stream
         )
 
 
+    def _narrow(self, xml_response: bool, subset: str | None, stream: bool) -> Response:
+        """GETs /accounts and narrows its JSON to this child's list. XML and streamed bodies
+        can't be narrowed without reading them, so those come back whole (see ``stream_all``).
+        """
+        original_response: Response = super().get_all(suffix=None, xml_response=xml_response, subset=subset, stream=stream)
+        if xml_response or stream:
+            return original_response
+
+        original_response.raise_for_status()
+        original_json = original_response.json()
+
+        return self.pass_response(original_response, {self._name: original_json.get('accounts', {}).get(self._name, [])})
+
+
+    def stream_all(self, subset: str | None = None) -> Iterator[dict]:
+        """Yields each of this child's records from the streamed /accounts XML"""
+        resp = self.get_all(xml_response=True, subset=subset, stream=True)
+        with resp:
+            if not resp.ok:
+                raise JamfAPIError(f"stream_all of {self._name} failed: {resp.status_code}")
+            for tag, value in iter_xml(resp):
+                if tag == self._name:
+                    yield from _entries(value)
+
+
     def update_by_id(self, target_id: int, updated_configuration: str) -> Response:  # pylint: disable=R0801
         """Update a record by ID with new configuration."""
         suffix = self._by_id_uri + f"/{target_id}"
@@ -88,15 +137,9 @@ class AccountUsers(AccountChild):
     _by_id_uri = _uri + "/userid"
     _by_name_uri = _uri + "/username"
 
-    def get_all(self, suffix=None) -> Response:
+    def get_all(self, suffix=None, xml_response: bool = False, subset: str | None = None, *, stream: bool = False) -> Response:
         """Returns a Response object with its JSON content modified to only include users."""
-        original_response: Response = super().get_all(suffix=None)
-        original_response.raise_for_status()
-        original_json = original_response.json()
-
-        users_data = {self._name : original_json.get('accounts', {}).get('users', [])}
-
-        return self.pass_response(original_response, users_data)
+        return self._narrow(xml_response, subset, stream)
 
 
 class AccountGroups(AccountChild):
@@ -108,14 +151,9 @@ class AccountGroups(AccountChild):
     _by_id_uri = _uri + "/groupid"
     _by_name_uri = _uri + "/groupname"
 
-    def get_all(self, suffix=None) -> Response:
+    def get_all(self, suffix=None, xml_response: bool = False, subset: str | None = None, *, stream: bool = False) -> Response:
         """ Returns all group objects under /accounts, packaged in a Response object. """
-        original_response: Response = super().get_all(suffix=None)
-        original_response.raise_for_status()
-        original_json = original_response.json()
-
-        groups_data = {self._name : original_json.get('accounts', {}).get('groups', [])}
-        return self.pass_response(original_response, groups_data)
+        return self._narrow(xml_response, subset, stream)
 
 
 class Accounts(Endpoint):
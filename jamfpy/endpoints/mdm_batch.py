@@ -0,0 +1,175 @@
+"""Chunked, concurrent dispatch of one MDM command to many devices."""
+from datetime import datetime, timedelta, timezone
+
+from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestsConnectionError, ReadTimeout
+from urllib3.exceptions import ProtocolError
+
+from ..client.constants import DEFAULT_MAX_WORKERS, DEFAULT_MDM_BATCH_SIZE, DEFAULT_MDM_POLL_PAGE_SIZE, MDM_CLOCK_SKEW_SECS
+from ..client.rate_limit import RateLimiter
+from .models import _run_concurrently
+
+
+def _rsql_datetime(moment: datetime) -> str:
+    """Formats moment the way the mdm commands filter expects: 2024-05-16T20:43:43.945Z"""
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class MDMBatchResult:
+    """Outcome of a batched MDM command, per management id.
+
+    ``succeeded`` maps each accepted id to the uuid of the command queued for it (None when the
+    server's reply could not be read). ``failed`` maps each rejected id to the non-ok Response or
+    error of the chunk it was sent in; those devices were not sent the command. ``uncertain``
+    maps the ids of chunks whose request raised mid-flight (a read timeout, a reset connection)
+    to that exception: the server may or may not have queued the command for them. The command
+    itself is kept, so a result can be handed back to ``retry_batch`` or to
+    ``CommandTracker.from_batch``.
+    """
+
+    def __init__(self, command_type: str, command_data: dict) -> None:
+        self.command_type = command_type
+        self.command_data = command_data
+        self.sent_at = datetime.now(timezone.utc)
+        self.succeeded: dict[str, str | None] = {}
+        self.failed: dict[str, Response | Exception] = {}
+        self.uncertain: dict[str, Exception] = {}
+
+    def __repr__(self) -> str:
+        return (f"<MDMBatchResult {self.command_type}: {len(self.succeeded)} sent, {len(self.failed)} failed, "
+                f"{len(self.uncertain)} uncertain>")
+
+    @property
+    def ok(self) -> bool:
+        """True when every device is known to have been accepted"""
+        return not self.failed and not self.uncertain
+
+    @property
+    def command_uuids(self) -> list[str]:
+        """Uuids of every queued command, e.g. for tracking them to completion"""
+        return [uuid for uuid in self.succeeded.values() if uuid is not None]
+
+
+def _may_have_reached_server(error: Exception) -> bool:
+    """True for failures after the request was written: a read timeout, a broken body, or a
+    connection dropped mid-response. Refused connections, DNS failures and connect timeouts never
+    reached the server.
+    """
+    if isinstance(error, (ReadTimeout, ChunkedEncodingError)):
+        return True
+    return isinstance(error, RequestsConnectionError) and bool(error.args) and isinstance(error.args[0], ProtocolError)
+
+
+def _command_uuids(resp: Response, count: int) -> list[str | None]:
+    """Command uuids from a 201 reply, which lists one ``{id, href}`` per client in request order."""
+    try:
+        body = resp.json()
+    except ValueError:
+        body = None
+
+    if not isinstance(body, list) or len(body) != count:
+        return [None] * count
+    return [item.get("id") if isinstance(item, dict) else None for item in body]
+
+
+class MDMBatchMixin:
+    """Adds ``send_command_batched``/``retry_batch`` to MDMCommands.
+
+    The endpoint supplies ``_post_command(command_type, management_ids, **command_data)``,
+    ``iter_commands(filter_query, page_size)`` and ``_resolve_management_ids(identifiers, kind)``.
+    Ids are resolved once, up front; chunks are posted as they are.
+    """
+
+    def send_command_batched(
+            self,
+            command_type: str,
+            management_ids: list[str],
+            *,
+            batch_size: int = DEFAULT_MDM_BATCH_SIZE,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            rate_limiter: RateLimiter = None,
+            id_kind: str = None,
+            **command_data
+    ) -> MDMBatchResult:
+        """Sends one command to any number of devices, ``batch_size`` management ids per request.
+
+        Up to ``max_workers`` chunks are in flight at once; pass a ``rate_limiter`` to also cap how
+        fast they start (the API's own limiter, if any, applies as well). Duplicate ids are sent
+        once. A failed chunk does not stop the others; its ids are reported in ``failed``, or in
+        ``uncertain`` when its request raised after it may have reached the server.
+        Other identifiers are resolved up front (as ``id_kind`` only, if given, e.g. "computer_id"
+        for Classic ids), so results are always keyed by management id.
+        """
+        management_ids = management_ids if isinstance(management_ids, list) else [management_ids]
+        management_ids = self._resolve_management_ids(management_ids, id_kind)
+        result = MDMBatchResult(command_type, command_data)
+        self._dispatch(result, list(dict.fromkeys(management_ids)), batch_size, max_workers, rate_limiter)
+        return result
+
+    def retry_batch(
+            self,
+            result: MDMBatchResult,
+            *,
+            batch_size: int = DEFAULT_MDM_BATCH_SIZE,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            rate_limiter: RateLimiter = None
+    ) -> MDMBatchResult:
+        """Resends the command of a previous batch to the ids that failed, updating result in place.
+
+        ``uncertain`` ids are first looked up with ``check_uncertain``: those the server did queue
+        the command for move to ``succeeded`` and are not sent it again; the rest are resent with
+        ``failed``. Ids that now succeed move to ``succeeded``; the rest keep their new error.
+        A listing error propagates and leaves ``uncertain`` as it was, so nothing is resent blind.
+        """
+        if result.uncertain:
+            self.check_uncertain(result)
+
+        pending = list(result.failed)
+        result.failed.clear()
+        self._dispatch(result, pending, batch_size, max_workers, rate_limiter)
+        return result
+
+    def check_uncertain(self, result: MDMBatchResult, page_size: int = DEFAULT_MDM_POLL_PAGE_SIZE) -> MDMBatchResult:
+        """Settles ``uncertain`` ids by listing the batch's commands sent since ``sent_at``.
+
+        Ids with a queued command move to ``succeeded`` (with its uuid), the others to ``failed``.
+        The window opens MDM_CLOCK_SKEW_SECS early to allow for clock skew, so a command of the
+        same type sent to the device just before the batch counts as this one.
+        """
+        since = result.sent_at - timedelta(seconds=MDM_CLOCK_SKEW_SECS)
+        query = f"command=={result.command_type};dateSent=ge={_rsql_datetime(since)}"
+        queued = {}
+        for record in self.iter_commands(query, page_size=page_size):
+            management_id = (record.get("client") or {}).get("managementId")
+            if management_id in result.uncertain:
+                queued[management_id] = record.get("uuid")
+
+        for management_id, error in result.uncertain.items():
+            if management_id in queued:
+                result.succeeded[management_id] = queued[management_id]
+            else:
+                result.failed[management_id] = error
+        result.uncertain.clear()
+        return result
+
+    def _dispatch(self, result: MDMBatchResult, management_ids: list[str], batch_size: int, max_workers: int,
+                  rate_limiter: RateLimiter) -> None:
+        chunks = [management_ids[i:i + batch_size] for i in range(0, len(management_ids), batch_size)]
+
+        def send(chunk):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                return self._post_command(result.command_type, chunk, **result.command_data)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Whatever a chunk raises fails that chunk, never the batch.
+                return e
+
+        for chunk, outcome in zip(chunks, _run_concurrently(send, chunks, max_workers) if chunks else []):
+            if isinstance(outcome, Response) and outcome.ok:
+                result.succeeded.update(zip(chunk, _command_uuids(outcome, len(chunk))))
+            elif _may_have_reached_server(outcome):
+                # Raised after the request reached the server: it could be queued.
+                result.uncertain.update(dict.fromkeys(chunk, outcome))
+            else:
+                result.failed.update(dict.fromkeys(chunk, outcome))
@@ -0,0 +1,169 @@
+"""Follows queued MDM commands to completion with a few bulk listing requests."""
+import time
+from datetime import datetime, timedelta
+
+from ..client.constants import (
+    DEFAULT_MDM_POLL_PAGE_SIZE, MDM_CLOCK_SKEW_SECS, MDM_POLL_INITIAL_SECS, MDM_POLL_MAX_SECS, MDM_POLL_UUID_FILTER_MAX
+)
+from .mdm_batch import MDMBatchResult, _rsql_datetime
+
+COMMAND_STATES = ("PENDING", "ACKNOWLEDGED", "NOT_NOW", "ERROR")
+# States a command never leaves.
+FINAL_STATES = ("ACKNOWLEDGED", "ERROR")
+# Tracked commands the listing has not shown yet.
+UNKNOWN_STATE = "UNKNOWN"
+
+
+def _uuid_filters(uuids: list[str]) -> list[str]:
+    """Filters naming uuids, MDM_POLL_UUID_FILTER_MAX per filter"""
+    return [
+        ",".join(f"uuid=={uuid}" for uuid in uuids[i:i + MDM_POLL_UUID_FILTER_MAX])
+        for i in range(0, len(uuids), MDM_POLL_UUID_FILTER_MAX)
+    ]
+
+
+class CommandTracker:
+    """Aggregated, polled view of many MDM commands, keyed by command uuid.
+
+    Each ``poll`` lists ``/v2/mdm/commands`` filtered to the command type and send window, a page
+    of ``page_size`` commands per request, and records the state of every tracked uuid it sees.
+    Once few commands are outstanding the filter names their uuids instead, so the tail of a
+    campaign costs one request per poll. The window opens MDM_CLOCK_SKEW_SECS before ``since``
+    (a client clock reading); commands a window poll misses are named in uuid filters alongside
+    the window from then on, so skew can never hide a command for good and costs only the requests
+    those few uuids need. ``wait`` repeats ``poll`` with exponentially growing intervals until
+    every command is acknowledged or errored.
+    """
+
+    def __init__(
+            self,
+            mdm,
+            command_uuids: list[str],
+            *,
+            command_type: str = None,
+            since: datetime = None,
+            page_size: int = DEFAULT_MDM_POLL_PAGE_SIZE,
+    ) -> None:
+        self._mdm = mdm
+        self.command_type = command_type
+        self.since = since
+        self.page_size = page_size
+        self.commands: dict[str, dict] = {
+            uuid: {"state": UNKNOWN_STATE, "management_id": None, "error": None, "completed": None}
+            for uuid in command_uuids
+        }
+        self.polls = 0
+        # Tracked uuids a window poll did not show, e.g. sent before the (skewed) window opened.
+        self._missed: set[str] = set()
+
+
+    @classmethod
+    def from_batch(cls, mdm, batch: MDMBatchResult, **kwargs) -> "CommandTracker":
+        """Tracks every command queued by a batched send"""
+        tracker = cls(mdm, batch.command_uuids, command_type=batch.command_type, since=batch.sent_at, **kwargs)
+        for management_id, uuid in batch.succeeded.items():
+            if uuid is not None:
+                tracker.commands[uuid]["management_id"] = management_id
+        return tracker
+
+
+    def _outstanding(self) -> list[str]:
+        return [uuid for uuid, command in self.commands.items() if command["state"] not in FINAL_STATES]
+
+
+    def _filters(self, outstanding: list[str]) -> list[str]:
+        """The send window plus uuid filters for what it missed, or uuid filters alone when few
+        are left (or there is no window)
+        """
+        clauses = []
+        if self.command_type:
+            clauses.append(f"command=={self.command_type}")
+        if self.since is not None:
+            clauses.append(f"dateSent=ge={_rsql_datetime(self.since - timedelta(seconds=MDM_CLOCK_SKEW_SECS))}")
+
+        if clauses and len(outstanding) > MDM_POLL_UUID_FILTER_MAX:
+            return [";".join(clauses)] + _uuid_filters([uuid for uuid in outstanding if uuid in self._missed])
+
+        return _uuid_filters(outstanding)
+
+
+    def poll(self) -> dict:
+        """Lists the outstanding commands once, updating their states. Returns ``summary()``"""
+        outstanding = self._outstanding()
+        if outstanding:
+            self.polls += 1
+
+        seen = set()
+        for query in self._filters(outstanding) if outstanding else []:
+            for record in self._mdm.iter_commands(query, page_size=self.page_size):
+                command = self.commands.get(record.get("uuid"))
+                if command is None:
+                    continue
+                seen.add(record["uuid"])
+                command["state"] = record.get("commandState") or command["state"]
+                command["management_id"] = (record.get("client") or {}).get("managementId") or command["management_id"]
+                command["error"] = record.get("commandError")
+                command["completed"] = record.get("dateCompleted")
+
+        # Unseen commands are outside the window (or gone); only naming them will find them.
+        self._missed.update(uuid for uuid in outstanding if uuid not in seen)
+
+        return self.summary()
+
+
+    def wait(
+            self,
+            timeout: float = None,
+            initial_interval: float = MDM_POLL_INITIAL_SECS,
+            max_interval: float = MDM_POLL_MAX_SECS,
+            on_poll=None,
+    ) -> dict:
+        """Polls until every command is final or timeout seconds pass, doubling the interval up
+        to max_interval between polls. ``on_poll(summary)`` is called after each poll.
+        Returns the last ``summary()``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = initial_interval
+
+        while True:
+            summary = self.poll()
+            if on_poll is not None:
+                on_poll(summary)
+            if self.done:
+                return summary
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return summary
+                interval = min(interval, remaining)
+
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+
+    @property
+    def done(self) -> bool:
+        """True once every tracked command is acknowledged or errored"""
+        return not self._outstanding()
+
+
+    def summary(self) -> dict:
+        """Count of tracked commands per state, UNKNOWN included"""
+        counts = dict.fromkeys(COMMAND_STATES + (UNKNOWN_STATE,), 0)
+        for command in self.commands.values():
+            counts[command["state"]] = counts.get(command["state"], 0) + 1
+        return counts
+
+
+    def by_device(self) -> dict[str, str]:
+        """State per management id, for commands whose device is known"""
+        return {
+            command["management_id"]: command["state"]
+            for command in self.commands.values() if command["management_id"] is not None
+        }
+
+
+    def errors(self) -> dict[str, dict]:
+        """``commandError`` per command uuid, for every command in the ERROR state"""
+        return {uuid: command["error"] for uuid, command in self.commands.items() if command["state"] == "ERROR"}
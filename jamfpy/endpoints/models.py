@@ -1,10 +1,73 @@
 """Base endpoint class providing common functionality and structure for all Jamf Pro API endpoints."""
 # pylint: disable=import-outside-toplevel
+import functools
+import inspect
 import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 
-from requests import Request, Response
+from requests import Request, Response, RequestException
 
-from ..client.exceptions import JamfAPIError
+from ..client.constants import DEFAULT_MAX_WORKERS
+from ..client.exceptions import JamfAPIError, JamfAuthError
+from .cached import CachedCollectionMixin
+from .streaming import XMLStreamMixin
+
+
+def _run_concurrently(func, items, max_workers: int) -> list:
+    """Maps func over items on a bounded thread pool, returning results in input order."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _get_by_ids(get_by_id, target_ids, max_workers: int) -> dict:
+    """Runs get_by_id for each unique id concurrently, capturing per-id failures.
+
+    Returns ``{target_id: Response | Exception}`` in input order; duplicate ids are fetched once.
+    """
+    def fetch(target_id):
+        try:
+            return get_by_id(target_id)
+        except (RequestException, JamfAPIError, JamfAuthError) as e:
+            return e
+
+    unique_ids = list(dict.fromkeys(target_ids))
+    return dict(zip(unique_ids, _run_concurrently(fetch, unique_ids, max_workers)))
+
+
+def _subset_suffix(sections: list[str] | str) -> str:
+    """Builds a Classic ``/subset/...`` path suffix; multiple sections are joined with ``&``."""
+    if isinstance(sections, str):
+        return f"/subset/{sections}"
+    return "/subset/" + "&".join(sections)
+
+
+def _pro_query(sort: str | None, filter_query: str | None, sections: list[str] | None) -> str:
+    """Builds the query-string tail shared by every page of a Pro collection walk."""
+    query = ""
+    if sort:
+        query += f"&sort={sort}"
+    if filter_query:
+        query += f"&filter={quote(filter_query, safe='')}"
+    for section in sections or ():
+        query += f"&section={section}"
+    return query
+
+
+def _project(record: dict, fields: list[str]) -> dict:
+    """Returns a copy of record holding only the given keys; dotted paths select nested values."""
+    projected = {}
+    for field in fields:
+        value, target, parts = record, projected, field.split(".")
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = value
+    return projected
 
 
 class Endpoint:
@@ -31,14 +94,25 @@ class Endpoint:
         return new
 
 
-class ClassicEndpoint(Endpoint):
+class ClassicEndpoint(XMLStreamMixin, CachedCollectionMixin, Endpoint):
     """Base class for Classic Jamf Pro API endpoints, implementing standard CRUD operations."""
 
-    def get_all(self, suffix: str | None = None, xml_response: bool = False) -> Response:
+    def get_all(
+            self,
+            suffix: str | None = None,
+            xml_response: bool = False,
+            subset: str | None = None,
+            *,
+            stream: bool = False
+    ) -> Response:
         """Get all records for this endpoint.
         Optionally uses a provided suffix, otherwise defaults to the endpoint's base URI.
+        ``subset`` requests a server-side subset of the list, e.g. ``"basic"`` for ``/computers/subset/basic``.
+        ``stream`` leaves the body unread for incremental parsing (see ``stream_all``).
         """
         effective_suffix = suffix or self._uri
+        if subset:
+            effective_suffix += _subset_suffix(subset)
 
         read_header = "json" if not xml_response else "xml"
 
@@ -47,23 +121,58 @@ class ClassicEndpoint(Endpoint):
                 method="GET",
                 url=self._api.url() + effective_suffix,
                 headers=self._api.header("read")[read_header]
-            )
+            ),
+            stream=stream
         )
 
 
-    def get_by_id(self, target_id: int, xml_response: bool = False) -> Response:
-        """Get a single record by ID."""
+    def get_by_id(
+            self,
+            target_id: int,
+            xml_response: bool = False,
+            sections: list[str] | str | None = None,
+            *,
+            stream: bool = False
+    ) -> Response:
+        """Get a single record by ID.
+        ``sections`` limits the record to the named subsets (e.g. ``["General", "Hardware"]``),
+        so only those parts of a large record are transferred. ``stream`` leaves the body unread.
+        """
         suffix = self._uri + f"/id/{target_id}"
+        if sections:
+            suffix += _subset_suffix(sections)
         read_header = "json" if not xml_response else "xml"
         return self._api.do(
             Request(
                 method="GET",
                 url=self._api.url() + suffix,
                 headers=self._api.header("read")[read_header]
-            )
+            ),
+            stream=stream
         )
 
 
+    def get_by_ids(
+            self,
+            target_ids,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            xml_response: bool = False,
+            sections: list[str] | str | None = None
+    ) -> dict:
+        """Get many records by ID concurrently, with at most ``max_workers`` requests in flight.
+
+        Returns ``{target_id: Response | Exception}`` in input order. A failed lookup is reported
+        against its id (non-ok Response, or the raised exception) without aborting the batch.
+        """
+        kwargs = {}
+        if xml_response:
+            kwargs["xml_response"] = True
+        if sections:
+            kwargs["sections"] = sections
+        get_by_id = functools.partial(self.get_by_id, **kwargs) if kwargs else self.get_by_id
+        return _get_by_ids(get_by_id, target_ids, max_workers)
+
+
     def update_by_id(self, target_id: int, updated_configuration: str) -> Response:
         """Update a record by ID with new configuration."""
         suffix = self._uri + f"/id/{target_id}"
@@ -106,7 +215,15 @@ class ClassicEndpoint(Endpoint):
         return self._name
 
 
-class ProEndpoint(Endpoint):
+    def _collection_url(self) -> str:
+        return self._api.url() + self._uri
+
+
+    def _records(self, response: Response) -> list[dict]:
+        return response.json().get(self._name, [])
+
+
+class ProEndpoint(CachedCollectionMixin, Endpoint):
     """Base class for modern Jamf Pro API endpoints, implementing standard CRUD and pagination.
 
     Mirrors ClassicEndpoint, adapted to Pro idioms: versioned URLs (via ``_version``), a plain
@@ -117,40 +234,143 @@ class ProEndpoint(Endpoint):
     _version = "1"
     _page_size = 100
 
-    def get_all(self, page_size: int | None = None, sort: str | None = None) -> Response:
+    def get_all(
+            self,
+            page_size: int | None = None,
+            sort: str | None = None,
+            max_workers: int | None = None,
+            *,
+            filter_query: str | None = None,
+            sections: list[str] | None = None,
+            fields: list[str] | None = None,
+    ) -> Response:
         """Get all records, transparently paginating and aggregating into one Response.
 
         Walks the ``page``/``page-size`` cursor until every record is collected, then returns a
         single Response whose JSON body is ``{"totalCount": N, "results": [...]}``.
+
+        With ``max_workers`` > 1, page 0 is fetched first to learn ``totalCount`` and the remaining
+        pages are fetched concurrently on a pool of that size, then reassembled in page order.
+
+        ``filter_query`` (an RSQL expression) and ``sections`` narrow the collection server-side,
+        for resources that support them. ``fields`` projects each record client-side down to the
+        given keys; dotted paths (``"general.name"``) select nested values.
         """
         size = page_size or self._page_size
-        accumulated, page, total_count = [], 0, None
-        resp = None
-        while True:
-            url = f"{self._api.url(self._version)}{self._uri}?page={page}&page-size={size}"
-            if sort:
-                url += f"&sort={sort}"
-            resp = self._api.do(
-                Request("GET", url=url, headers=self._api.header("read")["json"])
-            )
-            if not resp.ok:
-                raise JamfAPIError(f"get_all failed on page {page}: {resp.status_code}")
+        query = _pro_query(sort, filter_query, sections)
+        if max_workers and max_workers > 1:
+            resp, accumulated = self._get_all_concurrent(size, query, max_workers)
+        else:
+            accumulated, resp = [], None
+            for resp, results in self._walk_pages(size, query):
+                accumulated.extend(results)
+
+        if fields:
+            accumulated = [_project(record, fields) for record in accumulated]
+
+        return self._repackage_response(resp, {"totalCount": len(accumulated), "results": accumulated})
 
+    def iter_pages(
+            self,
+            page_size: int | None = None,
+            sort: str | None = None,
+            *,
+            filter_query: str | None = None,
+            sections: list[str] | None = None,
+            fields: list[str] | None = None,
+    ):
+        """Yield each page's ``results`` list in turn without aggregating.
+
+        Only one page is held at a time, so memory stays flat regardless of collection size.
+        Takes the same narrowing options as ``get_all``.
+        """
+        size = page_size or self._page_size
+        for _, results in self._walk_pages(size, _pro_query(sort, filter_query, sections)):
+            yield [_project(record, fields) for record in results] if fields else results
+
+    def iter_all(
+            self,
+            page_size: int | None = None,
+            sort: str | None = None,
+            *,
+            filter_query: str | None = None,
+            sections: list[str] | None = None,
+            fields: list[str] | None = None,
+    ):
+        """Yield every record one at a time, fetching pages lazily as the caller consumes them."""
+        for results in self.iter_pages(
+            page_size, sort, filter_query=filter_query, sections=sections, fields=fields
+        ):
+            yield from results
+
+    def _collection_url(self) -> str:
+        return self._api.url(self._version) + self._uri
+
+    def _records(self, response: Response) -> list[dict]:
+        return response.json().get("results", [])
+
+    def _page_url(self, page: int, size: int, query: str) -> str:
+        """Builds the collection URL for a single page."""
+        return f"{self._api.url(self._version)}{self._uri}?page={page}&page-size={size}{query}"
+
+    def _get_page(self, page: int, size: int, query: str) -> Response:
+        """Fetches a single page, raising JamfAPIError on a non-ok response."""
+        resp = self._api.do(
+            Request("GET", url=self._page_url(page, size, query), headers=self._api.header("read")["json"])
+        )
+        if not resp.ok:
+            raise JamfAPIError(f"get_all failed on page {page}: {resp.status_code}")
+        return resp
+
+    def _walk_pages(self, size: int, query: str, page: int = 0, fetched: int = 0):
+        """Yields ``(response, results)`` for each page in turn, starting at ``page``.
+
+        ``fetched`` is the number of records already collected by the caller before ``page``.
+        """
+        total_count = None
+        while True:
+            resp = self._get_page(page, size, query)
             body = resp.json()
             results = body.get("results", [])
             total_count = body.get("totalCount", total_count)
-            accumulated.extend(results)
+            fetched += len(results)
+            yield resp, results
 
             if not results or len(results) < size:
                 break
-            if total_count is not None and len(accumulated) >= total_count:
+            if total_count is not None and fetched >= total_count:
                 break
             # Defends against a server that ignores `page` and would otherwise loop forever.
             if page > (max(total_count or 0, 0) // size) + 2:
                 break
             page += 1
 
-        return self._repackage_response(resp, {"totalCount": len(accumulated), "results": accumulated})
+    def _get_all_concurrent(self, size: int, query: str, max_workers: int) -> tuple[Response, list]:
+        """Fetches page 0 for totalCount, then fans the remaining pages out across a thread pool.
+
+        Returns the last page's Response and every record in page order.
+        """
+        resp = self._get_page(0, size, query)
+        body = resp.json()
+        accumulated = list(body.get("results", []))
+        total_count = body.get("totalCount")
+
+        if total_count is None and len(accumulated) >= size:
+            # No totalCount to plan from; fall back to walking the rest of the cursor in order.
+            for resp, results in self._walk_pages(size, query, page=1, fetched=len(accumulated)):
+                accumulated.extend(results)
+
+        elif total_count is not None and len(accumulated) < total_count and len(accumulated) >= size:
+            page_count = -(-total_count // size)
+            responses = _run_concurrently(
+                lambda page: self._get_page(page, size, query),
+                range(1, page_count),
+                max_workers
+            )
+            for resp in responses:
+                accumulated.extend(resp.json().get("results", []))
+
+        return resp, accumulated
 
     def get_by_id(self, target_id: int) -> Response:
         """Get a single record by ID."""
@@ -162,6 +382,14 @@ class ProEndpoint(Endpoint):
             )
         )
 
+    def get_by_ids(self, target_ids, max_workers: int = DEFAULT_MAX_WORKERS) -> dict:
+        """Get many records by ID concurrently, with at most ``max_workers`` requests in flight.
+
+        Returns ``{target_id: Response | Exception}`` in input order. A failed lookup is reported
+        against its id (non-ok Response, or the raised exception) without aborting the batch.
+        """
+        return _get_by_ids(self.get_by_id, target_ids, max_workers)
+
     def create(self, payload: dict) -> Response:
         """Create a new record from a JSON payload."""
         return self._api.do(
@@ -197,3 +425,42 @@ class ProEndpoint(Endpoint):
     def name(self):
         """returns name for easy response browsing"""
         return self._name
+
+
+class AsyncEndpoint:
+    """Awaitable twin of an Endpoint, handed out by AsyncClassicAPI / AsyncProAPI.
+
+    Exposes the wrapped endpoint's exact surface: plain methods become coroutines and generator
+    methods (``iter_pages``/``iter_all``) become async generators, all executed through the async
+    API's bounded thread pool. Child endpoints (e.g. ``accounts.users``) are wrapped on access.
+    """
+
+    def __init__(self, endpoint: Endpoint, async_api):
+        self._endpoint = endpoint
+        self._async_api = async_api
+
+    def __getattr__(self, name):
+        attr = getattr(self._endpoint, name)
+
+        if isinstance(attr, Endpoint):
+            return AsyncEndpoint(attr, self._async_api)
+
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        if inspect.isgeneratorfunction(attr):
+            @functools.wraps(attr)
+            async def async_generator(*args, **kwargs):
+                iterator = attr(*args, **kwargs)
+                exhausted = object()
+                while (item := await self._async_api.run(next, iterator, exhausted)) is not exhausted:
+                    yield item
+            return async_generator
+
+        @functools.wraps(attr)
+        async def coroutine(*args, **kwargs):
+            return await self._async_api.run(attr, *args, **kwargs)
+        return coroutine
+
+    def __repr__(self) -> str:
+        return f"<AsyncEndpoint for {self._endpoint!r}>"
@@ -0,0 +1,13 @@
+"""Endpoint module for reading Jamf Pro computer inventory."""
+
+from .models import ProEndpoint
+
+
+class ComputersInventory(ProEndpoint):
+    """Endpoint for computer inventory in the modern Jamf Pro API (v1+).
+
+    Supports ``sections`` (GENERAL, HARDWARE, ...) and RSQL ``filter_query`` on ``get_all``/``iter_all``.
+    """
+    _uri = "/computers-inventory"
+    _name = "computers_inventory"
+    _version = "1"
@@ -1,27 +1,41 @@
 """Endpoint module for managing Jamf Pro MDM commands."""
+from urllib.parse import quote
+
 from requests import Request, Response
+from ..client.exceptions import JamfAPIError
 from .models import Endpoint
+from .mdm_batch import MDMBatchMixin, MDMBatchResult
+from .mdm_tracker import CommandTracker
 
-class MDMCommands(Endpoint):
+class MDMCommands(MDMBatchMixin, Endpoint):
     """Endpoint for managing MDM commands in the modern Jamf Pro API (v1+).
 
     This is an action endpoint (verbs, not CRUD), so it subclasses the bare ``Endpoint`` and does
-    not inherit ProEndpoint's shared CRUD/pagination.
+    not inherit ProEndpoint's shared CRUD/pagination. Fleet-wide commands should go through
+    ``send_command_batched`` (see ``mdm_batch.py``), which splits the target list into requests
+    small enough to finish well inside the request timeout.
     """
     _uri = "/mdm/commands"
     _name = "mdm_commands"
 
     # Send the command
 
-    def send_command(self, command_type: str, management_ids: list[str], **kwargs) -> Response:
+    def send_command(self, command_type: str, management_ids: list[str], *, id_kind: str = None, **kwargs) -> Response:
         """
         Send a generic MDM command.
 
         Args:
             command_type: e.g. "DEVICE_LOCK", "ERASE_DEVICE", etc.
-            management_ids: List of Jamf Pro management IDs to target.
+            management_ids: List of Jamf Pro management IDs to target. When the API has a
+                management_index, serials, names and udids are accepted too.
+            id_kind: Only match management_ids as this ManagementIdIndex kind, e.g. "computer_id"
+                to target Classic computer ids.
             **kwargs: Additional fields (like pin, message, preserveDataPlan).
         """        
+        return self._post_command(command_type, self._resolve_management_ids(management_ids, id_kind), **kwargs)
+
+    def _post_command(self, command_type: str, management_ids: list[str], **kwargs) -> Response:
+        """POSTs command_type to management_ids as they are, with no resolution"""
         payload = {
             "clientData": [{"managementId": mid} for mid in management_ids],
             "commandData": {"commandType": command_type, **kwargs},
@@ -34,6 +48,60 @@ class MDMCommands(Endpoint):
             json=payload)
         )
 
+    def _resolve_management_ids(self, identifiers: list, kind: str = None) -> list[str]:
+        """Maps identifiers to management ids through the API's ManagementIdIndex, if it has one"""
+        index = self._api.management_index
+        if index is None:
+            if kind is not None:
+                raise JamfAPIError(f"Resolving {kind} identifiers needs a management_index on the API")
+            return identifiers
+        return index.resolve_many(identifiers, kind=kind)
+
+    # Read commands back
+
+    def list_commands(self, filter_query: str, page: int = 0, page_size: int = 100, sort: str = None) -> Response:
+        """
+        Get one page of sent commands matching an RSQL filter.
+
+        Args:
+            filter_query: Required by Jamf Pro, e.g. "command==RESTART_DEVICE;dateSent=ge=2024-01-01T00:00:00.000Z".
+            page: Zero-based page number.
+            page_size: Commands per page.
+            sort: e.g. "dateSent:desc"; the server default is "dateSent:asc".
+        """
+        url = f"{self._api.url('2')}{self._uri}?page={page}&page-size={page_size}&filter={quote(filter_query, safe='')}"
+        if sort:
+            url += f"&sort={sort}"
+
+        return self._api.do(Request(
+            method="GET",
+            url=url,
+            headers=self._api.header("read")["json"])
+        )
+
+    def iter_commands(self, filter_query: str, page_size: int = 100, sort: str = None):
+        """Yield every command matching filter_query, fetching pages as they are consumed"""
+        page, fetched = 0, 0
+        while True:
+            resp = self.list_commands(filter_query, page=page, page_size=page_size, sort=sort)
+            if not resp.ok:
+                raise JamfAPIError(f"listing mdm commands failed on page {page}: {resp.status_code}")
+
+            body = resp.json()
+            results = body.get("results", [])
+            fetched += len(results)
+            yield from results
+
+            if len(results) < page_size or fetched >= body.get("totalCount", fetched):
+                return
+            page += 1
+
+    def track(self, commands: MDMBatchResult | list[str], **kwargs) -> CommandTracker:
+        """Start following a batch result, or a list of command uuids, to completion; see CommandTracker"""
+        if isinstance(commands, MDMBatchResult):
+            return CommandTracker.from_batch(self, commands, **kwargs)
+        return CommandTracker(self, commands, **kwargs)
+
     # Convience Wrappers:
 
     def apply_redemption_code(self, management_ids: list[str], identifier: str, redemption_code: str) -> Response:
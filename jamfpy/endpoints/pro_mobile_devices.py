@@ -0,0 +1,21 @@
+"""Endpoint module for reading Jamf Pro mobile devices."""
+
+from .models import ProEndpoint
+
+
+class MobileDeviceDetails(ProEndpoint):
+    """Paginated full inventory (v2 ``/mobile-devices/detail``); takes ``sections`` and ``filter_query``."""
+    _uri = "/mobile-devices/detail"
+    _name = "mobile_device_details"
+    _version = "2"
+
+
+class MobileDevices(ProEndpoint):
+    """Endpoint for mobile devices in the modern Jamf Pro API (v2)."""
+    _uri = "/mobile-devices"
+    _name = "mobile_devices"
+    _version = "2"
+
+    def __init__(self, api):
+        super().__init__(api)
+        self.details = MobileDeviceDetails(api)
@@ -0,0 +1,30 @@
+"""Bounded-memory reads of Classic XML payloads."""
+from typing import Iterator
+
+from ..client.exceptions import JamfAPIError
+from ..client.xml_stream import iter_records, iter_xml
+
+
+class XMLStreamMixin:
+    """Adds ``stream_all``/``stream_by_id`` to a Classic endpoint.
+
+    Both request XML with an unread body and parse it with ``iterparse`` as it arrives, so records
+    are yielded before the download finishes and memory stays at one record. The endpoint
+    supplies ``get_all``/``get_by_id`` taking ``xml_response`` and ``stream``.
+    """
+
+    def stream_all(self, subset: str | None = None) -> Iterator[dict]:
+        """Yields each record of ``get_all`` as a dict of strings, parsed from the XML stream"""
+        resp = self.get_all(xml_response=True, subset=subset, stream=True)
+        with resp:
+            if not resp.ok:
+                raise JamfAPIError(f"stream_all of {self._name} failed: {resp.status_code}")
+            yield from iter_records(resp)
+
+    def stream_by_id(self, target_id: int, sections: list[str] | str | None = None) -> Iterator[tuple[str, object]]:
+        """Yields ``(section, value)`` pairs of one record (``general``, ``hardware``, ...) as they are parsed"""
+        resp = self.get_by_id(target_id, xml_response=True, sections=sections, stream=True)
+        with resp:
+            if not resp.ok:
+                raise JamfAPIError(f"stream_by_id of {self._name} {target_id} failed: {resp.status_code}")
+            yield from iter_xml(resp)
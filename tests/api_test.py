@@ -4,16 +4,20 @@ The one wire call (``API.do`` -> ``session.send``) and the auth refresh are
 mocked; construction itself does no network.
 """
 # pylint: disable=missing-function-docstring,protected-access,redefined-outer-name
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from requests import Request
-from conftest import FQDN
+from requests import Request, Session
+from conftest import FQDN, make_response
 
 from jamfpy.client.client import ClassicAPI, ProAPI
 from jamfpy.client.http_config import HTTPConfig
 from jamfpy.client.constants import DEFAULT_HTTP_CONFIG_HEADERS
-from jamfpy.client.exceptions import JamfpyConfigError
+from jamfpy.client.exceptions import JamfAuthError, JamfpyConfigError
+from jamfpy.client.rate_limit import RateLimiter
+from jamfpy.client.cache import ResponseCache
+from jamfpy.client.store import DiskStore
+from jamfpy.client.hooks import RequestHook
 
 
 @pytest.fixture
@@ -63,11 +67,56 @@ def test_header_raises_on_bad_key(mock_auth, silent_logger):
         api.header("does-not-exist")
 
 
-def test_refresh_session_headers_sets_bearer(mock_auth, silent_logger):
+def test_refresh_auth_header_sets_bearer(mock_auth, silent_logger):
     api = _classic(mock_auth, silent_logger)
-    api._refresh_session_headers()
-    api._session.headers.clear.assert_called_once()
-    api._session.headers.update.assert_called_once_with({"Authorization": "Bearer tok"})
+    api._refresh_auth_header()
+    assert api._auth_header == {"Authorization": "Bearer tok"}
+    # The (possibly shared) session's own headers are never touched.
+    api._session.headers.clear.assert_not_called()
+    api._session.headers.update.assert_not_called()
+
+
+def test_refresh_auth_header_only_rerenders_on_new_token(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    api._refresh_auth_header()
+    first = api._auth_header
+
+    api._refresh_auth_header()
+    assert api._auth_header is first
+    # Validity is still checked on every call.
+    assert mock_auth.token.call_count == 2
+
+    mock_auth.token.return_value = "tok2"
+    api._refresh_auth_header()
+    assert api._auth_header == {"Authorization": "Bearer tok2"}
+
+
+def test_refresh_auth_header_picks_up_a_refresh_done_inside_token(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    api._refresh_auth_header()
+
+    # token() finds the token stale, refreshes it and returns the new one.
+    mock_auth.token.return_value = "tok2"
+    api._refresh_auth_header()
+    assert api._auth_header == {"Authorization": "Bearer tok2"}
+
+
+def test_concurrent_pages_each_carry_the_current_token(mock_auth, silent_logger):
+    api = ProAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(), safe_mode=True, session=Session(), logger=silent_logger)
+    tokens = iter(f"tok{n}" for n in range(100))
+    mock_auth.token.side_effect = lambda: next(tokens)
+    sent = []
+
+    def send(prepped, **_):
+        sent.append(prepped.headers.get("Authorization"))
+        return make_response({"totalCount": 10, "results": [{"id": str(len(sent))}]})
+
+    with patch.object(api._session, "send", side_effect=send):
+        api.scripts.get_all(page_size=1, max_workers=4)
+
+    assert len(sent) == 10
+    assert all(header and header.startswith("Bearer tok") for header in sent)
+    assert "Authorization" not in api._session.headers
 
 
 def test_do_prepares_and_sends(mock_auth, silent_logger):
@@ -82,8 +131,192 @@ def test_do_prepares_and_sends(mock_auth, silent_logger):
     assert result is sentinel
     api._session.prepare_request.assert_called_once()
     api._session.send.assert_called_once()
-    # Auth is refreshed before every send.
+    # Auth is checked before every send and the header lands on the prepared request.
     mock_auth.token.assert_called()
+    prepped.headers.update.assert_called_once_with({"Authorization": "Bearer tok"})
+
+
+def _throttled(retry_after=None):
+    return MagicMock(status_code=429, headers={"Retry-After": retry_after} if retry_after else {})
+
+
+def test_do_retries_throttled_response_after_retry_after(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    ok = MagicMock(status_code=200)
+    api._session.send.side_effect = [_throttled("2"), ok]
+
+    with patch("jamfpy.client.api.time.sleep") as mock_sleep:
+        result = api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    assert result is ok
+    assert api._session.send.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+def test_do_closes_throttled_streamed_response_before_retrying(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    throttled, ok = _throttled("0"), MagicMock(status_code=200)
+    api._session.send.side_effect = [throttled, ok]
+
+    with patch("jamfpy.client.api.time.sleep"):
+        result = api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"), stream=True)
+
+    assert result is ok
+    throttled.close.assert_called_once()
+    ok.close.assert_not_called()
+
+
+def test_do_backs_off_with_jitter_without_retry_after(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    api._session.send.side_effect = [MagicMock(status_code=503, headers={}), _throttled(),
+                                     MagicMock(status_code=200)]
+
+    with patch("jamfpy.client.api.time.sleep") as mock_sleep:
+        api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert 0 <= delays[0] <= 0.5
+    assert 0 <= delays[1] <= 1.0
+
+
+def test_do_gives_up_after_configured_retries(mock_auth, silent_logger):
+    api = ClassicAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(throttle_retries=2),
+                     session=MagicMock(), logger=silent_logger)
+    api._session.send.return_value = _throttled("1")
+
+    with patch("jamfpy.client.api.time.sleep"):
+        result = api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    assert result.status_code == 429
+    assert api._session.send.call_count == 3
+
+
+def test_do_returns_immediately_when_retry_after_exceeds_cap(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    api._session.send.return_value = _throttled("3600")
+
+    with patch("jamfpy.client.api.time.sleep") as mock_sleep:
+        result = api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    assert result.status_code == 429
+    mock_sleep.assert_not_called()
+
+
+def test_do_feeds_rate_limiter(mock_auth, silent_logger):
+    limiter = MagicMock(spec=RateLimiter)
+    api = ClassicAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(), session=MagicMock(),
+                     logger=silent_logger, rate_limiter=limiter)
+    api._session.send.side_effect = [_throttled("0"), MagicMock(status_code=200)]
+
+    with patch("jamfpy.client.api.time.sleep"):
+        api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    assert limiter.acquire.call_count == 2
+    limiter.on_throttled.assert_called_once()
+    limiter.on_success.assert_called_once()
+
+
+def _cached_classic(auth, logger):
+    api = ClassicAPI(fqdn=FQDN, auth=auth, http_config=HTTPConfig(), session=MagicMock(),
+                     logger=logger, cache=ResponseCache())
+    api._session.prepare_request.side_effect = lambda request: request.prepare()
+    api._session.send.side_effect = lambda *a, **kw: make_response({"n": api._session.send.call_count})
+    return api
+
+
+def test_do_serves_repeat_gets_from_cache(mock_auth, silent_logger):
+    api = _cached_classic(mock_auth, silent_logger)
+    url = f"{FQDN}/JSSResource/categories"
+
+    first = api.do(Request("GET", url=url, headers={"accept": "application/json"}))
+    second = api.do(Request("GET", url=url, headers={"accept": "application/json"}))
+
+    assert api._session.send.call_count == 1
+    assert second.json() == first.json() == {"n": 1}
+
+
+def test_do_serves_cache_hits_without_touching_auth(mock_auth, silent_logger):
+    recorder = _Recorder()
+    api = _hooked_classic(mock_auth, silent_logger, [recorder], cache=ResponseCache())
+    api._session.send.return_value = make_response({"categories": []})
+    url = f"{FQDN}/JSSResource/categories"
+
+    api.do(Request("GET", url=url))
+    mock_auth.token.reset_mock()
+    mock_auth.token.side_effect = AssertionError("a cache hit must not check the token")
+    hit = api.do(Request("GET", url=url))
+
+    assert hit.json() == {"categories": []}
+    mock_auth.token.assert_not_called()
+    assert [name for name, _ in recorder.calls] == ["before_send", "after_receive", "after_receive"]
+
+
+def test_do_write_invalidates_cached_resource(mock_auth, silent_logger):
+    api = _cached_classic(mock_auth, silent_logger)
+    url = f"{FQDN}/JSSResource/categories"
+
+    api.do(Request("GET", url=url))
+    api.do(Request("PUT", url=f"{url}/id/1", data="<category/>"))
+    refreshed = api.do(Request("GET", url=url))
+
+    assert api._session.send.call_count == 3
+    assert refreshed.json() == {"n": 3}
+
+
+def test_do_revalidates_stale_entry_and_serves_304_from_cache(mock_auth, silent_logger):
+    api = ClassicAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(), session=MagicMock(),
+                     logger=silent_logger, cache=ResponseCache(default_ttl=0))
+    api._session.prepare_request.side_effect = lambda request: request.prepare()
+    api._session.send.side_effect = [
+        make_response({"computers": [1, 2]}, headers={"ETag": '"v1"'}),
+        make_response(status=304, headers={"ETag": '"v1"'}),
+    ]
+    url = f"{FQDN}/JSSResource/computers"
+
+    api.do(Request("GET", url=url))
+    second = api.do(Request("GET", url=url))
+
+    revalidation = api._session.send.call_args_list[1].args[0]
+    assert revalidation.headers["If-None-Match"] == '"v1"'
+    assert second.status_code == 200
+    assert second.json() == {"computers": [1, 2]}
+
+
+def test_do_never_returns_a_bare_304_when_the_entry_is_evicted_in_flight(mock_auth, silent_logger):
+    api = ClassicAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(), session=MagicMock(),
+                     logger=silent_logger, cache=ResponseCache(default_ttl=0, max_entries=1))
+    api._session.prepare_request.side_effect = lambda request: request.prepare()
+    computers, sites = f"{FQDN}/JSSResource/computers", f"{FQDN}/JSSResource/sites"
+
+    def send(*_, **__):
+        if api._session.send.call_count == 1:
+            return make_response({"computers": [1, 2]}, headers={"ETag": '"v1"'})
+        # Another thread's read takes the only slot while this revalidation is on the wire.
+        api.cache.put(Request("GET", url=sites).prepare(), make_response({"sites": []}, headers={"ETag": "s"}))
+        return make_response(status=304, headers={"ETag": '"v1"'})
+
+    api._session.send.side_effect = send
+
+    api.do(Request("GET", url=computers))
+    second = api.do(Request("GET", url=computers))
+
+    assert second.status_code == 200
+    assert second.json() == {"computers": [1, 2]}
+
+
+def test_do_write_expires_stored_resource(mock_auth, silent_logger):
+    store = DiskStore()
+    store.replace_all("/JSSResource/sites:sites", {1: {"id": 1}}, resource="sites")
+    api = ClassicAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(), session=MagicMock(),
+                     logger=silent_logger, store=store)
+    api._session.prepare_request.side_effect = lambda request: request.prepare()
+    api._session.send.return_value = make_response(status=201)
+
+    api.do(Request("GET", url=f"{FQDN}/JSSResource/sites"))
+    assert store.get_all("/JSSResource/sites:sites") is not None
+
+    api.do(Request("POST", url=f"{FQDN}/JSSResource/sites/id/0", data="<site/>"))
+    assert store.get_all("/JSSResource/sites:sites") is None
 
 
 def test_close_invalidates_and_marks_closed(mock_auth, silent_logger):
@@ -92,3 +325,116 @@ def test_close_invalidates_and_marks_closed(mock_auth, silent_logger):
     api.close()
     mock_auth.invalidate.assert_called_once()
     assert api._is_closed is True
+
+
+class _Recorder(RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_send(self, event):
+        self.calls.append(("before_send", event))
+
+    def after_receive(self, event):
+        self.calls.append(("after_receive", event))
+
+    def on_error(self, event):
+        self.calls.append(("on_error", event))
+
+
+def _hooked_classic(auth, logger, hooks, **kwargs):
+    api = ClassicAPI(fqdn=FQDN, auth=auth, http_config=HTTPConfig(), session=MagicMock(),
+                     logger=logger, hooks=hooks, **kwargs)
+    api._session.prepare_request.side_effect = lambda request: request.prepare()
+    return api
+
+
+def test_do_reports_request_to_hooks(mock_auth, silent_logger):
+    recorder = _Recorder()
+    api = _hooked_classic(mock_auth, silent_logger, [recorder])
+    api._session.send.return_value = make_response({"computer": {"id": 7}})
+
+    api.do(Request("PUT", url=f"{FQDN}/JSSResource/computers/id/7", data="<computer/>"))
+
+    assert [name for name, _ in recorder.calls] == ["before_send", "after_receive"]
+    event = recorder.calls[-1][1]
+    assert (event.api, event.method, event.url_template, event.endpoint) == \
+           ("clc", "PUT", "/JSSResource/computers/id/{id}", "computers")
+    assert (event.status, event.attempts, event.bytes_out) == (200, 1, len("<computer/>"))
+    assert event.bytes_in == len(b'{"computer": {"id": 7}}')
+    assert event.total_secs >= event.send_secs >= 0
+
+
+def test_do_reports_rate_limit_wait_and_retries(mock_auth, silent_logger):
+    recorder = _Recorder()
+    limiter = MagicMock(spec=RateLimiter)
+    limiter.acquire.return_value = 0.25
+    api = _hooked_classic(mock_auth, silent_logger, [recorder], rate_limiter=limiter)
+    api._session.send.side_effect = [make_response({}, status=429, headers={"Retry-After": "0"}), make_response(status=200)]
+
+    with patch("jamfpy.client.api.time.sleep"):
+        api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    event = recorder.calls[-1][1]
+    assert event.attempts == 2
+    assert event.rate_limit_secs == 0.5
+
+
+def test_do_reports_cache_hits(mock_auth, silent_logger):
+    recorder = _Recorder()
+    api = _hooked_classic(mock_auth, silent_logger, [recorder], cache=ResponseCache())
+    api._session.send.return_value = make_response({"categories": []})
+
+    for _ in range(2):
+        api.do(Request("GET", url=f"{FQDN}/JSSResource/categories"))
+
+    assert [event.cache for name, event in recorder.calls if name == "after_receive"] == [None, "hit"]
+
+
+def test_do_reports_errors_and_reraises(mock_auth, silent_logger):
+    recorder = _Recorder()
+    api = _hooked_classic(mock_auth, silent_logger, [recorder])
+    api._session.send.side_effect = ConnectionError("boom")
+
+    with pytest.raises(ConnectionError):
+        api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    name, event = recorder.calls[-1]
+    assert name == "on_error"
+    assert isinstance(event.error, ConnectionError)
+    assert event.status is None
+
+
+def test_do_reports_token_failures_to_on_error(mock_auth, silent_logger):
+    recorder = _Recorder()
+    api = _hooked_classic(mock_auth, silent_logger, [recorder])
+    mock_auth.token.side_effect = JamfAuthError("bad credentials")
+
+    with pytest.raises(JamfAuthError):
+        api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"))
+
+    assert [name for name, _ in recorder.calls] == ["on_error"]
+    event = recorder.calls[0][1]
+    assert isinstance(event.error, JamfAuthError)
+    assert 0 < event.auth_secs <= event.total_secs
+    api._session.send.assert_not_called()
+
+
+def test_failing_hook_does_not_break_request(mock_auth, silent_logger):
+    broken = MagicMock(spec=RequestHook)
+    broken.after_receive.side_effect = RuntimeError("hook bug")
+    api = _hooked_classic(mock_auth, silent_logger, [broken])
+    api._session.send.return_value = make_response(status=200)
+
+    assert api.do(Request("GET", url=f"{FQDN}/JSSResource/computers")).status_code == 200
+
+
+def test_do_streams_without_touching_the_cache(mock_auth, silent_logger):
+    api = _cached_classic(mock_auth, silent_logger)
+    url = f"{FQDN}/JSSResource/computers"
+
+    api.do(Request("GET", url=url), stream=True)
+    api.do(Request("GET", url=url), stream=True)
+
+    assert api._session.send.call_count == 2
+    assert api._session.send.call_args.kwargs["stream"] is True
+    assert not api.cache._entries
@@ -0,0 +1,141 @@
+"""Unit tests for the asyncio clients in jamfpy.client.async_api.
+
+The wrapped sync client gets a MagicMock session, so ``session.send`` is the
+only network boundary; ``asyncio.run`` drives each coroutine.
+"""
+# pylint: disable=missing-function-docstring,protected-access,redefined-outer-name
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from requests import Request
+from conftest import FQDN, make_response
+
+from jamfpy.client.async_api import AsyncAPI, AsyncClassicAPI, AsyncProAPI
+from jamfpy.client.client import ProAPI
+from jamfpy.client.http_config import HTTPConfig
+from jamfpy.endpoints.models import AsyncEndpoint
+
+
+@pytest.fixture
+def mock_auth():
+    auth = MagicMock()
+    auth.token.return_value = "tok"
+    return auth
+
+
+def _classic(auth, logger, **kwargs):
+    return AsyncClassicAPI(fqdn=FQDN, auth=auth, http_config=HTTPConfig(),
+                           session=MagicMock(), logger=logger, **kwargs)
+
+
+def _pro(auth, logger, **kwargs):
+    return AsyncProAPI(fqdn=FQDN, auth=auth, http_config=HTTPConfig(),
+                       session=MagicMock(), logger=logger, **kwargs)
+
+
+def test_endpoints_are_wrapped_as_async_twins(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    assert isinstance(api.computers, AsyncEndpoint)
+    assert isinstance(api.accounts.users, AsyncEndpoint)
+    assert api.url() == f"{FQDN}/JSSResource"
+
+
+def test_own_session_pool_is_sized_to_thread_count(mock_auth, silent_logger):
+    api = AsyncProAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(), logger=silent_logger, max_threads=25)
+    assert api._api._session.get_adapter(FQDN)._pool_maxsize == 25
+
+
+def test_given_session_keeps_its_adapters(mock_auth, silent_logger):
+    shared = HTTPConfig().new_session()
+    adapter = shared.get_adapter(FQDN)
+
+    api = AsyncProAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(), session=shared,
+                      logger=silent_logger, max_threads=25)
+
+    assert api._api._session is shared
+    assert shared.get_adapter(FQDN) is adapter
+
+
+def test_do_passes_stream_through(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    api._api._session.send.return_value = MagicMock(status_code=200)
+
+    asyncio.run(api.do(Request("GET", url=f"{FQDN}/JSSResource/computers"), stream=True))
+
+    assert api._api._session.send.call_args.kwargs["stream"] is True
+
+
+def test_get_by_id_is_awaitable_and_builds_same_request(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    sentinel = MagicMock(status_code=200)
+    api._api._session.send.return_value = sentinel
+
+    result = asyncio.run(api.computers.get_by_id(5))
+
+    assert result is sentinel
+    request = api._api._session.prepare_request.call_args.args[0]
+    assert request.method == "GET"
+    assert request.url == f"{FQDN}/JSSResource/computers/id/5"
+
+
+def test_do_is_awaitable(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    sentinel = MagicMock(status_code=200)
+    api._api._session.send.return_value = sentinel
+    assert asyncio.run(api.do(Request("GET", url=f"{FQDN}/JSSResource/sites"))) is sentinel
+
+
+def test_thread_limit_is_respected(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger, max_threads=3)
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def send(*_, **__):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return MagicMock(status_code=200)
+
+    api._api._session.send.side_effect = send
+
+    async def main():
+        return await asyncio.gather(*(api.computers.get_by_id(i) for i in range(12)))
+
+    results = asyncio.run(main())
+    assert len(results) == 12
+    assert state["peak"] == 3
+
+
+def test_iter_all_becomes_async_generator(mock_auth, silent_logger):
+    sync_api = ProAPI(fqdn=FQDN, auth=mock_auth, http_config=HTTPConfig(),
+                      session=MagicMock(), logger=silent_logger)
+    sync_api._session.send.side_effect = [
+        make_response({"totalCount": 3, "results": [{"id": 0}, {"id": 1}]}),
+        make_response({"totalCount": 3, "results": [{"id": 2}]}),
+    ]
+    api = AsyncAPI(sync_api)
+
+    async def main():
+        return [record["id"] async for record in api.scripts.iter_all(page_size=2)]
+
+    assert asyncio.run(main()) == [0, 1, 2]
+
+
+def test_paginating_get_all_runs_off_loop(mock_auth, silent_logger):
+    api = _pro(mock_auth, silent_logger)
+    api._api._session.send.return_value = make_response({"totalCount": 1, "results": [{"id": 9}]})
+    result = asyncio.run(api.scripts.get_all())
+    assert json.loads(result.content) == {"totalCount": 1, "results": [{"id": 9}]}
+
+
+def test_close_invalidates_auth(mock_auth, silent_logger):
+    api = _classic(mock_auth, silent_logger)
+    asyncio.run(api.close())
+    mock_auth.invalidate.assert_called_once()
@@ -5,6 +5,9 @@ imported as ``jamfpy.client.auth.request`` — patched here so nothing hits a te
 """
 # pylint: disable=missing-function-docstring,protected-access
 import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 
@@ -13,6 +16,7 @@ from conftest import FQDN
 
 from jamfpy.client.auth import OAuth, BasicAuth
 from jamfpy.client.exceptions import JamfAuthError
+from jamfpy.client.token_store import FileTokenStore, MemoryTokenStore
 
 
 def _now():
@@ -204,6 +208,59 @@ def test_check_token_raises_when_buffer_exceeds_lifetime(silent_logger):
             auth.check_token()
 
 
+def test_token_fast_path_skips_full_check(silent_logger):
+    auth = _oauth(silent_logger, token_exp_thold_mins=20)
+    auth.token_expiry = _now() + 3600
+    auth._token_str = "live-token"
+    with patch.object(auth, "check_token") as mock_check:
+        assert auth.token() == "live-token"
+    mock_check.assert_not_called()
+
+
+def test_token_runs_full_check_inside_buffer(silent_logger):
+    auth = _oauth(silent_logger, token_exp_thold_mins=20)
+    auth.token_expiry = _now() + 10 * 60
+    with patch.object(auth, "check_token") as mock_check:
+        auth.token()
+    mock_check.assert_called_once()
+
+
+def test_new_token_replaces_token_and_expiry(silent_logger):
+    with patch("jamfpy.client.auth.request") as mock_req:
+        resp = MagicMock(ok=True)
+        resp.json.side_effect = [{"access_token": "abc", "expires_in": 3600}, {"access_token": "def", "expires_in": 60}]
+        mock_req.return_value = resp
+
+        auth = _oauth(silent_logger)
+        auth.set_new_token()
+        first_expiry = auth.token_expiry
+        auth.set_new_token()
+    assert auth._token_str == "def"
+    assert auth.token_expiry < first_expiry
+
+
+def test_concurrent_stale_token_refreshes_once(silent_logger):
+    auth = _oauth(silent_logger, token_exp_thold_mins=20)
+    auth.token_expiry = _now() + 10 * 60  # inside the buffer for every thread
+    auth._token_str = "old"
+    start = threading.Barrier(8)
+
+    def refresh():
+        time.sleep(0.05)  # hold the refresh open so the other threads pile up behind it
+        auth._set_token("new", _now() + 3600)
+
+    def call():
+        start.wait()
+        return auth.token()
+
+    with patch.object(auth, "set_new_token", side_effect=refresh) as mock_set:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokens = list(pool.map(lambda _: call(), range(8)))
+
+    mock_set.assert_called_once()
+    assert tokens == ["new"] * 8
+
+
 def test_token_returns_string_when_valid(silent_logger):
     auth = _oauth(silent_logger, token_exp_thold_mins=20)
     auth.token_expiry = _now() + 3600
@@ -211,6 +268,88 @@ def test_token_returns_string_when_valid(silent_logger):
     assert auth.token() == "live-token"
 
 
+# --- background renewal ----------------------------------------------------
+
+def test_background_renewal_refreshes_ahead_of_buffer(silent_logger):
+    auth = _oauth(silent_logger, token_exp_thold_mins=0)
+    auth._set_token("old", _now() + 0.1)
+    renewed = threading.Event()
+
+    def refresh():
+        auth._set_token("new", _now() + 3600)
+        renewed.set()
+
+    with patch.object(auth, "set_new_token", side_effect=refresh) as mock_set:
+        auth.start_background_renewal(lead_secs=0)
+        try:
+            assert renewed.wait(2)
+        finally:
+            auth.stop_background_renewal(timeout=2)
+
+    mock_set.assert_called_once()
+    assert auth._token_str == "new"
+    assert auth._renewal_thread is None
+
+
+def test_background_renewal_uses_keep_alive_for_bearer(silent_logger):
+    auth = _basic(silent_logger, token_exp_thold_mins=0)
+    auth._set_token("old", _now() + 60.1)  # renewal point is 0.1s away, expiry 60s
+    renewed = threading.Event()
+
+    def keep_alive():
+        auth._set_token("kept", _now() + 3600)
+        renewed.set()
+
+    with patch.object(auth, "_keep_alive_token", side_effect=keep_alive), \
+            patch.object(auth, "set_new_token") as mock_set:
+        auth.start_background_renewal(lead_secs=60)
+        try:
+            assert renewed.wait(2)
+        finally:
+            auth.stop_background_renewal(timeout=2)
+
+    mock_set.assert_not_called()
+
+
+def test_background_renewal_paces_tokens_shorter_than_the_buffer(silent_logger):
+    auth = _oauth(silent_logger, token_exp_thold_mins=20)
+    auth._set_token("old", _now() + 21 * 60)  # due at once: 21 min of life, 20 min buffer + 60s lead
+
+    def refresh():
+        auth._set_token("new", _now() + 21 * 60)
+
+    with patch.object(auth, "set_new_token", side_effect=refresh) as mock_set:
+        auth.start_background_renewal(lead_secs=60)
+        try:
+            time.sleep(0.2)
+        finally:
+            auth.stop_background_renewal(timeout=2)
+
+    mock_set.assert_called_once()
+    assert auth._renewal_due_at(60, _now()) >= _now() + 10 * 60
+
+
+def test_background_renewal_survives_failure(silent_logger):
+    auth = _oauth(silent_logger, token_exp_thold_mins=0)
+    auth._set_token("old", _now() - 1)
+    with patch.object(auth, "set_new_token", side_effect=JamfAuthError("down")):
+        auth.start_background_renewal(lead_secs=0)
+        time.sleep(0.05)
+        assert auth._renewal_thread.is_alive()
+        auth.stop_background_renewal(timeout=2)
+
+
+def test_start_background_renewal_is_idempotent(silent_logger):
+    auth = _oauth(silent_logger)
+    auth._set_token("tok", _now() + 3600)
+    auth.start_background_renewal()
+    thread = auth._renewal_thread
+    auth.start_background_renewal()
+    assert auth._renewal_thread is thread
+    auth.stop_background_renewal(timeout=2)
+    assert not thread.is_alive()
+
+
 # --- invalidate ------------------------------------------------------------
 
 def test_invalidate_returns_true_on_ok(silent_logger):
@@ -221,9 +360,134 @@ def test_invalidate_returns_true_on_ok(silent_logger):
         assert auth.invalidate() is True
 
 
+def test_invalidate_stops_background_renewal(silent_logger):
+    auth = _oauth(silent_logger)
+    auth._set_token("abc", _now() + 3600)
+    auth.start_background_renewal()
+    thread = auth._renewal_thread
+    with patch("jamfpy.client.auth.request") as mock_req:
+        mock_req.return_value = MagicMock(ok=True)
+        auth.invalidate()
+    assert not thread.is_alive()
+
+
+def test_invalidate_posts_to_tenant_url(silent_logger):
+    auth = _oauth(silent_logger)
+    auth._token_str = "abc"
+    with patch("jamfpy.client.auth.request") as mock_req:
+        mock_req.return_value = MagicMock(ok=True)
+        auth.invalidate()
+    assert mock_req.call_args.kwargs["url"] == f"{FQDN}/api/v1/auth/invalidate-token"
+
+
+def test_auth_calls_use_shared_session_when_supplied(silent_logger):
+    session = MagicMock()
+    resp = MagicMock(ok=True)
+    resp.json.return_value = {"access_token": "abc", "expires_in": 3600}
+    session.request.return_value = resp
+
+    auth = _oauth(silent_logger, session=session)
+    with patch("jamfpy.client.auth.request") as mock_req:
+        auth.set_new_token()
+    mock_req.assert_not_called()
+
+    kwargs = session.request.call_args.kwargs
+    assert kwargs["method"] == "POST"
+    assert kwargs["url"] == f"{FQDN}/api/oauth/token"
+    assert auth._token_str == "abc"
+
+
 def test_invalidate_returns_false_on_error(silent_logger):
     auth = _oauth(silent_logger)
     auth._token_str = "abc"
     with patch("jamfpy.client.auth.request") as mock_req:
         mock_req.return_value = MagicMock(ok=False)
         assert auth.invalidate() is False
+
+
+# --- Token store -------------------------------------------------------------
+
+def _minting_request(counter, token="minted"):
+    def respond(**_):
+        counter.append(1)
+        resp = MagicMock(ok=True)
+        resp.json.return_value = {"access_token": f"{token}-{len(counter)}", "expires_in": 3600}
+        return resp
+    return respond
+
+
+def test_fetch_token_adopts_valid_stored_token(silent_logger):
+    store = MemoryTokenStore()
+    store.save(f"oauth:{FQDN}:cid", "shared", _now() + 3600)
+    with patch("jamfpy.client.auth.request") as mock_req:
+        auth = _oauth(silent_logger, token_store=store)
+        auth.fetch_token()
+    mock_req.assert_not_called()
+    assert auth.token() == "shared"
+
+
+def test_fetch_token_mints_and_publishes_when_stored_is_in_buffer(silent_logger):
+    store = MemoryTokenStore()
+    store.save(f"oauth:{FQDN}:cid", "old", _now() + 60)
+    minted = []
+    with patch("jamfpy.client.auth.request", side_effect=_minting_request(minted)):
+        auth = _oauth(silent_logger, token_store=store)
+        auth.fetch_token()
+    assert auth._token_str == "minted-1"
+    assert store.load(f"oauth:{FQDN}:cid")[0] == "minted-1"
+
+
+def test_store_keys_separate_credentials(silent_logger):
+    store = MemoryTokenStore()
+    store.save(f"oauth:{FQDN}:other", "theirs", _now() + 3600)
+    minted = []
+    with patch("jamfpy.client.auth.request", side_effect=_minting_request(minted)):
+        _oauth(silent_logger, token_store=store).fetch_token()
+    assert len(minted) == 1
+
+
+def test_burst_of_auths_sharing_a_file_store_mints_once(silent_logger, tmp_path):
+    store_dir = tmp_path / "tokens"
+    minted = []
+    with patch("jamfpy.client.auth.request", side_effect=_minting_request(minted)):
+        # A fresh store and Auth per worker, as separate short-lived jobs would have.
+        auths = [_oauth(silent_logger, token_store=FileTokenStore(store_dir)) for _ in range(20)]
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            tokens = list(pool.map(lambda auth: auth.token(), auths))
+    assert len(minted) == 1
+    assert set(tokens) == {"minted-1"}
+
+
+def test_invalidate_leaves_a_shared_token_alone(silent_logger):
+    store = MemoryTokenStore()
+    auth = _oauth(silent_logger, token_store=store)
+    auth._set_token("shared", _now() + 3600)
+    store.save(f"oauth:{FQDN}:cid", "shared", auth.token_expiry)
+    with patch("jamfpy.client.auth.request") as mock_req:
+        assert auth.invalidate() is False
+    # Other processes holding the token keep working: nothing revoked, nothing dropped.
+    mock_req.assert_not_called()
+    assert store.load(f"oauth:{FQDN}:cid")[0] == "shared"
+
+
+def test_invalidate_with_revoke_forgets_our_stored_token(silent_logger):
+    store = MemoryTokenStore()
+    auth = _oauth(silent_logger, token_store=store)
+    auth._set_token("mine", _now() + 3600)
+    store.save(f"oauth:{FQDN}:cid", "mine", auth.token_expiry)
+    with patch("jamfpy.client.auth.request", return_value=MagicMock(ok=True)) as mock_req:
+        assert auth.invalidate(revoke=True) is True
+    assert store.load(f"oauth:{FQDN}:cid") is None
+    assert mock_req.call_args.kwargs["url"] == f"{FQDN}/api/v1/auth/invalidate-token"
+
+
+def test_bearer_keep_alive_is_published(silent_logger):
+    store = MemoryTokenStore()
+    auth = _basic(silent_logger, token_store=store)
+    auth._set_token("old", _now() + 600)
+    with patch("jamfpy.client.auth.request") as mock_req:
+        resp = MagicMock(ok=True)
+        resp.json.return_value = {"token": "kept", "expires": "2099-01-01T00:00:00.000Z"}
+        mock_req.return_value = resp
+        auth.check_token()
+    assert store.load(f"bearer:{FQDN}:user")[0] == "kept"
@@ -0,0 +1,186 @@
+"""Unit tests for the TTL + LRU ResponseCache."""
+# pylint: disable=missing-function-docstring
+import json
+from unittest.mock import patch
+
+from requests import Request
+from conftest import FQDN, make_response
+
+from jamfpy.client.cache import ResponseCache, resource_of
+
+CLASSIC = f"{FQDN}/JSSResource"
+PRO = f"{FQDN}/api/v1"
+
+
+def _get(url, accept="application/json"):
+    return Request("GET", url=url, headers={"accept": accept}).prepare()
+
+
+def test_resource_of_classic_and_pro_urls():
+    assert resource_of(f"{CLASSIC}/categories/id/4") == "categories"
+    assert resource_of(f"{PRO}/scripts?page=0&page-size=100") == "scripts"
+    assert resource_of(f"{FQDN}/api/oauth/token") is None
+
+
+def test_hit_returns_copy_of_stored_response():
+    cache = ResponseCache()
+    cache.put(_get(f"{CLASSIC}/categories"), make_response({"categories": []}))
+
+    hit = cache.get(_get(f"{CLASSIC}/categories"))
+
+    assert json.loads(hit.content) == {"categories": []}
+    assert hit is not cache.get(_get(f"{CLASSIC}/categories"))
+    assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_key_includes_accept_header():
+    cache = ResponseCache()
+    cache.put(_get(f"{CLASSIC}/sites"), make_response({}))
+    assert cache.get(_get(f"{CLASSIC}/sites", accept="text/xml")) is None
+
+
+def test_entries_expire_after_resource_ttl():
+    cache = ResponseCache(default_ttl=60, ttls={"sites": 5})
+    with patch("jamfpy.client.cache.time.monotonic", return_value=100.0):
+        cache.put(_get(f"{CLASSIC}/sites"), make_response({}))
+        cache.put(_get(f"{CLASSIC}/buildings"), make_response({}))
+
+    with patch("jamfpy.client.cache.time.monotonic", return_value=106.0):
+        assert cache.get(_get(f"{CLASSIC}/sites")) is None
+        assert cache.get(_get(f"{CLASSIC}/buildings")) is not None
+    assert len(cache) == 1
+
+
+def test_default_cache_only_serves_reference_lists():
+    cache = ResponseCache(conditional=False)
+    cache.put(_get(f"{CLASSIC}/categories"), make_response({}))
+    cache.put(_get(f"{CLASSIC}/computers/id/1"), make_response({}))
+    cache.put(_get(f"{FQDN}/api/v2/mdm/commands?page=0"), make_response({}))
+
+    assert cache.get(_get(f"{CLASSIC}/categories")) is not None
+    assert cache.get(_get(f"{CLASSIC}/computers/id/1")) is None
+    assert cache.get(_get(f"{FQDN}/api/v2/mdm/commands?page=0")) is None
+
+
+def test_default_cache_revalidates_volatile_reads_instead_of_serving_them():
+    cache = ResponseCache()
+    prepped = _get(f"{FQDN}/api/v2/mdm/commands?page=0")
+    cache.put(prepped, make_response({}, headers={"ETag": '"v1"'}))
+
+    assert cache.get(prepped) is None
+    assert cache.conditional_headers(prepped) == {"If-None-Match": '"v1"'}
+
+
+def test_zero_ttl_disables_caching_for_resource():
+    cache = ResponseCache(ttls={"computers": 0})
+    cache.put(_get(f"{CLASSIC}/computers"), make_response({}))
+    assert len(cache) == 0
+
+
+def test_failed_responses_are_not_cached():
+    cache = ResponseCache()
+    cache.put(_get(f"{CLASSIC}/sites"), make_response({}, status=500))
+    assert len(cache) == 0
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put(_get(f"{CLASSIC}/sites"), make_response({}))
+    cache.put(_get(f"{CLASSIC}/buildings"), make_response({}))
+    cache.get(_get(f"{CLASSIC}/sites"))
+    cache.put(_get(f"{CLASSIC}/departments"), make_response({}))
+
+    assert cache.get(_get(f"{CLASSIC}/buildings")) is None
+    assert cache.get(_get(f"{CLASSIC}/sites")) is not None
+    assert cache.get(_get(f"{CLASSIC}/departments")) is not None
+
+
+def test_invalidate_url_drops_only_that_resource():
+    cache = ResponseCache()
+    cache.put(_get(f"{CLASSIC}/categories"), make_response({}))
+    cache.put(_get(f"{CLASSIC}/categories/id/1"), make_response({}))
+    cache.put(_get(f"{CLASSIC}/sites"), make_response({}))
+
+    cache.invalidate_url(f"{CLASSIC}/categories/id/1")
+
+    assert len(cache) == 1
+    assert cache.get(_get(f"{CLASSIC}/sites")) is not None
+
+
+def test_invalidate_all():
+    cache = ResponseCache()
+    cache.put(_get(f"{CLASSIC}/sites"), make_response({}))
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def _expired(cache, url, **headers):
+    """Store a response for url that is already past its TTL."""
+    with patch("jamfpy.client.cache.time.monotonic", return_value=0.0):
+        cache.put(_get(url), make_response({"v": 1}, headers=headers))
+
+
+def test_stale_entry_with_validators_yields_conditional_headers():
+    cache = ResponseCache(default_ttl=5)
+    _expired(cache, f"{PRO}/scripts", ETag='"abc"', **{"Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"})
+
+    assert cache.get(_get(f"{PRO}/scripts")) is None
+    assert cache.conditional_headers(_get(f"{PRO}/scripts")) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT",
+    }
+
+
+def test_stale_entry_without_validators_is_dropped():
+    cache = ResponseCache(default_ttl=5)
+    _expired(cache, f"{PRO}/scripts")
+    assert cache.get(_get(f"{PRO}/scripts")) is None
+    assert cache.conditional_headers(_get(f"{PRO}/scripts")) == {}
+    assert len(cache) == 0
+
+
+def test_not_modified_is_served_from_stored_body_and_refreshed():
+    cache = ResponseCache(default_ttl=5)
+    _expired(cache, f"{PRO}/scripts", ETag='"abc"')
+
+    served = cache.store(_get(f"{PRO}/scripts"), make_response(status=304, headers={"ETag": '"abc"'}))
+
+    assert served.status_code == 200
+    assert json.loads(served.content) == {"v": 1}
+    assert cache.revalidations == 1
+    # Fresh again for another TTL.
+    assert cache.get(_get(f"{PRO}/scripts")) is not None
+
+
+def test_not_modified_without_entry_is_passed_through():
+    cache = ResponseCache()
+    not_modified = make_response(status=304)
+    assert cache.store(_get(f"{PRO}/scripts"), not_modified) is not_modified
+
+
+def test_not_modified_after_invalidation_is_served_from_the_revalidated_response():
+    cache = ResponseCache(default_ttl=5)
+    _expired(cache, f"{PRO}/scripts", ETag='"abc"')
+    conditional, revalidated = cache.revalidation(_get(f"{PRO}/scripts"))
+    assert conditional == {"If-None-Match": '"abc"'}
+
+    cache.invalidate("scripts")
+    served = cache.store(_get(f"{PRO}/scripts"), make_response(status=304), revalidated)
+
+    assert served.status_code == 200 and json.loads(served.content) == {"v": 1}
+    # The write that invalidated it wins: it is not stored again.
+    assert len(cache) == 0
+
+
+def test_zero_ttl_always_revalidates_when_validators_present():
+    cache = ResponseCache(ttls={"computers": 0})
+    cache.put(_get(f"{CLASSIC}/computers"), make_response({}, headers={"ETag": "x"}))
+    assert cache.get(_get(f"{CLASSIC}/computers")) is None
+    assert cache.conditional_headers(_get(f"{CLASSIC}/computers")) == {"If-None-Match": "x"}
+
+
+def test_conditional_off_drops_stale_entries():
+    cache = ResponseCache(default_ttl=5, conditional=False)
+    _expired(cache, f"{PRO}/scripts", ETag='"abc"')
+    assert cache.get(_get(f"{PRO}/scripts")) is None
+    assert len(cache) == 0
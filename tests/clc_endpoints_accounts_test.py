@@ -1,5 +1,6 @@
 """Unit tests for the Accounts composite endpoint (response transforms)."""
 # pylint: disable=missing-function-docstring
+import io
 import json
 
 import pytest
@@ -83,3 +84,49 @@ def test_accounts_get_all_hits_accounts_resource():
     api = FakeAPI()
     Accounts(api).get_all()
     assert api.last_request.url == f"{BASE}/accounts"
+
+
+def _xml_response(body):
+    """A streamed Response: the body is only available by reading ``raw``."""
+    resp = make_response()
+    resp.raw = io.BytesIO(body.encode())
+    return resp
+
+
+ACCOUNTS_XML = (
+    "<accounts><users><user><id>1</id><name>a</name></user><user><id>3</id><name>b</name></user></users>"
+    "<groups><group><id>2</id><name>admins</name></group></groups></accounts>"
+)
+
+
+def test_users_stream_all_yields_only_users():
+    api = FakeAPI(responses=[_xml_response(ACCOUNTS_XML)])
+    assert list(AccountUsers(api).stream_all()) == [{"id": "1", "name": "a"}, {"id": "3", "name": "b"}]
+    assert api.streamed
+    assert api.last_request.url == f"{BASE}/accounts"
+    assert api.last_request.headers == H["crud"]["read"]["xml"]
+
+
+def test_groups_stream_all_yields_a_single_group():
+    api = FakeAPI(responses=[_xml_response(ACCOUNTS_XML)])
+    assert list(AccountGroups(api).stream_all()) == [{"id": "2", "name": "admins"}]
+
+
+def test_account_child_stream_by_id_uses_by_id_uri():
+    api = FakeAPI(responses=[_xml_response("<account><id>5</id><name>a</name></account>")])
+    assert list(AccountUsers(api).stream_by_id(5)) == [("id", "5"), ("name", "a")]
+    assert api.streamed
+    assert api.last_request.url == f"{BASE}/accounts/userid/5"
+
+
+def test_account_child_get_by_ids_forwards_sections():
+    api = FakeAPI()
+    AccountGroups(api).get_by_ids([5], sections=["Privileges"])
+    assert api.last_request.url == f"{BASE}/accounts/groupid/5/subset/Privileges"
+
+
+def test_users_get_all_as_xml_returns_the_accounts_payload():
+    raw = make_response()
+    api = FakeAPI(responses=[raw])
+    assert AccountUsers(api).get_all(xml_response=True) is raw
+    assert api.last_request.headers == H["crud"]["read"]["xml"]
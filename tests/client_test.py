@@ -0,0 +1,61 @@
+"""Unit tests for lazy endpoint wiring on ClassicAPI / ProAPI."""
+# pylint: disable=missing-function-docstring,protected-access,redefined-outer-name
+from unittest.mock import MagicMock
+
+import pytest
+from conftest import FQDN
+
+from jamfpy.client.client import ClassicAPI, ProAPI, _LazyEndpoint
+from jamfpy.endpoints.models import Endpoint
+from jamfpy.endpoints.clc_endpoints import Policies
+from jamfpy.endpoints.pro_mdm_commands import MDMCommands
+
+
+def _lazy_names(api_cls):
+    return [name for name, attr in vars(api_cls).items() if isinstance(attr, _LazyEndpoint)]
+
+
+@pytest.fixture
+def classic(silent_logger):
+    return ClassicAPI(fqdn=FQDN, auth=MagicMock(), session=MagicMock(), logger=silent_logger)
+
+
+@pytest.fixture
+def pro(silent_logger):
+    return ProAPI(fqdn=FQDN, auth=MagicMock(), session=MagicMock(), logger=silent_logger)
+
+
+def test_construction_builds_no_endpoints(classic, pro):
+    assert not any(isinstance(v, Endpoint) for v in vars(classic).values())
+    assert not any(isinstance(v, Endpoint) for v in vars(pro).values())
+
+
+def test_endpoint_is_built_once_on_first_access(classic):
+    policies = classic.policies
+    assert isinstance(policies, Policies)
+    assert policies._api is classic
+    assert classic.policies is policies
+    assert vars(classic)["policies"] is policies
+
+
+def test_endpoints_are_per_instance(classic, silent_logger):
+    other = ClassicAPI(fqdn=FQDN, auth=MagicMock(), session=MagicMock(), logger=silent_logger)
+    assert other.policies is not classic.policies
+
+
+@pytest.mark.parametrize("name", _lazy_names(ClassicAPI))
+def test_every_classic_endpoint_resolves(classic, name):
+    assert isinstance(getattr(classic, name), Endpoint)
+
+
+@pytest.mark.parametrize("name", _lazy_names(ProAPI))
+def test_every_pro_endpoint_resolves(pro, name):
+    assert isinstance(getattr(pro, name), Endpoint)
+
+
+def test_pro_mdm_is_mdm_commands(pro):
+    assert isinstance(pro.mdm, MDMCommands)
+
+
+def test_class_access_returns_descriptor():
+    assert isinstance(ClassicAPI.computers, _LazyEndpoint)
@@ -32,6 +32,7 @@ def make_response(json_body=None, status=200, encoding="utf-8", headers=None, ur
         resp.headers.update(headers)
     if json_body is not None:
         resp._content = json.dumps(json_body).encode(encoding)
+        resp._content_consumed = True
     return resp
 
 
@@ -42,12 +43,21 @@ class FakeAPI:
     so this is enough to unit-test request construction in isolation.
     """
 
-    def __init__(self, responses=None):
+    def __init__(self, responses=None, responder=None):
         self.requests = []
         self._responses = list(responses) if responses is not None else []
+        # Optional ``request -> response`` callable, for concurrent flows where
+        # a FIFO queue can't know which request arrives first.
+        self._responder = responder
         # Returned by do() when no explicit response queue is supplied; most
         # endpoint tests assert on the recorded Request, not the return value.
         self.default_response = object()
+        # Mirrors ``API.store``; tests that exercise the disk cache set a DiskStore here.
+        self.store = None
+        # Mirrors ``ProAPI.management_index``; set to resolve non-management-id identifiers.
+        self.management_index = None
+        # Whether the last do() asked for an unread (streamed) body.
+        self.streamed = False
 
     @property
     def last_request(self):
@@ -64,9 +74,12 @@ class FakeAPI:
         """Return the real CRUD header set so header shape matches production."""
         return DEFAULT_HTTP_CONFIG_HEADERS["crud"][key]
 
-    def do(self, request):
+    def do(self, request, stream=False):
         """Record the Request and return the next queued (or default) response."""
         self.requests.append(request)
+        self.streamed = stream
+        if self._responder is not None:
+            return self._responder(request)
         if self._responses:
             return self._responses.pop(0)
         return self.default_response
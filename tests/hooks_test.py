@@ -0,0 +1,87 @@
+"""Unit tests for request events, URL templating and the MetricsCollector."""
+# pylint: disable=missing-function-docstring
+import pytest
+
+from conftest import FQDN
+
+from jamfpy.client.hooks import RequestEvent, MetricsCollector, url_template, LATENCY_BUCKETS_MS
+
+
+@pytest.mark.parametrize("url, template", [
+    (f"{FQDN}/JSSResource/computers", "/JSSResource/computers"),
+    (f"{FQDN}/JSSResource/computers/id/42/subset/General", "/JSSResource/computers/id/{id}/subset/General"),
+    (f"{FQDN}/JSSResource/computers/serialnumber/C02XYZ", "/JSSResource/computers/serialnumber/{serialnumber}"),
+    (f"{FQDN}/JSSResource/policies/name/Install%20Office", "/JSSResource/policies/name/{name}"),
+    (f"{FQDN}/api/v1/scripts/12?page=0", "/api/v1/scripts/{id}"),
+    (f"{FQDN}/api/v2/mdm/commands/1b4e28ba-2fa1-11d2-883f-0016d3cca427", "/api/v2/mdm/commands/{id}"),
+])
+def test_url_template(url, template):
+    assert url_template(url) == template
+
+
+def _event(url=f"{FQDN}/JSSResource/computers/id/1", method="GET", status=200, total=0.02, **fields):
+    event = RequestEvent("clc", method, url)
+    event.status, event.total_secs = status, total
+    for name, value in fields.items():
+        setattr(event, name, value)
+    return event
+
+
+def test_event_fields_from_url():
+    event = RequestEvent("pro", "GET", f"{FQDN}/api/v1/scripts/3")
+    assert (event.endpoint, event.url_template, event.status) == ("scripts", "/api/v1/scripts/{id}", None)
+
+
+def test_collector_groups_by_method_and_template():
+    metrics = MetricsCollector()
+    metrics.after_receive(_event(f"{FQDN}/JSSResource/computers/id/1", bytes_in=100))
+    metrics.after_receive(_event(f"{FQDN}/JSSResource/computers/id/2", bytes_in=50, status=404))
+    metrics.after_receive(_event(f"{FQDN}/JSSResource/computers/id/2", method="DELETE"))
+
+    stats = metrics.snapshot()
+    assert set(stats) == {"GET /JSSResource/computers/id/{id}", "DELETE /JSSResource/computers/id/{id}"}
+    get = stats["GET /JSSResource/computers/id/{id}"]
+    assert (get["count"], get["bytes_in"], get["statuses"], get["endpoint"]) == (2, 150, {200: 1, 404: 1}, "computers")
+
+
+def test_collector_histogram_and_percentiles():
+    metrics = MetricsCollector()
+    for total in [0.001] * 90 + [0.3] * 9 + [60.0]:
+        metrics.after_receive(_event(total=total))
+
+    stats = metrics.snapshot()["GET /JSSResource/computers/id/{id}"]
+    assert sum(stats["histogram"]) == 100
+    assert stats["histogram"][0] == 90
+    assert stats["histogram"][-1] == 1
+    assert MetricsCollector.percentile(stats, 0.5) == LATENCY_BUCKETS_MS[0]
+    assert MetricsCollector.percentile(stats, 0.95) == 500
+    assert MetricsCollector.percentile(stats, 1.0) == float("inf")
+
+
+def test_collector_counts_errors_and_cache_hits():
+    metrics = MetricsCollector()
+    metrics.on_error(_event(status=None, error=ConnectionError()))
+    metrics.after_receive(_event(cache="hit"))
+
+    stats = metrics.snapshot()["GET /JSSResource/computers/id/{id}"]
+    assert (stats["count"], stats["errors"], stats["cache_hits"]) == (2, 1, 1)
+
+
+def test_snapshot_is_a_copy_and_reset_clears():
+    metrics = MetricsCollector()
+    metrics.after_receive(_event())
+    metrics.snapshot()["GET /JSSResource/computers/id/{id}"]["histogram"][0] = 99
+
+    assert metrics.snapshot()["GET /JSSResource/computers/id/{id}"]["histogram"][0] <= 1
+    metrics.reset()
+    assert not metrics.snapshot()
+
+
+def test_summary_lists_slowest_first():
+    metrics = MetricsCollector()
+    metrics.after_receive(_event(f"{FQDN}/JSSResource/sites", total=0.01))
+    metrics.after_receive(_event(f"{FQDN}/JSSResource/computers", total=2.0))
+
+    lines = metrics.summary().splitlines()
+    assert lines[1].startswith("GET /JSSResource/computers")
+    assert lines[2].startswith("GET /JSSResource/sites")
@@ -1,5 +1,5 @@
 """Unit tests for HTTPConfig."""
-# pylint: disable=missing-function-docstring
+# pylint: disable=missing-function-docstring,protected-access
 from jamfpy.client.http_config import HTTPConfig
 from jamfpy.client.constants import DEFAULT_HTTP_CONFIG_URLS, DEFAULT_HTTP_CONFIG_HEADERS
 
@@ -22,3 +22,20 @@ def test_partial_override_keeps_default_for_the_other():
     config = HTTPConfig(urls={"only": "urls"})
     assert config.urls == {"only": "urls"}
     assert config.headers is DEFAULT_HTTP_CONFIG_HEADERS
+
+
+def test_new_session_mounts_configured_adapter():
+    config = HTTPConfig(pool_connections=4, pool_maxsize=32, pool_block=True, max_retries=2)
+    session = config.new_session()
+    adapter = session.get_adapter("https://test.jamfcloud.com")
+    assert session.get_adapter("http://test.jamfcloud.com") is adapter
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == 2
+
+
+def test_new_adapter_widens_but_never_shrinks_pool():
+    config = HTTPConfig(pool_maxsize=10)
+    assert config.new_adapter(pool_maxsize=50)._pool_maxsize == 50
+    assert config.new_adapter(pool_maxsize=2)._pool_maxsize == 10
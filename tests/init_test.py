@@ -1,10 +1,19 @@
 """Smoke test for the jamfpy public surface (formalizes the AGENTS.md import check)."""
 # pylint: disable=missing-function-docstring
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 import jamfpy
 
-PUBLIC_NAMES = ["Tenant", "OAuth", "BasicAuth", "API", "ProAPI", "ClassicAPI", "new_logger"]
+PUBLIC_NAMES = ["Tenant", "warm_tenants", "TenantPool", "OAuth", "BasicAuth", "API", "ProAPI", "ClassicAPI",
+                "AsyncAPI", "AsyncProAPI", "AsyncClassicAPI", "RateLimiter", "ResponseCache", "DiskStore",
+                "TokenStore", "MemoryTokenStore", "FileTokenStore", "RequestEvent", "RequestHook", "MetricsCollector",
+                "ManagementIdIndex", "Record", "ClassicComputer", "ClassicMobileDevice", "ClassicPolicy", "ProScript",
+                "ProComputerInventory", "ProMobileDevice",
+                "new_logger"]
 
 
 @pytest.mark.parametrize("name", PUBLIC_NAMES)
@@ -14,3 +23,17 @@ def test_public_name_is_exported(name):
 
 def test_tenant_is_a_class():
     assert isinstance(jamfpy.Tenant, type)
+
+
+# Loaded on first use only; importing any of them from jamfpy's import path slows every caller.
+DEFERRED_MODULES = ["asyncio", "sqlite3", "jamfpy.client.async_api", "jamfpy.client.pool", "jamfpy.client.store",
+                    "jamfpy.client.sync", "jamfpy.client.management_index", "jamfpy.client.records",
+                    "jamfpy.client.generated_records", "jamfpy.client.hooks", "jamfpy.client.token_store",
+                    "jamfpy.endpoints"]
+
+
+def test_import_defers_optional_modules():
+    code = f"import sys, jamfpy; print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).resolve().parent.parent).stdout
+    assert loaded.strip() == "[]"
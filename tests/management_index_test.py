@@ -0,0 +1,161 @@
+"""Unit tests for resolving device identifiers to management ids with ManagementIdIndex."""
+# pylint: disable=missing-function-docstring,redefined-outer-name
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from conftest import FakeAPI, make_response
+
+from jamfpy.client.exceptions import JamfAPIError
+from jamfpy.client.management_index import ManagementIdIndex
+from jamfpy.client.store import DiskStore
+from jamfpy.endpoints.pro_computers_inventory import ComputersInventory
+from jamfpy.endpoints.pro_mobile_devices import MobileDevices
+from jamfpy.endpoints.pro_mdm_commands import MDMCommands
+
+
+def _computer(cid, name, serial, udid=None):
+    return {"id": str(cid), "udid": udid or f"UDID-C{cid}",
+            "general": {"name": name, "managementId": f"mc-{cid}", "platform": "Mac"},
+            "hardware": {"serialNumber": serial, "model": "MacBook"}}
+
+
+def _mobile(mid, name, serial):
+    return {"id": str(mid), "name": name, "serialNumber": serial, "udid": f"udid-m{mid}", "managementId": f"mm-{mid}"}
+
+
+class FakeInventory:
+    """Serves computers-inventory and v2 mobile-devices pages, recording each query."""
+
+    def __init__(self, computers, mobile_devices):
+        self.computers, self.mobile_devices = computers, mobile_devices
+        self.queries = []
+
+    def __call__(self, request):
+        url = urlsplit(request.url)
+        query = parse_qs(url.query)
+        self.queries.append((url.path, query))
+        records = self.computers if url.path.endswith("/computers-inventory") else self.mobile_devices
+        if "filter" in query:
+            records = records[-1:]  # stands in for "reported since"
+        page, size = int(query["page"][0]), int(query["page-size"][0])
+        return make_response({"totalCount": len(records), "results": records[page * size:(page + 1) * size]})
+
+
+@pytest.fixture
+def inventory():
+    return FakeInventory(
+        [_computer(1, "alpha", "C02AAA"), _computer(2, "bravo", "C02BBB"), _computer(3, "alpha", "C02CCC")],
+        [_mobile(1, "ipad-1", "DMQAAA")],
+    )
+
+
+def _index(inventory, **kwargs):
+    api = FakeAPI(responder=inventory)
+    pro = SimpleNamespace(computers_inventory=ComputersInventory(api), mobile_devices=MobileDevices(api))
+    return ManagementIdIndex(pro, max_workers=1, **kwargs)
+
+
+def test_load_requests_only_the_needed_sections(inventory):
+    index = _index(inventory)
+    assert index.load() == 4
+
+    path, query = inventory.queries[0]
+    assert path == "/api/v1/computers-inventory"
+    assert query["section"] == ["GENERAL", "HARDWARE"]
+    assert inventory.queries[-1][0] == "/api/v2/mobile-devices"
+
+
+@pytest.mark.parametrize("identifier, kind, expected", [
+    ("mc-2", None, "mc-2"),
+    ("C02BBB", None, "mc-2"),
+    ("c02bbb", None, "mc-2"),
+    ("udid-c3", None, "mc-3"),
+    ("bravo", None, "mc-2"),
+    ("ipad-1", None, "mm-1"),
+    (2, "computer_id", "mc-2"),
+    ("1", "mobile_device_id", "mm-1"),
+])
+def test_resolve(inventory, identifier, kind, expected):
+    assert _index(inventory).resolve(identifier, kind=kind) == expected
+
+
+def test_ambiguous_identifiers_raise(inventory):
+    index = _index(inventory)
+    with pytest.raises(KeyError):
+        index.resolve("alpha")  # two computers share the name
+    assert index.resolve(1, kind="computer_id") == "mc-1"
+
+
+def test_classic_ids_need_a_kind(inventory):
+    index = _index(inventory)
+    with pytest.raises(KeyError):
+        index.resolve(2)  # only computer 2 exists, but a bare number names no device type
+    assert index.resolve(2, kind="computer_id") == "mc-2"
+
+
+def test_miss_refreshes_once_then_raises(inventory):
+    index = _index(inventory)
+    index.load()
+    inventory.computers.append(_computer(4, "delta", "C02DDD"))
+
+    assert index.resolve("C02DDD") == "mc-4"
+    refresh_query = inventory.queries[-2][1]
+    assert refresh_query["filter"][0].startswith("general.reportDate=ge=")
+
+    before = len(inventory.queries)
+    with pytest.raises(KeyError):
+        index.resolve_many(["C02AAA", "nope"])
+    assert len(inventory.queries) == before + 2
+
+
+def test_invalid_kind_raises(inventory):
+    with pytest.raises(KeyError):
+        _index(inventory).resolve("x", kind="asset_tag")
+
+
+def test_store_persists_index_across_instances(inventory):
+    store = DiskStore()
+    _index(inventory, store=store).load()
+    requests_after_first = len(inventory.queries)
+
+    second = _index(inventory, store=store)
+    assert second.resolve("C02AAA") == "mc-1"
+    assert len(inventory.queries) == requests_after_first
+
+
+def test_mdm_wrappers_accept_identifiers_through_index(inventory):
+    api = FakeAPI(responder=lambda request: make_response([{"id": "cmd"}], status=201))
+    api.management_index = _index(inventory)
+
+    MDMCommands(api).restart_device(["C02BBB"])
+
+    assert api.last_request.json["clientData"] == [{"managementId": "mc-2"}]
+
+
+def test_batched_results_are_keyed_by_management_id(inventory):
+    api = FakeAPI(responder=lambda request: make_response([{"id": "c"}] * len(request.json["clientData"]), status=201))
+    api.management_index = _index(inventory)
+
+    result = MDMCommands(api).send_command_batched("DEVICE_LOCATION", ["C02AAA", "bravo", "mc-1"])
+
+    assert list(result.succeeded) == ["mc-1", "mc-2"]
+
+
+def test_mdm_commands_resolve_classic_ids_by_device_type(inventory):
+    api = FakeAPI(responder=lambda request: make_response([{"id": "c"}] * len(request.json["clientData"]), status=201))
+    api.management_index = _index(inventory)
+    mdm = MDMCommands(api)
+
+    # Computer 1 and mobile device 1 both exist; id_kind picks one and is not sent as command data.
+    mdm.send_command("DEVICE_LOCK", ["1"], id_kind="mobile_device_id")
+    assert api.last_request.json == {"clientData": [{"managementId": "mm-1"}], "commandData": {"commandType": "DEVICE_LOCK"}}
+
+    result = mdm.send_command_batched("DEVICE_LOCATION", [1, 2], id_kind="computer_id")
+    assert list(result.succeeded) == ["mc-1", "mc-2"]
+    assert "id_kind" not in result.command_data
+
+
+def test_id_kind_without_an_index_raises():
+    with pytest.raises(JamfAPIError):
+        MDMCommands(FakeAPI()).send_command("DEVICE_LOCK", ["1"], id_kind="computer_id")
@@ -0,0 +1,148 @@
+"""Unit tests for following MDM commands to completion with CommandTracker."""
+# pylint: disable=missing-function-docstring
+from datetime import datetime, timezone
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from conftest import FakeAPI, make_response
+
+from jamfpy.endpoints.pro_mdm_commands import MDMCommands
+from jamfpy.endpoints.mdm_batch import MDMBatchResult
+from jamfpy.endpoints.mdm_tracker import CommandTracker
+
+
+class FakeCommandServer:
+    """Answers GET /v2/mdm/commands from a uuid -> state table, honouring uuid filters and paging."""
+
+    def __init__(self, states):
+        self.states = states
+        self.filters = []
+
+    def __call__(self, request):
+        query = parse_qs(urlsplit(request.url).query)
+        filter_query = query["filter"][0]
+        self.filters.append(filter_query)
+
+        uuids = list(self.states)
+        if filter_query.startswith("uuid=="):
+            wanted = {clause.removeprefix("uuid==") for clause in filter_query.split(",")}
+            uuids = [uuid for uuid in uuids if uuid in wanted]
+
+        page, size = int(query["page"][0]), int(query["page-size"][0])
+        results = [
+            {"uuid": uuid, "commandState": self.states[uuid], "client": {"managementId": f"m-{uuid}"},
+             "commandError": {"code": 1} if self.states[uuid] == "ERROR" else None}
+            for uuid in uuids[page * size:(page + 1) * size]
+        ]
+        return make_response({"totalCount": len(uuids), "results": results})
+
+
+def _tracker(states, **kwargs):
+    server = FakeCommandServer(states)
+    mdm = MDMCommands(FakeAPI(responder=server))
+    return CommandTracker(mdm, list(states), **kwargs), server, mdm
+
+
+def test_poll_aggregates_states():
+    tracker, _, _ = _tracker({"a": "PENDING", "b": "ACKNOWLEDGED", "c": "ERROR", "d": "NOT_NOW"})
+
+    summary = tracker.poll()
+
+    assert summary == {"PENDING": 1, "ACKNOWLEDGED": 1, "NOT_NOW": 1, "ERROR": 1, "UNKNOWN": 0}
+    assert tracker.by_device() == {"m-a": "PENDING", "m-b": "ACKNOWLEDGED", "m-c": "ERROR", "m-d": "NOT_NOW"}
+    assert tracker.errors() == {"c": {"code": 1}}
+    assert not tracker.done
+
+
+def test_unseen_commands_stay_unknown():
+    tracker, server, _ = _tracker({"a": "PENDING"})
+    tracker.commands["ghost"] = {"state": "UNKNOWN", "management_id": None, "error": None, "completed": None}
+
+    assert tracker.poll()["UNKNOWN"] == 1
+    assert "uuid==ghost" in server.filters[-1]
+
+
+def test_large_campaign_is_polled_by_window_then_by_uuid():
+    states = {f"u{i}": "PENDING" for i in range(120)}
+    since = datetime(2024, 5, 16, 20, 43, 43, 945000, tzinfo=timezone.utc)
+    tracker, server, mdm = _tracker(states, command_type="RESTART_DEVICE", since=since, page_size=50)
+
+    tracker.poll()
+    # The window opens five minutes early to absorb clock skew between client and server.
+    assert server.filters == ["command==RESTART_DEVICE;dateSent=ge=2024-05-16T20:38:43.945Z"] * 3
+    assert len(mdm._api.requests) == 3  # pylint: disable=protected-access
+
+    for uuid in list(states)[:100]:
+        states[uuid] = "ACKNOWLEDGED"
+    tracker.poll()
+    server.filters.clear()
+    tracker.poll()
+
+    assert len(server.filters) == 1 and server.filters[0].count("uuid==") == 20
+
+
+def test_window_that_misses_a_command_names_only_that_one():
+    states = {f"u{i}": "PENDING" for i in range(1999)}
+    since = datetime(2024, 5, 16, 20, 43, 43, 945000, tzinfo=timezone.utc)
+    tracker, server, mdm = _tracker(states, command_type="RESTART_DEVICE", since=since, page_size=2000)
+    tracker.commands["skewed"] = {"state": "UNKNOWN", "management_id": None, "error": None, "completed": None}
+
+    tracker.poll()
+    assert len(mdm._api.requests) == 1  # pylint: disable=protected-access
+
+    server.filters.clear()
+    server.states["skewed"] = "ACKNOWLEDGED"
+    tracker.poll()
+    # One skewed uuid costs one extra request, not a uuid filter per 50 outstanding commands.
+    assert server.filters == ["command==RESTART_DEVICE;dateSent=ge=2024-05-16T20:38:43.945Z", "uuid==skewed"]
+    assert len(mdm._api.requests) == 3  # pylint: disable=protected-access
+    assert tracker.commands["skewed"]["state"] == "ACKNOWLEDGED"
+
+
+def test_uuid_filters_are_chunked_without_a_window():
+    tracker, server, _ = _tracker({f"u{i}": "PENDING" for i in range(120)})
+    tracker.poll()
+    assert [f.count("uuid==") for f in server.filters] == [50, 50, 20]
+
+
+def test_done_trackers_make_no_requests():
+    tracker, server, _ = _tracker({"a": "ACKNOWLEDGED"})
+    tracker.poll()
+    tracker.poll()
+    assert tracker.done and len(server.filters) == 1 and tracker.polls == 1
+
+
+def test_wait_backs_off_exponentially_until_done():
+    tracker, server, _ = _tracker({"a": "PENDING"})
+    seen = []
+
+    def sleep(_secs):
+        if len(seen) == 3:
+            server.states["a"] = "ACKNOWLEDGED"
+
+    with patch("jamfpy.endpoints.mdm_tracker.time.sleep", side_effect=sleep) as mock_sleep:
+        summary = tracker.wait(initial_interval=1, max_interval=3, on_poll=seen.append)
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 3]
+    assert summary["ACKNOWLEDGED"] == 1 and len(seen) == 4
+
+
+def test_wait_gives_up_at_timeout():
+    tracker, _, _ = _tracker({"a": "PENDING"})
+    clock = iter([0, 0, 10, 20])
+
+    with patch("jamfpy.endpoints.mdm_tracker.time.monotonic", side_effect=lambda: next(clock)), \
+         patch("jamfpy.endpoints.mdm_tracker.time.sleep"):
+        summary = tracker.wait(timeout=15, initial_interval=10)
+
+    assert summary["PENDING"] == 1 and tracker.polls == 3
+
+
+def test_from_batch_maps_devices_and_window():
+    batch = MDMBatchResult("RESTART_DEVICE", {})
+    batch.succeeded = {"m0": "c0", "m1": None}
+    tracker = CommandTracker.from_batch(MDMCommands(FakeAPI()), batch)
+
+    assert list(tracker.commands) == ["c0"]
+    assert tracker.commands["c0"]["management_id"] == "m0"
+    assert (tracker.command_type, tracker.since) == ("RESTART_DEVICE", batch.sent_at)
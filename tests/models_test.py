@@ -4,14 +4,17 @@ A throwaway subclass exercises the inherited CRUD; a FakeAPI records the
 ``requests.Request`` each method builds so we can assert URL/verb/headers/body.
 """
 # pylint: disable=missing-function-docstring,too-few-public-methods
+import io
 import json
 
 import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
 from conftest import FakeAPI, FQDN, make_response
 
 from jamfpy.endpoints.models import ClassicEndpoint, ProEndpoint
 from jamfpy.client.constants import DEFAULT_HTTP_CONFIG_HEADERS as H
 from jamfpy.client.exceptions import JamfAPIError
+from jamfpy.client.store import DiskStore
 
 CRUD = H["crud"]
 BASE = f"{FQDN}/JSSResource"
@@ -195,3 +198,257 @@ def test_pro_get_all_raises_on_error():
     _, things = _pro_things(responses=[make_response({}, status=500)])
     with pytest.raises(JamfAPIError):
         things.get_all()
+
+
+def _paged_responder(total, size):
+    """Answer each page request by its ``page`` query param, independent of arrival order."""
+    def respond(request):
+        page = int(request.url.split("page=")[1].split("&")[0])
+        ids = range(page * size, min((page + 1) * size, total))
+        return make_response({"totalCount": total, "results": [{"id": i} for i in ids]})
+    return respond
+
+
+def test_pro_get_all_concurrent_reassembles_pages_in_order():
+    api = FakeAPI(responder=_paged_responder(total=10, size=2))
+    result = ProThings(api).get_all(page_size=2, max_workers=4)
+    body = json.loads(result.content)
+    assert body["totalCount"] == 10
+    assert [r["id"] for r in body["results"]] == list(range(10))
+    # Page 0 first to learn totalCount, then exactly the remaining four pages.
+    assert api.requests[0].url == f"{PRO_BASE}/things?page=0&page-size=2"
+    assert sorted(req.url for req in api.requests[1:]) == [
+        f"{PRO_BASE}/things?page={p}&page-size=2" for p in range(1, 5)
+    ]
+
+
+def test_pro_get_all_concurrent_single_page_makes_one_request():
+    api = FakeAPI(responder=_paged_responder(total=2, size=100))
+    result = ProThings(api).get_all(max_workers=4)
+    assert json.loads(result.content)["totalCount"] == 2
+    assert len(api.requests) == 1
+
+
+def test_pro_get_all_concurrent_falls_back_without_total_count():
+    page0 = make_response({"results": [{"id": 0}, {"id": 1}]})
+    page1 = make_response({"results": [{"id": 2}]})
+    api, things = _pro_things(responses=[page0, page1])
+    result = things.get_all(page_size=2, max_workers=4)
+    assert [r["id"] for r in json.loads(result.content)["results"]] == [0, 1, 2]
+    assert len(api.requests) == 2
+
+
+def test_pro_get_all_concurrent_raises_on_failed_page():
+    def respond(request):
+        if "page=0&" in request.url:
+            return make_response({"totalCount": 4, "results": [{"id": 0}, {"id": 1}]})
+        return make_response({}, status=500)
+
+    api = FakeAPI(responder=respond)
+    with pytest.raises(JamfAPIError):
+        ProThings(api).get_all(page_size=2, max_workers=2)
+
+
+def test_pro_iter_pages_yields_each_page_lazily():
+    page0 = make_response({"totalCount": 3, "results": [{"id": 0}, {"id": 1}]})
+    page1 = make_response({"totalCount": 3, "results": [{"id": 2}]})
+    api, things = _pro_things(responses=[page0, page1])
+    pages = things.iter_pages(page_size=2)
+    assert not api.requests  # nothing fetched until iteration starts
+    assert next(pages) == [{"id": 0}, {"id": 1}]
+    assert len(api.requests) == 1
+    assert list(pages) == [[{"id": 2}]]
+    assert len(api.requests) == 2
+
+
+def test_pro_iter_all_yields_records_across_pages():
+    page0 = make_response({"totalCount": 4, "results": [{"id": 0}, {"id": 1}]})
+    page1 = make_response({"totalCount": 4, "results": [{"id": 2}, {"id": 3}]})
+    api, things = _pro_things(responses=[page0, page1])
+    assert [r["id"] for r in things.iter_all(page_size=2, sort="id:asc")] == [0, 1, 2, 3]
+    assert api.requests[0].url == f"{PRO_BASE}/things?page=0&page-size=2&sort=id:asc"
+
+
+def test_pro_iter_all_raises_on_error():
+    _, things = _pro_things(responses=[make_response({}, status=500)])
+    with pytest.raises(JamfAPIError):
+        list(things.iter_all())
+
+
+def test_pro_get_all_sends_filter_and_sections_on_every_page():
+    api = FakeAPI(responder=_paged_responder(total=4, size=2))
+    ProThings(api).get_all(
+        page_size=2, sort="id:asc", filter_query='name=="Mac Book*"', sections=["GENERAL", "HARDWARE"]
+    )
+    tail = "&sort=id:asc&filter=name%3D%3D%22Mac%20Book%2A%22&section=GENERAL&section=HARDWARE"
+    assert [req.url for req in api.requests] == [
+        f"{PRO_BASE}/things?page={p}&page-size=2{tail}" for p in range(2)
+    ]
+
+
+def test_pro_get_all_concurrent_sends_filter_on_every_page():
+    api = FakeAPI(responder=_paged_responder(total=6, size=2))
+    ProThings(api).get_all(page_size=2, max_workers=3, filter_query="id>0")
+    assert len(api.requests) == 3
+    assert all(req.url.endswith("&filter=id%3E0") for req in api.requests)
+
+
+def test_pro_get_all_projects_fields_after_counting():
+    record = {"id": 1, "general": {"name": "mac", "site": "HQ"}, "hardware": {"model": "M3"}}
+    _, things = _pro_things(responses=[make_response({"totalCount": 1, "results": [record]})])
+    body = json.loads(things.get_all(fields=["id", "general.name", "missing.key"]).content)
+    assert body == {"totalCount": 1, "results": [{"id": 1, "general": {"name": "mac"}}]}
+
+
+def test_pro_get_all_concurrent_projects_fields():
+    api = FakeAPI(responder=_paged_responder(total=5, size=2))
+    body = json.loads(ProThings(api).get_all(page_size=2, max_workers=2, fields=["id"]).content)
+    assert body["results"] == [{"id": i} for i in range(5)]
+
+
+def test_pro_iter_all_projects_fields_and_passes_filter():
+    page = make_response({"totalCount": 1, "results": [{"id": 7, "name": "a", "udid": "x"}]})
+    api, things = _pro_things(responses=[page])
+    assert list(things.iter_all(filter_query="id==7", fields=["name"])) == [{"name": "a"}]
+    assert api.requests[0].url.endswith("&filter=id%3D%3D7")
+
+
+def _by_id_responder(failing_id=None):
+    """Answer ``.../{id}`` lookups with ``{"id": id}``; raise a connection error for failing_id."""
+    def respond(request):
+        target_id = int(request.url.rsplit("/", 1)[1])
+        if target_id == failing_id:
+            raise RequestsConnectionError("connection reset")
+        return make_response({"id": target_id})
+    return respond
+
+
+def test_get_by_ids_preserves_input_order_and_dedupes():
+    api = FakeAPI(responder=_by_id_responder())
+    results = Things(api).get_by_ids([5, 3, 9, 3], max_workers=3)
+    assert list(results) == [5, 3, 9]
+    assert [r.json()["id"] for r in results.values()] == [5, 3, 9]
+    assert sorted(req.url for req in api.requests) == [f"{BASE}/things/id/{i}" for i in (3, 5, 9)]
+
+
+def test_get_by_ids_reports_failures_without_aborting():
+    api = FakeAPI(responder=_by_id_responder(failing_id=3))
+    results = Things(api).get_by_ids([1, 3, 4])
+    assert isinstance(results[3], RequestsConnectionError)
+    assert results[1].json() == {"id": 1}
+    assert results[4].json() == {"id": 4}
+
+
+def test_get_by_ids_forwards_xml_response():
+    api = FakeAPI(responder=_by_id_responder())
+    Things(api).get_by_ids([1], xml_response=True)
+    assert api.last_request.headers == CRUD["read"]["xml"]
+
+
+def test_pro_get_by_ids_uses_pro_id_path():
+    api = FakeAPI(responder=_by_id_responder())
+    results = ProThings(api).get_by_ids([2, 1])
+    assert list(results) == [2, 1]
+    assert sorted(req.url for req in api.requests) == [f"{PRO_BASE}/things/1", f"{PRO_BASE}/things/2"]
+
+
+def test_get_all_subset_appends_subset_path():
+    api, things = _things()
+    things.get_all(subset="basic")
+    assert api.last_request.url == f"{BASE}/things/subset/basic"
+
+
+def test_get_by_id_sections_builds_subset_path():
+    api, things = _things()
+    things.get_by_id(5, sections=["General", "Hardware"])
+    assert api.last_request.url == f"{BASE}/things/id/5/subset/General&Hardware"
+
+
+def test_get_by_id_single_section_string():
+    api, things = _things()
+    things.get_by_id(5, xml_response=True, sections="General")
+    assert api.last_request.url == f"{BASE}/things/id/5/subset/General"
+    assert api.last_request.headers == CRUD["read"]["xml"]
+
+
+def test_get_by_ids_forwards_sections():
+    api = FakeAPI(responder=lambda request: make_response({}))
+    Things(api).get_by_ids([1, 2], sections=["General"])
+    assert sorted(req.url for req in api.requests) == [
+        f"{BASE}/things/id/1/subset/General",
+        f"{BASE}/things/id/2/subset/General",
+    ]
+
+
+def test_classic_cached_all_reads_through_and_then_serves_from_store():
+    api = FakeAPI(responses=[make_response({"things": [{"id": 1, "name": "a"}]})])
+    api.store = DiskStore()
+    things = Things(api)
+
+    assert things.cached_all() == [{"id": 1, "name": "a"}]
+    assert things.cached_all() == [{"id": 1, "name": "a"}]
+    assert len(api.requests) == 1
+    assert api.store.get_all("/JSSResource/things:things") == [{"id": 1, "name": "a"}]
+
+
+def test_pro_cached_all_refreshes_when_older_than_max_age():
+    pages = [make_response({"totalCount": 1, "results": [{"id": "1", "v": v}]}) for v in (1, 2)]
+    api = FakeAPI(responses=pages)
+    api.store = DiskStore()
+    things = ProThings(api)
+
+    things.cached_all()
+    assert things.cached_all(max_age=-1) == [{"id": "1", "v": 2}]
+    assert len(api.requests) == 2
+
+
+def test_cached_all_without_store_just_fetches():
+    _, things = _pro_things(responses=[make_response({"totalCount": 1, "results": [{"id": "1"}]})])
+    assert things.cached_all() == [{"id": "1"}]
+
+
+def test_refresh_cache_raises_on_error():
+    api = FakeAPI(responses=[make_response({}, status=500)])
+    api.store = DiskStore()
+    with pytest.raises(JamfAPIError):
+        Things(api).refresh_cache()
+
+
+def test_cached_by_id_stores_decoded_body():
+    api = FakeAPI(responses=[make_response({"thing": {"id": 3}})])
+    api.store = DiskStore()
+    things = Things(api)
+
+    assert things.cached_by_id(3) == {"thing": {"id": 3}}
+    assert things.cached_by_id(3) == {"thing": {"id": 3}}
+    assert len(api.requests) == 1
+
+
+def _xml_response(body, status=200):
+    """A streamed Response: the body is only available by reading ``raw``."""
+    resp = make_response(status=status)
+    resp.raw = io.BytesIO(body.encode())
+    return resp
+
+
+def test_stream_all_requests_unread_xml_and_yields_records():
+    api = FakeAPI(responses=[_xml_response("<things><size>2</size><thing><id>1</id></thing><thing><id>2</id></thing></things>")])
+    records = Things(api).stream_all(subset="basic")
+
+    assert not api.requests  # nothing is sent until the first record is asked for
+    assert list(records) == [{"id": "1"}, {"id": "2"}]
+    assert api.streamed
+    assert api.last_request.url == f"{BASE}/things/subset/basic"
+    assert api.last_request.headers == CRUD["read"]["xml"]
+
+
+def test_stream_by_id_yields_sections():
+    api = FakeAPI(responses=[_xml_response("<thing><general><id>4</id></general><fonts><size>0</size></fonts></thing>")])
+    assert list(Things(api).stream_by_id(4, sections=["General", "Fonts"])) == [("general", {"id": "4"}), ("fonts", [])]
+    assert api.last_request.url == f"{BASE}/things/id/4/subset/General&Fonts"
+
+
+def test_stream_all_raises_on_error():
+    api = FakeAPI(responses=[_xml_response("<error/>", status=401)])
+    with pytest.raises(JamfAPIError):
+        list(Things(api).stream_all())
@@ -0,0 +1,90 @@
+"""Unit tests for TenantPool fan-out."""
+# pylint: disable=missing-function-docstring,protected-access
+import logging
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import jamfpy
+from jamfpy.client.exceptions import JamfAuthError, JamfpyConfigError
+from jamfpy.endpoints.clc_endpoints import Categories
+
+FQDNS = [f"https://t{i}.jamfcloud.com" for i in range(4)]
+
+
+def _tenant(fqdn, **kwargs):
+    return jamfpy.Tenant(fqdn=fqdn, auth_method="oauth2", client_id="c", client_secret="s",
+                         log_level=logging.CRITICAL, lazy_auth=True, **kwargs)
+
+
+def _pool(**kwargs):
+    return jamfpy.TenantPool([_tenant(fqdn) for fqdn in FQDNS], **kwargs)
+
+
+def test_run_returns_results_keyed_by_fqdn_in_order():
+    pool = _pool()
+    assert pool.run(lambda tenant, suffix: tenant.fqdn + suffix, "!") == {f: f + "!" for f in FQDNS}
+
+
+def test_run_is_concurrent_across_tenants():
+    barrier = threading.Barrier(len(FQDNS), timeout=5)
+    # Deadlocks (and the barrier times out) unless every tenant runs at once.
+    results = _pool().run(lambda tenant: barrier.wait() is not None)
+    assert all(result is True for result in results.values())
+
+
+def test_run_isolates_failures():
+    def audit(tenant):
+        if tenant.fqdn == FQDNS[1]:
+            raise JamfAuthError("Error getting token.")
+        return "ok"
+
+    results = _pool().run(audit)
+
+    assert isinstance(results[FQDNS[1]], JamfAuthError)
+    assert [results[f] for f in FQDNS if f != FQDNS[1]] == ["ok"] * 3
+
+
+def test_call_resolves_dotted_endpoint_path():
+    with patch.object(Categories, "get_all", autospec=True, side_effect=lambda self, *a: (self._api._fqdn, a)):
+        results = _pool().call("classic.categories.get_all", "/categories")
+    assert results == {f: (f, ("/categories",)) for f in FQDNS}
+
+
+def test_rate_limit_gives_each_tenant_its_own_limiter():
+    shared = jamfpy.RateLimiter(1)
+    own = _tenant("https://own.jamfcloud.com", rate_limiter=shared)
+    pool = _pool(rate_limit=5)
+    pool.add(own)
+
+    limiters = [pool[f].rate_limiter for f in FQDNS]
+    assert len({id(limiter) for limiter in limiters}) == len(FQDNS)
+    assert all(limiter.max_rate == 5 for limiter in limiters)
+    assert pool[FQDNS[0]].classic.rate_limiter is limiters[0]
+    assert pool[FQDNS[0]].pro.rate_limiter is limiters[0]
+    assert own.rate_limiter is shared
+
+
+def test_duplicate_fqdn_is_rejected():
+    pool = _pool()
+    with pytest.raises(JamfpyConfigError):
+        pool.add(_tenant(FQDNS[0]))
+
+
+def test_remove_and_len():
+    pool = _pool()
+    assert pool.remove(FQDNS[0]).fqdn == FQDNS[0]
+    assert len(pool) == 3
+    assert [t.fqdn for t in pool] == FQDNS[1:]
+
+
+def test_empty_pool_runs_nothing():
+    assert not jamfpy.TenantPool().run(lambda tenant: 1/0)
+
+
+def test_warm_delegates_to_warm_tenants():
+    with patch("jamfpy.client.pool.warm_tenants", return_value={}) as mock_warm:
+        pool = _pool(max_workers=3)
+        pool.warm()
+    mock_warm.assert_called_once_with(list(pool), max_workers=3)
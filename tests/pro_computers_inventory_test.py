@@ -0,0 +1,24 @@
+"""Unit tests for the Pro computers-inventory endpoint (inherits ProEndpoint CRUD + pagination)."""
+# pylint: disable=missing-function-docstring
+from conftest import FakeAPI, FQDN, make_response
+
+from jamfpy.endpoints.pro_computers_inventory import ComputersInventory
+from jamfpy.client.constants import DEFAULT_HTTP_CONFIG_HEADERS as H
+
+BASE = f"{FQDN}/api/v1"
+
+
+def test_get_by_id_builds_v1_url():
+    api = FakeAPI()
+    ComputersInventory(api).get_by_id(7)
+    req = api.last_request
+    assert req.method == "GET"
+    assert req.url == f"{BASE}/computers-inventory/7"
+    assert req.headers == H["crud"]["read"]["json"]
+
+
+def test_get_all_passes_sections_and_filter():
+    api = FakeAPI(responses=[make_response({"totalCount": 1, "results": [{"id": "1"}]})])
+    ComputersInventory(api).get_all(page_size=10, filter_query="general.name==mac-1", sections=["GENERAL", "HARDWARE"])
+    assert api.last_request.url == (f"{BASE}/computers-inventory?page=0&page-size=10"
+                                    "&filter=general.name%3D%3Dmac-1&section=GENERAL&section=HARDWARE")
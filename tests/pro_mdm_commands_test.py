@@ -1,10 +1,16 @@
 """Unit tests for the Pro MDM commands endpoint."""
 # pylint: disable=missing-function-docstring
+from unittest.mock import MagicMock
+
 import pytest
-from conftest import FakeAPI, FQDN
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+from conftest import FakeAPI, FQDN, make_response
 
 from jamfpy.endpoints.pro_mdm_commands import MDMCommands
 from jamfpy.client.constants import DEFAULT_HTTP_CONFIG_HEADERS as H
+from jamfpy.client.rate_limit import RateLimiter
+from jamfpy.client.exceptions import JamfAPIError
 
 URL = f"{FQDN}/api/v2/mdm/commands"
 
@@ -103,3 +109,177 @@ def test_declerative_management_sends_declarative_command():
     data = req.json["commandData"]
     assert data["commandType"] == "DECLARATIVE_MANAGEMENT"
     assert data["data"] == "payload"
+
+
+def _accepting(request):
+    """Replies 201 with one {id, href} per targeted client, like Jamf Pro."""
+    ids = [client["managementId"] for client in request.json["clientData"]]
+    return make_response([{"id": f"cmd-{mid}", "href": f"/v2/mdm/commands/cmd-{mid}"} for mid in ids], status=201)
+
+
+def test_send_command_batched_chunks_and_maps_uuids():
+    api = FakeAPI(responder=_accepting)
+    ids = [f"m{i}" for i in range(7)]
+
+    result = MDMCommands(api).send_command_batched("RESTART_DEVICE", ids + ["m0"], batch_size=3, max_workers=2,
+                                                   rebuildKernelCache=True)
+
+    assert sorted(len(r.json["clientData"]) for r in api.requests) == [1, 3, 3]
+    assert all(r.json["commandData"] == {"commandType": "RESTART_DEVICE", "rebuildKernelCache": True}
+               for r in api.requests)
+    assert result.ok
+    assert list(result.succeeded) == ids
+    assert result.succeeded["m4"] == "cmd-m4"
+    assert len(result.command_uuids) == 7
+
+
+def test_send_command_batched_reports_failed_chunks_and_keeps_going():
+    def responder(request):
+        if request.json["clientData"][0]["managementId"] == "m2":
+            return make_response({"errors": []}, status=500)
+        return _accepting(request)
+
+    result = MDMCommands(FakeAPI(responder=responder)).send_command_batched("DEVICE_LOCATION", ["m0", "m1", "m2", "m3"],
+                                                                             batch_size=2)
+
+    assert not result.ok
+    assert set(result.succeeded) == {"m0", "m1"}
+    assert set(result.failed) == {"m2", "m3"}
+    assert result.failed["m2"].status_code == 500
+
+
+def test_send_command_batched_captures_exceptions():
+    errors = {
+        "m0": requests.ConnectionError(ProtocolError("Connection aborted.", ConnectionResetError())),
+        "m1": requests.ConnectTimeout("no route"),
+        "m2": requests.ConnectionError(MaxRetryError(None, "/v2/mdm/commands", NewConnectionError(None, "refused"))),
+        "m3": requests.exceptions.ChunkedEncodingError("truncated"),
+    }
+
+    def responder(request):
+        management_id = request.json["clientData"][0]["managementId"]
+        if management_id in errors:
+            raise errors[management_id]
+        return _accepting(request)
+
+    result = MDMCommands(FakeAPI(responder=responder)).send_command_batched(
+        "DEVICE_LOCATION", ["m0", "m1", "m2", "m3", "m4"], batch_size=1
+    )
+
+    # A dropped response may come after the server queued the command; a failed connect never reached it.
+    assert set(result.uncertain) == {"m0", "m3"}
+    assert set(result.failed) == {"m1", "m2"}
+    assert list(result.succeeded) == ["m4"]
+    assert not result.ok
+
+
+def test_send_command_batched_resolves_once_and_fails_only_the_raising_chunk():
+    def responder(request):
+        if request.json["clientData"][0]["managementId"] == "m-b":
+            raise KeyError("m-b")
+        return _accepting(request)
+
+    api = FakeAPI(responder=responder)
+    api.management_index = MagicMock()
+    api.management_index.resolve_many.side_effect = lambda ids, kind=None: [f"m-{i}" for i in ids]
+
+    result = MDMCommands(api).send_command_batched("RESTART_DEVICE", ["a", "b", "c"], batch_size=1)
+
+    api.management_index.resolve_many.assert_called_once()
+    assert list(result.succeeded) == ["m-a", "m-c"]
+    assert isinstance(result.failed["m-b"], KeyError)
+
+
+def test_retry_batch_checks_uncertain_ids_before_resending():
+    timed_out = {"m0", "m1"}
+    queued_before_timeout = [{"uuid": "cmd-m0", "client": {"managementId": "m0"}},
+                             {"uuid": "old", "client": {"managementId": "elsewhere"}}]
+
+    def responder(request):
+        if request.method == "GET":
+            return make_response({"totalCount": 2, "results": queued_before_timeout})
+        if timed_out & {client["managementId"] for client in request.json["clientData"]}:
+            raise requests.ReadTimeout("slow")
+        return _accepting(request)
+
+    api = FakeAPI(responder=responder)
+    endpoint = MDMCommands(api)
+    result = endpoint.send_command_batched("RESTART_DEVICE", ["m0", "m1", "m2"], batch_size=2, max_workers=1)
+    assert set(result.uncertain) == {"m0", "m1"}
+
+    timed_out.clear()
+    endpoint.retry_batch(result)
+
+    assert result.ok
+    assert result.succeeded == {"m2": "cmd-m2", "m0": "cmd-m0", "m1": "cmd-m1"}
+    listing = [r for r in api.requests if r.method == "GET"][0]
+    assert "command%3D%3DRESTART_DEVICE%3BdateSent%3Dge%3D" in listing.url
+    # m0 was already queued before its request timed out, so only m1 is sent again.
+    assert api.requests[-1].json["clientData"] == [{"managementId": "m1"}]
+
+
+def test_unreadable_reply_keeps_ids_as_succeeded_without_uuid():
+    api = FakeAPI(responses=[make_response(status=201)])
+    result = MDMCommands(api).send_command_batched("DEVICE_LOCATION", ["m0", "m1"])
+    assert result.succeeded == {"m0": None, "m1": None}
+    assert not result.command_uuids
+
+
+def test_retry_batch_resends_only_failed_ids():
+    calls = {"n": 0}
+
+    def flaky(request):
+        calls["n"] += 1
+        if calls["n"] == 2:
+            return make_response(status=503)
+        return _accepting(request)
+
+    api = FakeAPI(responder=flaky)
+    endpoint = MDMCommands(api)
+    result = endpoint.send_command_batched("DEVICE_LOCK", ["m0", "m1", "m2"], batch_size=1, max_workers=1, pin="0000")
+    assert set(result.failed) == {"m1"}
+
+    again = endpoint.retry_batch(result, batch_size=1)
+
+    assert again is result and result.ok
+    assert list(result.succeeded) == ["m0", "m2", "m1"]
+    retried = api.requests[-1]
+    assert retried.json == {"clientData": [{"managementId": "m1"}], "commandData": {"commandType": "DEVICE_LOCK", "pin": "0000"}}
+
+
+def test_send_command_batched_applies_rate_limiter():
+    limiter = MagicMock(spec=RateLimiter)
+    MDMCommands(FakeAPI(responder=_accepting)).send_command_batched("DEVICE_LOCATION", ["m0", "m1", "m2"], batch_size=1,
+                                                                     rate_limiter=limiter)
+    assert limiter.acquire.call_count == 3
+
+
+def test_list_commands_builds_filtered_page_url():
+    req = _send("list_commands", "command==RESTART_DEVICE;status==Pending", page=2, page_size=50, sort="dateSent:desc")
+    assert req.method == "GET"
+    assert req.url == (f"{URL}?page=2&page-size=50&filter=command%3D%3DRESTART_DEVICE%3Bstatus%3D%3DPending"
+                       "&sort=dateSent:desc")
+    assert req.headers == H["crud"]["read"]["json"]
+
+
+def test_iter_commands_walks_pages_until_total():
+    pages = [make_response({"totalCount": 3, "results": [{"uuid": "a"}, {"uuid": "b"}]}),
+             make_response({"totalCount": 3, "results": [{"uuid": "c"}]})]
+    api = FakeAPI(responses=pages)
+
+    assert [c["uuid"] for c in MDMCommands(api).iter_commands("active==true", page_size=2)] == ["a", "b", "c"]
+    assert [r.url.split("?")[1].split("&")[0] for r in api.requests] == ["page=0", "page=1"]
+
+
+def test_iter_commands_raises_on_failed_page():
+    api = FakeAPI(responses=[make_response({"errors": []}, status=500)])
+    with pytest.raises(JamfAPIError):
+        list(MDMCommands(api).iter_commands("active==true"))
+
+
+def test_track_accepts_batch_or_uuids():
+    endpoint = MDMCommands(FakeAPI(responder=_accepting))
+    batch = endpoint.send_command_batched("DEVICE_LOCATION", ["m0", "m1"])
+
+    assert set(endpoint.track(batch).commands) == {"cmd-m0", "cmd-m1"}
+    assert set(endpoint.track(["u1"]).commands) == {"u1"}
@@ -0,0 +1,31 @@
+"""Unit tests for the Pro v2 mobile-devices endpoint (inherits ProEndpoint CRUD + pagination)."""
+# pylint: disable=missing-function-docstring
+from conftest import FakeAPI, FQDN, make_response
+
+from jamfpy.endpoints.pro_mobile_devices import MobileDevices
+from jamfpy.client.constants import DEFAULT_HTTP_CONFIG_HEADERS as H
+
+BASE = f"{FQDN}/api/v2"
+
+
+def test_get_by_id_builds_v2_url():
+    api = FakeAPI()
+    MobileDevices(api).get_by_id(3)
+    req = api.last_request
+    assert req.method == "GET"
+    assert req.url == f"{BASE}/mobile-devices/3"
+    assert req.headers == H["crud"]["read"]["json"]
+
+
+def test_get_all_paginates_v2_collection():
+    api = FakeAPI(responses=[make_response({"totalCount": 1, "results": [{"id": "3", "managementId": "m"}]})])
+    resp = MobileDevices(api).get_all(page_size=100)
+    assert api.last_request.url == f"{BASE}/mobile-devices?page=0&page-size=100"
+    assert resp.json()["results"] == [{"id": "3", "managementId": "m"}]
+
+
+def test_details_pages_with_sections():
+    api = FakeAPI(responses=[make_response({"totalCount": 1, "results": [{"mobileDeviceId": "3"}]})])
+    records = list(MobileDevices(api).details.iter_all(page_size=50, sections=["GENERAL"]))
+    assert api.last_request.url == f"{BASE}/mobile-devices/detail?page=0&page-size=50&section=GENERAL"
+    assert records == [{"mobileDeviceId": "3"}]
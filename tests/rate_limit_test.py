@@ -0,0 +1,61 @@
+"""Unit tests for the adaptive token-bucket RateLimiter.
+
+``time.sleep`` is patched so waits are asserted, not slept.
+"""
+# pylint: disable=missing-function-docstring,protected-access
+from unittest.mock import patch
+
+import pytest
+
+from jamfpy.client.rate_limit import RateLimiter
+
+
+def test_burst_is_served_without_waiting():
+    limiter = RateLimiter(5)
+    with patch("jamfpy.client.rate_limit.time.sleep") as mock_sleep:
+        waits = [limiter.acquire() for _ in range(5)]
+    assert waits == [0.0] * 5
+    mock_sleep.assert_not_called()
+
+
+def test_empty_bucket_waits_for_refill():
+    limiter = RateLimiter(10, burst=1)
+    with patch("jamfpy.client.rate_limit.time.sleep") as mock_sleep:
+        limiter.acquire()
+        wait = limiter.acquire()
+    assert wait == pytest.approx(0.1, abs=0.01)
+    mock_sleep.assert_called_once()
+
+
+def test_waiters_queue_behind_each_other():
+    limiter = RateLimiter(10, burst=1)
+    with patch("jamfpy.client.rate_limit.time.sleep"):
+        limiter.acquire()
+        first = limiter.acquire()
+        second = limiter.acquire()
+    assert second == pytest.approx(first + 0.1, abs=0.01)
+
+
+def test_throttle_halves_rate_down_to_floor():
+    limiter = RateLimiter(8, min_rate=3)
+    limiter.on_throttled()
+    assert limiter.rate == 4
+    limiter.on_throttled()
+    assert limiter.rate == 3
+
+
+def test_success_recovers_towards_max_rate():
+    limiter = RateLimiter(10)
+    limiter.on_throttled()
+    for _ in range(5):
+        limiter.on_success()
+    assert limiter.rate == pytest.approx(7.5)
+    for _ in range(50):
+        limiter.on_success()
+    assert limiter.rate == 10
+
+
+def test_non_adaptive_rate_is_fixed():
+    limiter = RateLimiter(10, adaptive=False)
+    limiter.on_throttled()
+    assert limiter.rate == 10
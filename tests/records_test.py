@@ -0,0 +1,119 @@
+"""Unit tests for the slotted record classes and their generator."""
+# pylint: disable=missing-function-docstring
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+from conftest import make_response
+
+from jamfpy.client.generated_records import ClassicComputer, ProComputerInventory, ProMobileDevice, ProScript
+from jamfpy.client.records import Record
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = {"id": "1", "name": "wipe", "categoryId": "-1", "priority": "AFTER", "parameter4": "x", "scriptContents": "echo"}
+INVENTORY = {
+    "id": "5", "udid": "U-5",
+    "general": {"name": "mac-5", "managementId": "m-5"},
+    "hardware": {"serialNumber": "C02X"},
+    "diskEncryption": None,
+}
+
+
+def test_slotted_fields_use_snake_case_names():
+    record = ProScript.from_dict(SCRIPT)
+    assert (record.id, record.category_id, record.parameter4, record.script_contents) == ("1", "-1", "x", "echo")
+    assert record.parameter5 is None
+    assert not hasattr(record, "__dict__")
+
+
+def test_sections_are_packed_and_decoded_on_access():
+    record = ProComputerInventory.from_dict(INVENTORY)
+    assert isinstance(record._packed["general"], bytes)  # pylint: disable=protected-access
+    assert record.general == {"name": "mac-5", "managementId": "m-5"}
+    first, second = record.general, record.general
+    assert first == second and first is not second
+    assert record.disk_encryption is None
+    assert record.diskEncryption is None
+
+
+def test_documented_section_missing_from_the_record_is_none():
+    assert ProComputerInventory.from_dict({"id": "5"}).applications is None
+
+
+def test_unknown_field_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no field 'nope'"):
+        _ = ProScript.from_dict(SCRIPT).nope
+
+
+def test_unknown_keys_are_kept_and_reachable_by_json_key():
+    record = ClassicComputer.from_dict({"id": 1, "name": "mac-1", "asset_tag": "A-1"})
+    assert record.asset_tag == "A-1"
+
+
+def test_classic_list_records_slot_their_real_keys():
+    record = ClassicComputer.from_dict({"id": 1, "name": "mac-1", "serial_number": "C02X", "mac_address": "aa:bb"})
+    assert (record.id, record.serial_number, record.mac_address) == (1, "C02X", "aa:bb")
+    assert record._packed is None  # pylint: disable=protected-access
+
+
+def test_classic_detail_records_read_identifiers_from_general():
+    body = {"general": {"id": 7, "name": "mac-7", "serial_number": "C02X", "udid": "U-7"}, "hardware": {"model": "Mac"}}
+    record = ClassicComputer.from_dict(body)
+    assert (record.id, record.name, record.serial_number, record.udid) == (7, "mac-7", "C02X", "U-7")
+    assert record.general["name"] == "mac-7"
+    assert record.to_dict() == body
+
+
+@pytest.mark.parametrize("cls, data", [(ProScript, SCRIPT), (ProComputerInventory, INVENTORY)])
+def test_to_dict_round_trips(cls, data):
+    record = cls.from_dict(data)
+    assert {k: v for k, v in record.to_dict().items() if v is not None or k in data} == data
+    assert cls.from_dict(data) == record
+
+
+def test_records_are_unhashable():
+    with pytest.raises(TypeError):
+        hash(ProScript.from_dict(SCRIPT))
+
+
+def test_from_response_reads_pro_results():
+    resp = make_response({"totalCount": 2, "results": [{"id": "1", "managementId": "m-1"}, {"id": "2"}]})
+    records = ProMobileDevice.from_response(resp)
+    assert [r.management_id for r in records] == ["m-1", None]
+
+
+def test_from_response_reads_classic_lists_and_single_records():
+    listing = make_response({"computers": [{"id": 1, "name": "mac-1"}, {"id": 2, "name": "mac-2"}]})
+    assert [r.name for r in ClassicComputer.from_response(listing, "computers")] == ["mac-1", "mac-2"]
+
+    detail = make_response({"computer": {"general": {"id": 1}, "hardware": {"model": "MacBook"}}})
+    [record] = ClassicComputer.from_response(detail, "computer")
+    assert record.hardware == {"model": "MacBook"}
+
+
+def test_repr_shows_leading_fields():
+    assert repr(ProScript.from_dict(SCRIPT)) == "ProScript(id='1', name='wipe', info=None)"
+
+
+def test_every_generated_class_is_a_record():
+    module = importlib.import_module("jamfpy.client.generated_records")
+    classes = [obj for obj in vars(module).values() if isinstance(obj, type) and obj is not Record]
+    assert len(classes) == 6
+    assert all(issubclass(cls, Record) and cls.__slots__ for cls in classes)
+
+
+def test_generated_module_is_up_to_date():
+    spec = importlib.util.spec_from_file_location("generate_records", ROOT / "tools" / "generate_records.py")
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+    expected = generator.render(generator.load_schemas())
+    assert (ROOT / "jamfpy" / "client" / "generated_records.py").read_text(encoding="utf-8") == expected
+
+
+def test_large_sections_are_compressed_and_round_trip():
+    applications = [{"name": f"App {n}.app", "version": "1.0"} for n in range(40)]
+    record = ProComputerInventory.from_dict({"id": "5", "applications": applications})
+    assert len(record._packed["applications"]) < len(str(applications)) / 4  # pylint: disable=protected-access
+    assert record.applications == applications
@@ -0,0 +1,70 @@
+"""Unit tests for the SQLite DiskStore."""
+# pylint: disable=missing-function-docstring
+from unittest.mock import patch
+
+from jamfpy.client.store import DiskStore
+
+
+def test_collection_round_trips_and_persists(tmp_path):
+    path = tmp_path / "tenant.db"
+    store = DiskStore(path)
+    store.replace_all("/JSSResource/sites:sites", {1: {"id": 1, "name": "HQ"}, 2: {"id": 2, "name": "DC"}})
+    store.close()
+
+    reopened = DiskStore(path)
+    assert reopened.get_all("/JSSResource/sites:sites") == [{"id": 1, "name": "HQ"}, {"id": 2, "name": "DC"}]
+
+
+def test_missing_collection_is_none():
+    assert DiskStore().get_all("nothing") is None
+
+
+def test_max_age_rejects_old_collections():
+    store = DiskStore()
+    with patch("jamfpy.client.store.time.time", return_value=1000.0):
+        store.replace_all("ns", {1: {"id": 1}})
+
+    with patch("jamfpy.client.store.time.time", return_value=1100.0):
+        assert store.get_all("ns", max_age=50) is None
+        assert store.get_all("ns", max_age=200) == [{"id": 1}]
+        assert store.get_all("ns") == [{"id": 1}]
+
+
+def test_replace_all_rewrites_only_changes_and_drops_vanished():
+    store = DiskStore()
+    store.replace_all("ns", {1: {"id": 1, "v": 1}, 2: {"id": 2, "v": 1}, 3: {"id": 3, "v": 1}})
+
+    changed = store.replace_all("ns", {1: {"id": 1, "v": 1}, 2: {"id": 2, "v": 2}})
+
+    assert changed == 2
+    assert sorted(r["id"] for r in store.get_all("ns")) == [1, 2]
+
+
+def test_single_records_round_trip():
+    store = DiskStore()
+    store.put("ns/id", 7, {"policy": {"id": 7}})
+    assert store.get("ns/id", "7") == {"policy": {"id": 7}}
+    assert store.get("ns/id", 8) is None
+
+
+def test_expire_marks_resource_stale_only():
+    store = DiskStore()
+    store.replace_all("a", {1: {"id": 1}}, resource="categories")
+    store.put("a/id", 1, {"id": 1}, resource="categories")
+    store.replace_all("b", {1: {"id": 1}}, resource="sites")
+
+    store.expire("categories")
+
+    assert store.get_all("a") is None
+    assert store.get("a/id", 1) is None
+    assert store.get_all("b") == [{"id": 1}]
+
+
+def test_clear_namespace_and_everything():
+    store = DiskStore()
+    store.replace_all("a", {1: {"id": 1}})
+    store.replace_all("b", {1: {"id": 1}})
+    store.clear("a")
+    assert store.get_all("a") is None
+    store.clear()
+    assert store.get_all("b") is None
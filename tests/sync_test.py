@@ -0,0 +1,155 @@
+"""Unit tests for the incremental InventorySync."""
+# pylint: disable=missing-function-docstring
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from conftest import FakeAPI, make_response
+
+from jamfpy.client.exceptions import JamfAPIError
+from jamfpy.client.store import DiskStore
+from jamfpy.client.sync import InventorySync, SyncEvent
+from jamfpy.endpoints.clc_endpoints import Computers, MobileDevices
+from jamfpy.endpoints.pro_mobile_devices import MobileDevices as ProMobileDevices
+
+
+class Inventory:
+    """Serves a mutable fleet: the basic list plus one detail record per id."""
+
+    def __init__(self, devices):
+        self.devices = devices
+        self.fail = set()
+        self.detail_calls = []
+
+    def respond(self, request):
+        path = request.url.split("/JSSResource", 1)[1]
+        if path in ("/computers/subset/basic", "/mobiledevices"):
+            key = "computers" if path.startswith("/computers") else "mobile_devices"
+            return make_response({key: [{"id": i, **d["list"]} for i, d in self.devices.items()]})
+
+        target_id = int(path.split("/id/")[1].split("/")[0])
+        self.detail_calls.append(target_id)
+        if target_id in self.fail:
+            raise RequestsConnectionError("reset")
+        return make_response({"computer": self.devices[target_id]["detail"]})
+
+
+def _sync(devices):
+    inventory = Inventory(devices)
+    api = FakeAPI(responder=inventory.respond)
+    classic = SimpleNamespace(computers=Computers(api), mobile_devices=MobileDevices(api))
+    return inventory, InventorySync(classic, store=DiskStore())
+
+
+def _computer(epoch, detail="v1"):
+    return {"list": {"report_date_epoch": epoch}, "detail": {"v": detail}}
+
+
+def test_first_sync_upserts_everything():
+    inventory, sync = _sync({1: _computer(100), 2: _computer(100)})
+    events = list(sync.computers())
+    assert events == [SyncEvent("upsert", 1, {"computer": {"v": "v1"}}),
+                      SyncEvent("upsert", 2, {"computer": {"v": "v1"}})]
+    assert sorted(inventory.detail_calls) == [1, 2]
+
+
+def test_second_sync_fetches_only_changed_markers():
+    inventory, sync = _sync({1: _computer(100), 2: _computer(100)})
+    list(sync.computers())
+    inventory.detail_calls.clear()
+
+    inventory.devices[2] = _computer(200, detail="v2")
+    events = list(sync.computers())
+
+    assert events == [SyncEvent("upsert", 2, {"computer": {"v": "v2"}})]
+    assert inventory.detail_calls == [2]
+
+
+def test_new_marker_with_identical_body_is_not_reported():
+    inventory, sync = _sync({1: _computer(100)})
+    list(sync.computers())
+    inventory.devices[1] = _computer(200)
+    assert not list(sync.computers())
+    inventory.detail_calls.clear()
+    assert not list(sync.computers())
+    assert not inventory.detail_calls
+
+
+def test_vanished_records_are_deleted():
+    inventory, sync = _sync({1: _computer(100), 2: _computer(100)})
+    list(sync.computers())
+    del inventory.devices[1]
+    assert list(sync.computers()) == [SyncEvent("delete", 1)]
+
+
+def test_since_skips_devices_not_reported_after_it():
+    inventory, sync = _sync({1: _computer(1_000_000), 2: _computer(3_000_000)})
+    since = datetime.fromtimestamp(2_000, tz=timezone.utc)
+    assert [e.record_id for e in sync.computers(since=since)] == [2]
+    assert inventory.detail_calls == [2]
+
+
+def test_failed_fetch_is_reported_and_retried_next_sync():
+    inventory, sync = _sync({1: _computer(100), 2: _computer(100)})
+    inventory.fail.add(2)
+    events = list(sync.computers())
+    assert [e.action for e in events] == ["upsert", "error"]
+    assert isinstance(events[1].record, RequestsConnectionError)
+
+    inventory.fail.clear()
+    inventory.detail_calls.clear()
+    assert [e.record_id for e in sync.computers()] == [2]
+
+
+def test_interrupted_sync_keeps_previous_state():
+    inventory, sync = _sync({1: _computer(100), 2: _computer(100)})
+    next(sync.computers())
+    inventory.detail_calls.clear()
+    assert len(list(sync.computers())) == 2
+
+
+def test_mobile_devices_fall_back_to_list_record_hash():
+    inventory, sync = _sync({1: {"list": {"name": "ipad"}, "detail": {"v": 1}}})
+    assert len(list(sync.mobile_devices())) == 1
+    inventory.detail_calls.clear()
+    assert not list(sync.mobile_devices())
+
+    inventory.devices[1] = {"list": {"name": "renamed"}, "detail": {"v": 2}}
+    assert [e.action for e in sync.mobile_devices()] == ["upsert"]
+
+
+def test_mobile_devices_use_pro_inventory_dates_when_available():
+    inventory, _ = _sync({1: {"list": {"name": "ipad"}, "detail": {"v": 1}}})
+    updated = {"1": "2024-05-01T10:00:00.000Z"}
+    pro_api = FakeAPI(responder=lambda request: make_response({"totalCount": len(updated), "results": [
+        {"mobileDeviceId": i, "general": {"lastInventoryUpdateDate": date}} for i, date in updated.items()
+    ]}))
+    classic_api = FakeAPI(responder=inventory.respond)
+    sync = InventorySync(SimpleNamespace(mobile_devices=MobileDevices(classic_api)), store=DiskStore(),
+                         pro_api=SimpleNamespace(mobile_devices=ProMobileDevices(pro_api)))
+
+    assert [e.action for e in sync.mobile_devices()] == ["upsert"]
+    assert "/api/v2/mobile-devices/detail?" in pro_api.last_request.url
+    assert not any("/mobiledevices" == r.url.split("/JSSResource")[1] for r in classic_api.requests)
+
+    # An OS update leaves every list field alone but moves the inventory date.
+    inventory.devices[1]["detail"] = {"v": 2}
+    updated["1"] = "2024-05-02T10:00:00.000Z"
+    assert [e.action for e in sync.mobile_devices()] == ["upsert"]
+    updated["1"] = "2024-05-03T10:00:00.000Z"
+    assert not list(sync.mobile_devices(since=datetime(2024, 6, 1, tzinfo=timezone.utc)))
+
+
+def test_list_failure_raises():
+    api = FakeAPI(responses=[make_response({}, status=500)])
+    sync = InventorySync(SimpleNamespace(computers=Computers(api)))
+    with pytest.raises(JamfAPIError):
+        list(sync.computers())
+
+
+def test_reset_forgets_state():
+    _, sync = _sync({1: _computer(100)})
+    list(sync.computers())
+    sync.reset()
+    assert len(list(sync.computers())) == 1
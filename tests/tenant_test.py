@@ -5,13 +5,14 @@ need no mocking. The happy-path construction patches ``set_new_token`` to a no-o
 """
 # pylint: disable=missing-function-docstring
 import logging
+import time
 from unittest.mock import patch
 
 import pytest
 from conftest import FQDN
 
 import jamfpy
-from jamfpy.client.exceptions import JamfpyConfigError
+from jamfpy.client.exceptions import JamfpyConfigError, JamfAuthError
 
 
 def test_invalid_auth_method_raises():
@@ -57,3 +58,114 @@ def test_basic_tenant_builds_both_apis():
                                password="p", log_level=logging.CRITICAL)
     assert isinstance(tenant.pro, jamfpy.ProAPI)
     assert isinstance(tenant.classic, jamfpy.ClassicAPI)
+
+
+def test_background_token_renewal_is_opt_in():
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None), \
+            patch.object(jamfpy.OAuth, "start_background_renewal") as mock_start:
+        jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c",
+                      client_secret="s", log_level=logging.CRITICAL)
+        mock_start.assert_not_called()
+
+        jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                      log_level=logging.CRITICAL, background_token_renewal=True)
+        mock_start.assert_called_once()
+
+
+def test_auth_and_both_apis_share_one_session():
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None):
+        tenant = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c",
+                               client_secret="s", log_level=logging.CRITICAL)
+    # pylint: disable=protected-access
+    assert tenant.pro._session is tenant.session
+    assert tenant.classic._session is tenant.session
+    assert tenant.pro.auth._session is tenant.session
+
+
+def test_response_cache_is_opt_in_and_shared():
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None):
+        plain = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c",
+                              client_secret="s", log_level=logging.CRITICAL)
+        cache = jamfpy.ResponseCache()
+        cached = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                               log_level=logging.CRITICAL, cache=cache)
+    assert plain.pro.cache is None and plain.classic.cache is None
+    assert cached.pro.cache is cache and cached.classic.cache is cache
+
+
+def test_sync_shares_the_tenant_store():
+    store = jamfpy.DiskStore()
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None):
+        tenant = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                               log_level=logging.CRITICAL, store=store)
+    assert tenant.sync.store is store
+
+
+def test_hooks_are_shared_by_both_apis():
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None):
+        tenant = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                               log_level=logging.CRITICAL)
+    metrics = jamfpy.MetricsCollector()
+    tenant.hooks.append(metrics)
+    assert tenant.classic.hooks == tenant.pro.hooks == [metrics]
+
+
+def test_management_index_is_opt_in_for_mdm():
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None):
+        plain = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                              log_level=logging.CRITICAL)
+        resolving = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                                  log_level=logging.CRITICAL, resolve_device_ids=True)
+    assert isinstance(plain.management_index, jamfpy.ManagementIdIndex)
+    assert plain.pro.management_index is None
+    assert resolving.pro.management_index is resolving.management_index
+
+
+def test_lazy_auth_defers_the_first_token():
+    with patch.object(jamfpy.OAuth, "set_new_token", return_value=None) as mock_set:
+        tenant = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                               log_level=logging.CRITICAL, lazy_auth=True)
+        mock_set.assert_not_called()
+        assert tenant.pro.auth is tenant.auth
+
+
+def _token_setter(auth_self):
+    auth_self._set_token("tok", time.time() + 3600)  # pylint: disable=protected-access
+
+
+def test_warm_fetches_the_token_once():
+    with patch.object(jamfpy.OAuth, "set_new_token", autospec=True, side_effect=_token_setter) as mock_set:
+        tenant = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                               log_level=logging.CRITICAL, lazy_auth=True)
+        tenant.warm()
+        tenant.warm()
+    mock_set.assert_called_once()
+
+
+def test_warm_tenants_reports_failures_per_fqdn():
+    def set_new_token(auth_self):
+        if "bad" in auth_self._fqdn:  # pylint: disable=protected-access
+            raise JamfAuthError("Error getting token.")
+        _token_setter(auth_self)
+
+    with patch.object(jamfpy.OAuth, "set_new_token", autospec=True, side_effect=set_new_token):
+        tenants = [
+            jamfpy.Tenant(fqdn=fqdn, auth_method="oauth2", client_id="c", client_secret="s",
+                          log_level=logging.CRITICAL, lazy_auth=True)
+            for fqdn in ("https://good.jamfcloud.com", "https://bad.jamfcloud.com")
+        ]
+        results = jamfpy.warm_tenants(tenants, max_workers=2)
+
+    assert results["https://good.jamfcloud.com"] is None
+    assert isinstance(results["https://bad.jamfcloud.com"], JamfAuthError)
+    assert tenants[0].auth.token() == "tok"
+
+
+def test_tenant_reuses_token_from_store():
+    store = jamfpy.MemoryTokenStore()
+    store.save(f"oauth:{FQDN}:c", "shared", time.time() + 3600)
+    with patch.object(jamfpy.OAuth, "set_new_token") as mock_set:
+        tenant = jamfpy.Tenant(fqdn=FQDN, auth_method="oauth2", client_id="c", client_secret="s",
+                               log_level=logging.CRITICAL, token_store=store)
+    mock_set.assert_not_called()
+    assert tenant.auth.token() == "shared"
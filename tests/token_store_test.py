@@ -0,0 +1,82 @@
+"""Unit tests for the token stores."""
+# pylint: disable=missing-function-docstring
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from jamfpy.client.token_store import FileTokenStore, MemoryTokenStore, TokenStore
+
+KEY = "oauth:https://x.jamfcloud.com:cid"
+
+
+def test_memory_store_round_trip():
+    store = MemoryTokenStore()
+    assert store.load(KEY) is None
+    store.save(KEY, "tok", 123.0)
+    assert store.load(KEY) == ("tok", 123.0)
+    store.delete(KEY)
+    assert store.load(KEY) is None
+
+
+def test_incomplete_store_fails_when_built():
+    class LoadOnly(TokenStore):  # pylint: disable=abstract-method
+        """A store missing save and delete."""
+        def load(self, key):
+            return None
+
+    with pytest.raises(TypeError, match="delete"):
+        LoadOnly()  # pylint: disable=abstract-class-instantiated
+
+
+def test_file_store_round_trips_across_instances(tmp_path):
+    FileTokenStore(tmp_path).save(KEY, "tok", 123.5)
+    assert FileTokenStore(tmp_path).load(KEY) == ("tok", 123.5)
+
+
+def test_file_store_is_owner_only(tmp_path):
+    store = FileTokenStore(tmp_path / "tokens")
+    store.save(KEY, "tok", 1.0)
+    files = [p for p in store.directory.iterdir() if p.suffix == ".json"]
+    assert len(files) == 1
+    assert stat.S_IMODE(os.stat(files[0]).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(store.directory).st_mode) == 0o700
+
+
+def test_file_store_ignores_corrupt_files(tmp_path):
+    store = FileTokenStore(tmp_path)
+    store.save(KEY, "tok", 1.0)
+    store._path(KEY).write_text("{not json", encoding="utf-8")  # pylint: disable=protected-access
+    assert store.load(KEY) is None
+
+
+def test_file_store_delete_is_idempotent(tmp_path):
+    store = FileTokenStore(tmp_path)
+    store.save(KEY, "tok", 1.0)
+    store.delete(KEY)
+    store.delete(KEY)
+    assert store.load(KEY) is None
+
+
+def test_file_lock_serialises_holders(tmp_path):
+    # Separate instances stand in for separate processes sharing the directory.
+    stores = [FileTokenStore(tmp_path) for _ in range(4)]
+    inside, overlaps = [], []
+
+    def hold(store):
+        with store.lock(KEY):
+            inside.append(1)
+            if len(inside) > 1:
+                overlaps.append(1)
+            time.sleep(0.01)
+            inside.pop()
+
+    threads = [threading.Thread(target=hold, args=(s,)) for s in stores]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not overlaps
@@ -0,0 +1,74 @@
+"""Unit tests for the iterparse-based Classic XML reader."""
+# pylint: disable=missing-function-docstring
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+from conftest import make_response
+
+from jamfpy.client.xml_stream import iter_records, iter_xml
+
+LIST_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<computers><size>2</size>
+  <computer><id>1</id><name>mac-1</name></computer>
+  <computer><id>2</id><name>mac-2</name></computer>
+</computers>"""
+
+DETAIL_XML = """<computer>
+  <general><id>7</id><name>mac-7</name><remote_management><managed>true</managed></remote_management></general>
+  <software>
+    <applications><size>2</size><application><name>Safari</name></application><application><name>Xcode</name></application></applications>
+    <fonts><size>0</size></fonts>
+  </software>
+  <groups_accounts><computer_group_memberships><group>All</group><group>Laptops</group></computer_group_memberships></groups_accounts>
+  <extension_attributes><extension_attribute><id>1</id><value/></extension_attribute></extension_attributes>
+</computer>"""
+
+
+def test_iter_records_skips_size_and_yields_dicts():
+    assert list(iter_records(LIST_XML)) == [{"id": "1", "name": "mac-1"}, {"id": "2", "name": "mac-2"}]
+
+
+def test_iter_xml_converts_like_classic_json():
+    sections = dict(iter_xml(DETAIL_XML))
+    assert sections["general"] == {"id": "7", "name": "mac-7", "remote_management": {"managed": "true"}}
+    assert sections["software"] == {"applications": [{"name": "Safari"}, {"name": "Xcode"}], "fonts": []}
+    assert sections["groups_accounts"] == {"computer_group_memberships": ["All", "Laptops"]}
+    assert sections["extension_attributes"] == {"extension_attribute": {"id": "1", "value": ""}}
+
+
+@pytest.mark.parametrize("source", [LIST_XML, LIST_XML.encode(), io.BytesIO(LIST_XML.encode())])
+def test_accepts_str_bytes_and_files(source):
+    assert len(list(iter_records(source))) == 2
+
+
+def test_reads_a_response_body():
+    resp = make_response()
+    resp._content = LIST_XML.encode()  # pylint: disable=protected-access
+    assert [r["id"] for r in iter_records(resp)] == ["1", "2"]
+
+
+class CountingReader(io.BytesIO):
+    """BytesIO that remembers how far the parser has read."""
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.consumed = self.tell()  # pylint: disable=attribute-defined-outside-init
+        return data
+
+
+def test_first_record_arrives_before_the_body_is_read():
+    body = "<computers><size>20000</size>" + "".join(
+        f"<computer><id>{i}</id><name>mac-{i}</name></computer>" for i in range(20000)
+    ) + "</computers>"
+    reader = CountingReader(body.encode())
+
+    records = iter_records(reader)
+    assert next(records) == {"id": "0", "name": "mac-0"}
+    assert reader.consumed < len(body) // 4
+    assert sum(1 for _ in records) == 19999
+
+
+def test_malformed_xml_raises_parse_error():
+    with pytest.raises(ET.ParseError):
+        list(iter_records("<computers><computer></computers>"))
@@ -0,0 +1,129 @@
+"""Generates jamfpy/client/generated_records.py from the bundled api_schemas.
+
+Usage: python tools/generate_records.py   (run from the repo root after refreshing api_schemas/)
+"""
+import json
+import keyword
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET = ROOT / "jamfpy" / "client" / "generated_records.py"
+
+# (class name, schema file, schema name, path it describes)
+SPECS = [
+    ("ClassicComputer", "classic", "Computer", "/JSSResource/computers"),
+    ("ClassicMobileDevice", "classic", "MobileDevice", "/JSSResource/mobiledevices"),
+    ("ClassicPolicy", "classic", "Policy", "/JSSResource/policies"),
+    ("ProScript", "pro", "Script", "/api/v1/scripts"),
+    ("ProComputerInventory", "pro", "ComputerInventory", "/api/v1/computers-inventory"),
+    ("ProMobileDevice", "pro", "MobileDeviceV2", "/api/v2/mobile-devices"),
+]
+
+# classic.json only defines path parameters (serialnumber, macaddress...), not payloads, so the
+# Classic fields are the keys of the real list records (/computers/subset/basic for computers).
+# Detail bodies nest the same keys under "general", where the records read them from.
+CLASSIC_FIELDS = {
+    "ClassicComputer": ("id", "name", "managed", "username", "model", "department", "building", "mac_address",
+                        "udid", "serial_number", "report_date_utc", "report_date_epoch"),
+    "ClassicMobileDevice": ("id", "name", "device_name", "udid", "serial_number", "phone_number",
+                            "wifi_mac_address", "managed", "supervised", "model", "model_identifier",
+                            "modelDisplay", "username"),
+    "ClassicPolicy": ("id", "name"),
+}
+CLASSIC_DETAIL_SECTION = "general"
+
+# Sections of Classic detail records, which classic.json does not describe either.
+CLASSIC_SECTIONS = {
+    "ClassicComputer": ("general", "location", "purchasing", "peripherals", "hardware", "certificates", "security",
+                        "software", "extension_attributes", "groups_accounts", "iphones", "configuration_profiles"),
+    "ClassicMobileDevice": ("general", "location", "purchasing", "applications", "security_object", "network",
+                            "certificates", "configuration_profiles", "provisioning_profiles",
+                            "mobile_device_groups", "extension_attributes"),
+    "ClassicPolicy": ("general", "scope", "self_service", "package_configuration", "scripts", "printers",
+                      "dock_items", "account_maintenance", "reboot", "maintenance", "files_processes",
+                      "user_interaction", "disk_encryption"),
+}
+
+
+def load_schemas() -> dict:
+    """Both schema documents; classic.json carries trailing commas, which are stripped first"""
+    classic = (ROOT / "api_schemas" / "classic.json").read_text(encoding="utf-8")
+    return {
+        "classic": json.loads(re.sub(r",(\s*[}\]])", r"\1", classic))["definitions"],
+        "pro": json.loads((ROOT / "api_schemas" / "pro.json").read_text(encoding="utf-8"))["components"]["schemas"],
+    }
+
+
+def attribute_name(key: str) -> str:
+    """snake_case attribute for a JSON key: categoryId -> category_id, parameter4 -> parameter4"""
+    name = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", key).lower()
+    name = re.sub(r"\W", "_", name)
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def is_section(prop: dict, schemas: dict) -> bool:
+    """True for objects and arrays (kept packed), False for scalars and enums (slotted)"""
+    if "$ref" in prop:
+        target = schemas[prop["$ref"].rsplit("/", 1)[-1]]
+        return "properties" in target or target.get("type") in ("object", "array") or "allOf" in target
+    return "allOf" in prop or prop.get("type") in ("object", "array")
+
+
+def render_tuple(name: str, items: list[str]) -> str:
+    """A class-level tuple assignment, one item per line"""
+    if not items:
+        return f"    {name} = ()"
+    return "\n".join([f"    {name} = (", *(f"        {item}," for item in items), "    )"])
+
+
+def render_class(class_name: str, source: str, schema_name: str, path: str, schemas: dict) -> str:
+    """Source of one Record subclass"""
+    if source == "classic":
+        if schema_name not in schemas[source]:
+            raise KeyError(f"{schema_name} is no longer in classic.json")
+        fields = [(attribute_name(key), key) for key in CLASSIC_FIELDS[class_name]]
+        sections = list(CLASSIC_SECTIONS[class_name])
+        described = f"{source}.json ``{schema_name}``, fields hand-listed in tools/generate_records.py"
+    else:
+        fields, sections = [], []
+        for key, prop in schemas[source][schema_name].get("properties", {}).items():
+            if is_section(prop, schemas[source]):
+                sections.append(key)
+            else:
+                fields.append((attribute_name(key), key))
+        described = f"{source}.json ``{schema_name}``"
+
+    lines = [
+        f"class {class_name}(Record):",
+        f'    """``{path}`` record ({described})"""',
+        "",
+        render_tuple("__slots__", [f'"{attribute}"' for attribute, _ in fields]),
+        render_tuple("_fields", [f'("{attribute}", "{key}")' for attribute, key in fields]),
+        render_tuple("_sections", [f'("{attribute_name(key)}", "{key}")' for key in sections]),
+    ]
+    if source == "classic":
+        lines.append(f'    _detail_section = "{CLASSIC_DETAIL_SECTION}"')
+    return "\n".join(lines)
+
+
+def render(schemas: dict) -> str:
+    """Source of the whole generated module"""
+    header = [
+        '"""Record classes generated from api_schemas by tools/generate_records.py; do not edit."""',
+        "# pylint: disable=too-many-instance-attributes,too-many-lines",
+        "",
+        "from .records import Record",
+    ]
+    classes = [render_class(*spec, schemas) for spec in SPECS]
+    return "\n".join(header) + "\n\n\n" + "\n\n\n".join(classes) + "\n"
+
+
+def main() -> None:
+    """Writes the generated module"""
+    TARGET.write_text(render(load_schemas()), encoding="utf-8")
+    print(f"wrote {TARGET.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()